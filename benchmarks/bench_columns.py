@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Orders flat file loaded as `FlatFileWrapper` row tuples, as lists per column converted afterwards and
+as the typed arrays of `FlatFileWrapper.to_numpy`: time to load, time to sum the revenue per SKU, memory
+held by the result and peak memory while loading (measured in a forked process).
+
+usage: python benchmarks/bench_columns.py [rows]
+"""
+import os
+import sys
+import time
+import resource
+import multiprocessing
+from collections import defaultdict
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from mws.parsers.reports import FlatFileWrapper, columns
+from bench_flatfile import report, REPORT_TYPE, HEADERS
+
+SKU = HEADERS.index('sku')
+PRICE = HEADERS.index('item-price')
+QUANTITY = HEADERS.index('quantity')
+
+
+def load_rows(contents):
+    return list(FlatFileWrapper(contents, convert_numerical=True, report_type=REPORT_TYPE))
+
+
+def load_lists(contents):
+    # Every cell as a python value first, then converted.
+    wrapper = FlatFileWrapper(contents, convert_numerical=True, report_type=REPORT_TYPE)
+    values = wrapper.to_columns()
+    return columns.to_arrays(values, wrapper.types)
+
+
+def load_arrays(contents):
+    return FlatFileWrapper(contents, convert_numerical=True, report_type=REPORT_TYPE).to_numpy()
+
+
+def peak_memory(load, contents):
+    """
+    Return the growth of the peak resident memory of a forked process while it runs `load`, in bytes.
+    """
+    def run(queue):
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        load(contents)
+        queue.put(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before)
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run, args=(queue,))
+    process.start()
+    growth = queue.get()
+    process.join()
+    # ru_maxrss is in kilobytes on linux.
+    return growth * 1024
+
+
+def revenue_rows(rows):
+    revenue = defaultdict(float)
+    for row in rows:
+        revenue[row[SKU]] += row[PRICE] * row[QUANTITY]
+    return revenue
+
+
+def revenue_arrays(columns):
+    skus = columns['sku']
+    totals = numpy.bincount(skus.codes, weights=columns['item-price'] * columns['quantity'])
+    return dict(zip(skus.categories, totals))
+
+
+def rows_size(rows):
+    # Distinct objects only, equal cells are often the same object.
+    objects = dict((id(x), x) for row in rows for x in row if x is not None)
+    return sum(sys.getsizeof(x) for x in rows) + sum(sys.getsizeof(x) for x in objects.values())
+
+
+def arrays_size(columns):
+    total = 0
+    for column in columns.values():
+        if hasattr(column, 'codes'):
+            total += column.codes.nbytes + sum(sys.getsizeof(x) for x in column.categories)
+        elif column.dtype == object:
+            total += column.nbytes + sum(sys.getsizeof(x) for x in column if x is not None)
+        else:
+            total += column.nbytes
+    return total
+
+
+def timed(function, *args):
+    start = time.time()
+    result = function(*args)
+    return time.time() - start, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    contents = report(count)
+    results = []
+    for name, load, aggregate, size in (('row tuples', load_rows, revenue_rows, rows_size),
+                                        ('lists, arrays', load_lists, revenue_arrays, arrays_size),
+                                        ('numpy columns', load_arrays, revenue_arrays, arrays_size)):
+        peak = peak_memory(load, contents)
+        load_time, data = timed(load, contents)
+        aggregate_time, result = timed(aggregate, data)
+        results.append(result)
+        print '%-14s load %6.2fs  revenue per sku %8.4fs  held ~%6.1f MB  peak +%6.1f MB' % (
+            name, load_time, aggregate_time, size(data) / 1e6, peak / 1e6)
+        del data
+    for result in results[1:]:
+        assert sorted(results[0]) == sorted(result)
+        assert all(abs(results[0][x] - result[x]) < 1e-6 for x in results[0])
+
+
+if __name__ == '__main__':
+    main()
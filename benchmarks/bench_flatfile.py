@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Rows per second of `FlatFileWrapper` on an orders flat file: guessing the type of every cell (what it
+used to do), converters inferred once per column and converters from the report type's schema.
+
+usage: python benchmarks/bench_flatfile.py [rows]
+"""
+import datetime
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from mws.parsers.reports import FlatFileWrapper
+from dateutil import parser
+
+REPORT_TYPE = '_GET_FLAT_FILE_ALL_ORDERS_DATA_BY_ORDER_DATE_'
+HEADERS = ('amazon-order-id', 'merchant-order-id', 'purchase-date', 'last-updated-date', 'order-status',
+           'fulfillment-channel', 'sales-channel', 'product-name', 'sku', 'asin', 'item-status', 'quantity',
+           'currency', 'item-price', 'item-tax', 'shipping-price', 'ship-city', 'ship-state', 'ship-postal-code',
+           'ship-country')
+START = datetime.datetime(2016, 9, 13)
+
+
+def report(rows):
+    lines = ['\t'.join(HEADERS)]
+    for i in xrange(rows):
+        purchase_date = START + datetime.timedelta(seconds=i * 7)
+        last_updated = START + datetime.timedelta(minutes=i // 500)
+        lines.append('\t'.join((
+            '112-%07d-4476148' % i, '', purchase_date.strftime('%Y-%m-%dT%H:%M:%S+00:00'),
+            last_updated.strftime('%Y-%m-%dT%H:%M:%S+00:00'), 'Shipped', 'Amazon', 'Amazon.com',
+            'Acme Mixing Bowl %d' % (i % 300), 'SKU-%06d' % (i % 5000), 'B00%07d' % (i % 5000), 'Shipped',
+            str(i % 3 + 1), 'USD', '%d.99' % (i % 100), '%d.25' % (i % 10), '4.99', 'BOSTON', 'MA',
+            '02108', 'US')))
+    return '\n'.join(lines) + '\n'
+
+
+def per_cell(contents):
+    # FlatFileWrapper.convert_text and lines as they used to be.
+    def offset_dt(dt):
+        offset = datetime.datetime.utcnow() - datetime.datetime.now()
+        seconds_offset = round(offset.total_seconds()) / 60
+        return dt - datetime.timedelta(seconds=seconds_offset)
+
+    def convert_text(t):
+        if re.search('\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\+\d{2}:\d{2})?', t):
+            return offset_dt(parser.parse(t))
+        if re.search('^\d+\.\d+$', t):
+            return float(t)
+        if re.search('^\d+$', t):
+            return int(t)
+        if not t:
+            return None
+        return t
+
+    for line in contents.split('\n')[1:]:
+        yield tuple(convert_text(x.strip()) for x in line.split('\t'))
+
+
+def main(rows=200000):
+    # Inferred columns convert every cell like the per cell conversion, ie. numbers and dates after text.
+    mixed = 'a\tb\tc\nfoo\tabc\t1.5\n5\t2016-01-01T00:00:00Z\t2\n\t\t\nbar\tx\t3.5\n'
+    assert list(FlatFileWrapper(mixed, convert_numerical=True)) == list(per_cell(mixed))[:-1]
+    # A report given as unicode, with or without a byte order mark, reads like the same bytes.
+    sample = report(100)
+    expected = list(FlatFileWrapper(sample, convert_numerical=True))
+    for contents in (sample.decode('utf-8'), u'\ufeff' + sample.decode('utf-8')):
+        assert list(FlatFileWrapper(contents, convert_numerical=True)) == expected
+    contents = report(rows)
+    results = []
+    for label, make_rows in (
+            ('per cell', lambda: per_cell(contents)),
+            ('per column', lambda: FlatFileWrapper(contents, convert_numerical=True)),
+            ('schema', lambda: FlatFileWrapper(contents, convert_numerical=True, report_type=REPORT_TYPE))):
+        start = time.time()
+        for _ in make_rows():
+            pass
+        results.append(rows / (time.time() - start))
+        print '%-12s %10.0f rows/s' % (label, results[-1])
+    print 'speedup: %.1fx per column, %.1fx schema' % (results[1] / results[0], results[2] / results[0])
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
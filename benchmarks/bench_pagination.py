@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Time to pull and process a ListOrders history page by page versus with background prefetching.
+
+The local stub server answers every page after `latency` seconds with 100 orders and a NextToken, and
+the consumer reads every field of every order. Throttling is disabled so only the round trips and
+the processing are measured.
+
+usage: python benchmarks/bench_pagination.py [pages] [latency_ms] [prefetch]
+"""
+import os
+import sys
+import time
+from itertools import islice
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from mws import Orders, SessionPool, RequestScheduler
+from mws.parsers.base import cached_property
+from mws.parsers.orders.listorders import Order
+from stub_server import StubServer
+import fixtures
+
+ORDERS_PER_PAGE = 100
+FIELDS = sorted(k for k, v in vars(Order).items() if isinstance(v, cached_property) and not k.startswith('_'))
+
+
+def pull(api, pages, prefetch):
+    start = time.time()
+    for order in islice(api.iter_orders(['ATVPDKIKX0DER'], prefetch=prefetch), pages * ORDERS_PER_PAGE):
+        for field in FIELDS:
+            getattr(order, field)
+    return time.time() - start
+
+
+def main(pages=20, latency_ms=100, prefetch=2):
+    with StubServer(body=fixtures.list_orders(ORDERS_PER_PAGE), latency=latency_ms / 1000.0) as server:
+        pool = SessionPool()
+        api = Orders('access_key', 'secret_key', 'account_id', domain=server.domain, session_pool=pool,
+                     scheduler=RequestScheduler(quotas={}))
+        results = []
+        for label, depth in (('sequential', 0), ('prefetch=%d' % prefetch, prefetch)):
+            results.append(pull(api, pages, depth))
+            print '%-12s %8.3f s  (%.1f ms/page)' % (label, results[-1], results[-1] / pages * 1000)
+        pool.close()
+    print 'speedup: %.1fx' % (results[0] / results[1])
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
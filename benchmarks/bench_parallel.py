@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Scaling of `FlatFileWrapper.parallel` on an orders flat file from 1 core to all of them, for rows and for
+numpy column chunks, next to `FlatFileWrapper.stream` on a single core.
+
+The speedup depends on having several cores: with more processes than cores the ranges are only parsed
+one after the other, plus the cost of the pool and of pickling the results, so it's below 1x (ie. 0.6x on a
+single core machine).
+
+usage: python benchmarks/bench_parallel.py [rows] [max processes]
+"""
+import os
+import sys
+import tempfile
+import time
+from multiprocessing import cpu_count
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from mws.parsers.reports import FlatFileWrapper
+from bench_flatfile import report, REPORT_TYPE
+
+
+def timed(function):
+    start = time.time()
+    count = function()
+    return time.time() - start, count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400000
+    max_processes = int(sys.argv[2]) if len(sys.argv) > 2 else cpu_count()
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(report(count))
+        print '%d rows, %.1f MB, %d cores' % (count, os.path.getsize(path) / 1e6, cpu_count())
+
+        elapsed, rows = timed(lambda: sum(1 for _ in FlatFileWrapper.stream(
+            path, convert_numerical=True, report_type=REPORT_TYPE)))
+        assert rows == count
+        print '%-22s %8.2fs %10.0f rows/s' % ('stream', elapsed, count / elapsed)
+
+        processes = 1
+        while True:
+            report_file = FlatFileWrapper.parallel(path, processes, convert_numerical=True, report_type=REPORT_TYPE)
+            elapsed, rows = timed(lambda: sum(1 for _ in report_file))
+            assert rows == count
+            base = elapsed if processes == 1 else base
+            numpy_elapsed, rows = timed(lambda: sum(len(x['sku']) for x in report_file.column_chunks(numpy=True)))
+            assert rows == count
+            print '%-22s %8.2fs %10.0f rows/s  x%.1f   numpy chunks %6.2fs' % (
+                'parallel %d processes' % processes, elapsed, count / elapsed, base / elapsed, numpy_elapsed)
+            if processes >= max_processes:
+                break
+            processes = min(processes * 2, max_processes)
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+CPU cost of handling one ListOrders page of 100 orders: parsing the body three times (error check,
+dict view, typed parser) versus parsing it once and sharing the tree.
+
+usage: python benchmarks/bench_response_parse.py [iterations]
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from lxml import etree
+
+from mws import utils
+from mws._mws import DictWrapper, remove_namespace
+from mws.parsers import ErrorResponse, ListOrdersResponse
+import fixtures
+
+BODY = fixtures.list_orders(100)
+
+
+def three_parses():
+    # What make_request and ListOrdersResponse.request used to do.
+    err = etree.fromstring(re.sub('\s+xmlns=\".*?\"', '', BODY))
+    if err.xpath('//ErrorResponse/Error/Message/text()'):
+        raise ErrorResponse(err)
+    d = utils.xml2dict().fromstring(remove_namespace(BODY))
+    page = ListOrdersResponse.load(BODY)
+    return d, page.orders
+
+
+def single_parse():
+    tree = etree.fromstring(BODY)
+    if etree.QName(tree).localname == 'ErrorResponse':
+        raise ErrorResponse(tree)
+    response = DictWrapper(BODY, 'ListOrdersResult', tree=tree)
+    page = ListOrdersResponse.from_response(response)
+    return response.parsed, page.orders
+
+
+def main(iterations=200):
+    before = min(timeit.repeat(three_parses, number=iterations, repeat=3)) / iterations * 1000
+    after = min(timeit.repeat(single_parse, number=iterations, repeat=3)) / iterations * 1000
+    print '%-20s %8.3f ms/page' % ('three parses', before)
+    print '%-20s %8.3f ms/page' % ('single parse', after)
+    print 'saved: %.1f%%' % ((before - after) / before * 100)
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Per-call latency of `MWS.make_request` with and without pooled keep-alive sessions.
+
+Runs against a local HTTPS stand-in so the numbers only reflect connection setup and request overhead.
+
+usage: python benchmarks/bench_sessions.py [calls]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from mws import Orders, SessionPool
+from stub_server import StubServer
+
+
+def per_call_latency(api, calls):
+    api.get_service_status()  # warm up, the first call always pays for the handshake.
+    start = time.time()
+    for _ in xrange(calls):
+        api.get_service_status()
+    return (time.time() - start) / calls * 1000
+
+
+def main(calls=500):
+    with StubServer(https=True) as server:
+        results = []
+        for label, keep_alive in (('new connection per call', False), ('pooled keep-alive', True)):
+            pool = SessionPool(keep_alive=keep_alive, verify=server.certfile)
+            api = Orders('access_key', 'secret_key', 'account_id', domain=server.domain, session_pool=pool)
+            results.append((label, per_call_latency(api, calls)))
+            pool.close()
+    for label, ms in results:
+        print '%-25s %8.3f ms/call' % (label, ms)
+    print 'speedup: %.1fx' % (results[0][1] / results[1][1])
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Time to convert a million report cells with `FlatFileWrapper` using `dateutil.parser.parse` versus
+`utils.parse_timestamp` for the timestamp cells.
+
+The report mimics an orders flat file: 10 columns, two of them timestamps. Purchase dates are
+(nearly) unique while the last updated dates repeat in batches, like they do in real reports.
+
+usage: python benchmarks/bench_timestamps.py [rows]
+"""
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from dateutil import parser
+
+from mws import utils
+from mws.parsers.reports import requestreport
+
+HEADERS = ('amazon-order-id', 'merchant-order-id', 'purchase-date', 'last-updated-date', 'order-status',
+           'sku', 'quantity', 'item-price', 'currency', 'ship-city')
+START = datetime.datetime(2016, 9, 13)
+
+
+def report(rows):
+    lines = ['\t'.join(HEADERS)]
+    for i in xrange(rows):
+        purchase_date = START + datetime.timedelta(seconds=i * 7)
+        last_updated = START + datetime.timedelta(minutes=i // 500)
+        lines.append('\t'.join((
+            '112-%07d-4476148' % i, '', purchase_date.strftime('%Y-%m-%dT%H:%M:%S+00:00'),
+            last_updated.strftime('%Y-%m-%dT%H:%M:%S+00:00'), 'Shipped', 'SKU-%06d' % (i % 5000),
+            str(i % 3 + 1), '%d.99' % (i % 100), 'USD', 'BOSTON')))
+    return '\n'.join(lines)
+
+
+def convert(contents):
+    start = time.time()
+    for _ in requestreport.FlatFileWrapper(contents, convert_numerical=True):
+        pass
+    return time.time() - start
+
+
+def main(rows=100000):
+    contents = report(rows)
+    cells = rows * len(HEADERS)
+    results = []
+    for label, parse in (('dateutil', parser.parse), ('parse_timestamp', utils.parse_timestamp)):
+        requestreport.parse_timestamp = parse
+        try:
+            results.append(convert(contents))
+        finally:
+            requestreport.parse_timestamp = utils.parse_timestamp
+        print '%-16s %8.3f s  (%.2f us/cell)' % (label, results[-1], results[-1] / cells * 1e6)
+    print '%d cells, speedup: %.1fx' % (cells, results[0] / results[1])
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Dict view conversion time of `utils.xml2dict` versus `utils.lxml2dict` on real-sized response pages.
+
+Both convert the same already parsed tree so only the conversion itself is measured.
+
+usage: python benchmarks/bench_xml2dict.py [iterations]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from lxml import etree
+
+from mws import utils
+import fixtures
+
+PAYLOADS = (
+    ('ListOrders (100 orders)', fixtures.list_orders(100)),
+    ('GetMatchingProductForId (5 ids)', fixtures.get_matching_product_for_id(5)),
+    ('ListInventorySupply (50 skus)', fixtures.list_inventory_supply(50)),
+)
+
+
+def main(iterations=200):
+    for label, body in PAYLOADS:
+        tree = etree.fromstring(body)
+        assert utils.xml2dict(strip_namespaces=True).fromtree(tree) == utils.lxml2dict().fromtree(tree)
+        print label
+        results = []
+        for converter in (utils.xml2dict, utils.lxml2dict):
+            seconds = min(timeit.repeat(lambda: converter(strip_namespaces=True).fromtree(tree),
+                                        number=iterations, repeat=3))
+            results.append(seconds / iterations * 1000)
+            print '    %-10s %8.3f ms' % (converter.__name__, results[-1])
+        print '    speedup: %.1fx' % (results[0] / results[1])
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""
+Time to read every field of 10k orders with the xpath expressions compiled once per class versus
+compiled again on every property access, and to read them all again once they are memoized.
+
+usage: python benchmarks/bench_xpath.py [orders] [repeat]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from mws.parsers.base import BaseElementWrapper, cached_property
+from mws.parsers.orders.listorders import ListOrdersResponse, Order
+import fixtures
+
+FIELDS = sorted(k for k, v in vars(Order).items() if isinstance(v, cached_property) and not k.startswith('_'))
+
+
+def uncompiled_xpath(self, path, element=None):
+    # What every property used to do: `self.element.xpath(path, namespaces=namespaces)`.
+    return (self.element if element is None else element).xpath(path, namespaces=self.namespaces)
+
+
+def read_all(orders):
+    for order in orders:
+        order.invalidate()
+        for field in FIELDS:
+            getattr(order, field)
+
+
+def reread_all(orders):
+    for order in orders:
+        for field in FIELDS:
+            getattr(order, field)
+
+
+def main(count=10000, repeat=1):
+    orders = ListOrdersResponse.load(fixtures.list_orders(count)).orders
+    compiled_xpath = BaseElementWrapper.xpath
+    results = []
+    for label, method in (('uncompiled', uncompiled_xpath), ('compiled', compiled_xpath)):
+        BaseElementWrapper.xpath = method
+        try:
+            seconds = min(timeit.repeat(lambda: read_all(orders), number=1, repeat=repeat))
+        finally:
+            BaseElementWrapper.xpath = compiled_xpath
+        results.append(seconds)
+        print '%-12s %8.3f s  (%.2f us/field)' % (label, seconds, seconds / (count * len(FIELDS)) * 1e6)
+    print '%d orders x %d fields, speedup: %.1fx' % (count, len(FIELDS), results[0] / results[1])
+    seconds = min(timeit.repeat(lambda: reread_all(orders), number=1, repeat=repeat))
+    print '%-12s %8.3f s  (%.2f us/field)' % ('memoized', seconds, seconds / (count * len(FIELDS)) * 1e6)
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
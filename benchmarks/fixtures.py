@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Realistically sized MWS response bodies for the benchmarks.
+"""
+
+ORDER = """    <Order>
+      <LatestShipDate>2016-09-15T06:59:59Z</LatestShipDate>
+      <OrderType>StandardOrder</OrderType>
+      <PurchaseDate>2016-09-13T{hour:02d}:{minute:02d}:13Z</PurchaseDate>
+      <BuyerEmail>buyer{index}@marketplace.amazon.com</BuyerEmail>
+      <AmazonOrderId>112-{index:07d}-4476148</AmazonOrderId>
+      <LastUpdateDate>2016-09-13T22:21:47Z</LastUpdateDate>
+      <IsReplacementOrder>false</IsReplacementOrder>
+      <NumberOfItemsShipped>0</NumberOfItemsShipped>
+      <ShipServiceLevel>Std US D2D Dom</ShipServiceLevel>
+      <OrderStatus>Unshipped</OrderStatus>
+      <SalesChannel>Amazon.com</SalesChannel>
+      <IsBusinessOrder>false</IsBusinessOrder>
+      <NumberOfItemsUnshipped>1</NumberOfItemsUnshipped>
+      <PaymentMethodDetails>
+        <PaymentMethodDetail>Standard</PaymentMethodDetail>
+      </PaymentMethodDetails>
+      <BuyerName>Jane Doe {index}</BuyerName>
+      <OrderTotal>
+        <CurrencyCode>USD</CurrencyCode>
+        <Amount>{index}.99</Amount>
+      </OrderTotal>
+      <IsPremiumOrder>false</IsPremiumOrder>
+      <EarliestShipDate>2016-09-14T07:00:00Z</EarliestShipDate>
+      <MarketplaceId>ATVPDKIKX0DER</MarketplaceId>
+      <FulfillmentChannel>MFN</FulfillmentChannel>
+      <PaymentMethod>Other</PaymentMethod>
+      <ShippingAddress>
+        <City>BOSTON</City>
+        <AddressType>Residential</AddressType>
+        <PostalCode>02108-1234</PostalCode>
+        <StateOrRegion>Massachusetts</StateOrRegion>
+        <Phone>555-555-{index:04d}</Phone>
+        <CountryCode>US</CountryCode>
+        <Name>Jane Doe</Name>
+        <AddressLine1>{index} Main St</AddressLine1>
+        <AddressLine2>Apt {index}</AddressLine2>
+      </ShippingAddress>
+      <IsPrime>false</IsPrime>
+      <ShipmentServiceLevelCategory>Standard</ShipmentServiceLevelCategory>
+      <SellerOrderId>112-{index:07d}-4476148</SellerOrderId>
+    </Order>
+"""
+
+LIST_ORDERS = """<?xml version="1.0"?>
+<ListOrdersResponse xmlns="https://mws.amazonservices.com/Orders/2013-09-01">
+  <ListOrdersResult>
+    <Orders>
+{orders}    </Orders>
+    <NextToken>2YgYW55IGNhcm5hbCBwbGVhc3VyZS4=</NextToken>
+    <CreatedBefore>2016-09-13T22:44:11Z</CreatedBefore>
+  </ListOrdersResult>
+  <ResponseMetadata>
+    <RequestId>88faca76-b600-46d2-b53c-0c8c4533e43a</RequestId>
+  </ResponseMetadata>
+</ListOrdersResponse>
+"""
+
+PRODUCT = """  <GetMatchingProductForIdResult Id="0{index:011d}" IdType="UPC" status="Success">
+    <Products>
+      <Product>
+        <Identifiers>
+          <MarketplaceASIN>
+            <MarketplaceId>ATVPDKIKX0DER</MarketplaceId>
+            <ASIN>B00{index:07d}</ASIN>
+          </MarketplaceASIN>
+        </Identifiers>
+        <AttributeSets>
+          <ns2:ItemAttributes xml:lang="en-US">
+            <ns2:Binding>Kitchen</ns2:Binding>
+            <ns2:Brand>Acme</ns2:Brand>
+            <ns2:Color>Red</ns2:Color>
+            <ns2:Feature>Dishwasher safe</ns2:Feature>
+            <ns2:Feature>BPA free</ns2:Feature>
+            <ns2:ItemDimensions>
+              <ns2:Height Units="inches">3.50</ns2:Height>
+              <ns2:Length Units="inches">9.00</ns2:Length>
+              <ns2:Width Units="inches">9.00</ns2:Width>
+            </ns2:ItemDimensions>
+            <ns2:Label>Acme</ns2:Label>
+            <ns2:ListPrice>
+              <ns2:Amount>24.99</ns2:Amount>
+              <ns2:CurrencyCode>USD</ns2:CurrencyCode>
+            </ns2:ListPrice>
+            <ns2:Model>AC-{index}</ns2:Model>
+            <ns2:PackageDimensions>
+              <ns2:Height Units="inches">3.70</ns2:Height>
+              <ns2:Length Units="inches">9.40</ns2:Length>
+              <ns2:Width Units="inches">9.30</ns2:Width>
+              <ns2:Weight Units="pounds">1.50</ns2:Weight>
+            </ns2:PackageDimensions>
+            <ns2:PartNumber>AC-{index}</ns2:PartNumber>
+            <ns2:ProductGroup>Kitchen</ns2:ProductGroup>
+            <ns2:ProductTypeName>KITCHEN</ns2:ProductTypeName>
+            <ns2:Publisher>Acme</ns2:Publisher>
+            <ns2:SmallImage>
+              <ns2:URL>http://ecx.images-amazon.com/images/I/41{index}.jpg</ns2:URL>
+              <ns2:Height Units="pixels">75</ns2:Height>
+              <ns2:Width Units="pixels">75</ns2:Width>
+            </ns2:SmallImage>
+            <ns2:Studio>Acme</ns2:Studio>
+            <ns2:Title>Acme Mixing Bowl {index}</ns2:Title>
+          </ns2:ItemAttributes>
+        </AttributeSets>
+        <Relationships/>
+        <SalesRankings>
+          <SalesRank>
+            <ProductCategoryId>home_garden_display_on_website</ProductCategoryId>
+            <Rank>{index}</Rank>
+          </SalesRank>
+          <SalesRank>
+            <ProductCategoryId>289668</ProductCategoryId>
+            <Rank>{index}</Rank>
+          </SalesRank>
+        </SalesRankings>
+      </Product>
+    </Products>
+  </GetMatchingProductForIdResult>
+"""
+
+GET_MATCHING_PRODUCT_FOR_ID = """<?xml version="1.0"?>
+<GetMatchingProductForIdResponse xmlns="http://mws.amazonservices.com/schema/Products/2011-10-01" xmlns:ns2="http://mws.amazonservices.com/schema/Products/2011-10-01/default.xsd">
+{products}  <ResponseMetadata>
+    <RequestId>e5ae8e41-8a3d-4d2b-a2c1-6e13a02e8c5c</RequestId>
+  </ResponseMetadata>
+</GetMatchingProductForIdResponse>
+"""
+
+INVENTORY_MEMBER = """      <member>
+        <SellerSKU>SKU-{index:06d}</SellerSKU>
+        <ASIN>B00{index:07d}</ASIN>
+        <TotalSupplyQuantity>{index}</TotalSupplyQuantity>
+        <FNSKU>X00{index:07d}</FNSKU>
+        <Condition>NewItem</Condition>
+        <SupplyDetail/>
+        <InStockSupplyQuantity>{index}</InStockSupplyQuantity>
+        <EarliestAvailability>
+          <TimepointType>Immediately</TimepointType>
+        </EarliestAvailability>
+      </member>
+"""
+
+LIST_INVENTORY_SUPPLY = """<?xml version="1.0"?>
+<ListInventorySupplyResponse xmlns="http://mws.amazonaws.com/FulfillmentInventory/2010-10-01/">
+  <ListInventorySupplyResult>
+    <InventorySupplyList>
+{members}    </InventorySupplyList>
+    <MarketplaceId>ATVPDKIKX0DER</MarketplaceId>
+    <NextToken>AAAAAAAAAACQ+2+h3q4sWlaJZbVs3ZOcAAAAAA==</NextToken>
+  </ListInventorySupplyResult>
+  <ResponseMetadata>
+    <RequestId>e8698ffa-8e59-11df-9acb-230ae7a8b736</RequestId>
+  </ResponseMetadata>
+</ListInventorySupplyResponse>
+"""
+
+
+def list_orders(count=100):
+    orders = ''.join(ORDER.format(index=i, hour=i % 24, minute=i % 60) for i in xrange(count))
+    return LIST_ORDERS.format(orders=orders)
+
+
+def get_matching_product_for_id(count=5):
+    return GET_MATCHING_PRODUCT_FOR_ID.format(products=''.join(PRODUCT.format(index=i) for i in xrange(count)))
+
+
+def list_inventory_supply(count=50):
+    return LIST_INVENTORY_SUPPLY.format(members=''.join(INVENTORY_MEMBER.format(index=i) for i in xrange(count)))
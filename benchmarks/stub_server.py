@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Local stand-in for the MWS endpoints used by the benchmarks.
+
+Serves a canned XML body for every request over HTTP/1.1 (keep-alive capable), optionally over
+HTTPS with a throwaway self signed certificate generated with the `openssl` command line tool.
+"""
+import os
+import ssl
+import shutil
+import tempfile
+import threading
+import subprocess
+from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from SocketServer import ThreadingMixIn
+
+SERVICE_STATUS = """<?xml version="1.0"?>
+<GetServiceStatusResponse xmlns="https://mws.amazonservices.com/Orders/2013-09-01">
+  <GetServiceStatusResult>
+    <Status>GREEN</Status>
+    <Timestamp>2016-09-13T14:23:22.512Z</Timestamp>
+  </GetServiceStatusResult>
+  <ResponseMetadata>
+    <RequestId>d80c6c7b-f7c7-4fa7-bdd7-854711cb3bcc</RequestId>
+  </ResponseMetadata>
+</GetServiceStatusResponse>"""
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients closing the connection mid handshake are expected when keep-alive is disabled.
+        pass
+
+
+class StubServer(object):
+    """
+    Run a threaded server on localhost answering every request with `body`.
+
+    usage:
+
+    >>> with StubServer(https=True) as server:
+    >>>     print server.domain, server.certfile
+    """
+
+    def __init__(self, body=SERVICE_STATUS, https=False, latency=0.0):
+        self.body = body
+        self.https = https
+        self.latency = latency
+        self.certfile = None
+        self._tmpdir = None
+        self._server = None
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Buffer the status line, headers and body into a single write, otherwise Nagle's algorithm
+            # and delayed ACKs add ~40ms to every keep-alive response.
+            wbufsize = -1
+
+            def _respond(self):
+                length = int(self.headers.getheader('content-length') or 0)
+                if length:
+                    self.rfile.read(length)
+                if stub.latency:
+                    threading.Event().wait(stub.latency)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/xml')
+                self.send_header('Content-Length', str(len(stub.body)))
+                self.end_headers()
+                self.wfile.write(stub.body)
+
+            do_GET = _respond
+            do_POST = _respond
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _make_certificate(self):
+        self._tmpdir = tempfile.mkdtemp()
+        self.certfile = os.path.join(self._tmpdir, 'localhost.pem')
+        subprocess.check_call(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+             '-subj', '/CN=localhost', '-addext', 'subjectAltName=DNS:localhost',
+             '-keyout', self.certfile, '-out', self.certfile],
+            stdout=open(os.devnull, 'w'), stderr=subprocess.STDOUT)
+
+    @property
+    def domain(self):
+        scheme = 'https' if self.https else 'http'
+        return '%s://localhost:%d' % (scheme, self._server.server_address[1])
+
+    def __enter__(self):
+        self._server = _ThreadingHTTPServer(('localhost', 0), self._handler())
+        if self.https:
+            self._make_certificate()
+            self._server.socket = ssl.wrap_socket(self._server.socket, certfile=self.certfile, server_side=True)
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._tmpdir:
+            shutil.rmtree(self._tmpdir)
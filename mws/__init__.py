@@ -5,7 +5,13 @@ from _mws import InboundShipments, Inventory, Products, Feeds, Reports, \
     Orders, Sellers, Recommendations, OutboundShipments, MWSError
 from parsers.products import GetMatchingProductForIdResponse, GetCompetitivePricingForAsinResponse
 from parsers.fulfillment import ListInboundShipmentResponse, ListInboundShipmentItemsResponse, \
-    GetPrepInstructionsForASINResponse
+    GetPrepInstructionsForASINResponse, ListInventorySupplyResponse
 from parsers.orders import ListOrdersResponse, ListOrderItemsResponse
 from fulfillment_outbound_shipment import CreateFulfillmentOrder
 from parsers import RequestReportResponse
+from sessions import SessionPool
+from throttle import RequestScheduler
+from retry import RetryPolicy
+from pagination import Paginator
+from tracking import PollSchedule, ReportTracker, FeedTracker
+from pipeline import ReportPipeline, PipelineClosed
@@ -6,6 +6,7 @@
 #
 
 import urllib
+import functools
 import hashlib
 import hmac
 import base64
@@ -13,17 +14,17 @@ import logging
 import datetime
 import re
 
-
-try:
-    from xml.etree.ElementTree import ParseError as XMLError
-except ImportError:
-    from xml.parsers.expat import ExpatError as XMLError
 from time import strftime, gmtime
+from lxml import etree
 from lxml.etree import XMLSyntaxError
-from requests import request
 from requests.exceptions import HTTPError
 
 import utils
+from sessions import default_session_pool
+from throttle import default_scheduler, QuotaState
+from retry import default_retry_policy
+from pagination import Paginator, local_path
+from spool import SpooledFeed
 
 
 __all__ = [
@@ -89,15 +90,38 @@ def remove_namespace(xml):
 
 
 class DictWrapper(object):
-    def __init__(self, xml, rootkey=None):
+    """
+        XML response wrapper. The dict view in `parsed` is only built the first time it is accessed,
+        code which only reads `original` or hands the response to a typed parser never pays for it.
+    """
+    # Class building the dict view. utils.xml2dict is the original recursive implementation,
+    # utils.lxml2dict the faster iterative one. Both produce the same structure.
+    converter = utils.lxml2dict
+
+    def __init__(self, xml, rootkey=None, tree=None, converter=None):
+        """
+        :param xml: The response body.
+        :param rootkey: Key of the dict to return from `parsed`.
+        :param tree: The already parsed lxml tree of `xml`, if available. Saves parsing `xml` again.
+        :param converter: Overrides `DictWrapper.converter` for this instance.
+        """
         self.original = xml
+        self.tree = tree
         self._rootkey = rootkey
-        self._mydict = utils.xml2dict().fromstring(remove_namespace(xml))
-        self._response_dict = self._mydict.get(self._mydict.keys()[0],
-                                               self._mydict)
+        self._response_dict = None
+        if converter is not None:
+            self.converter = converter
+
+    def _build_dict(self):
+        if self.tree is None:
+            self.tree = etree.fromstring(self.original)
+        mydict = self.converter(strip_namespaces=True).fromtree(self.tree)
+        return mydict.get(mydict.keys()[0], mydict)
 
     @property
     def parsed(self):
+        if self._response_dict is None:
+            self._response_dict = self._build_dict()
         if self._rootkey:
             return self._response_dict.get(self._rootkey)
         else:
@@ -120,6 +144,62 @@ class DataWrapper(object):
         return self.original
 
 
+class StreamWrapper(object):
+    """
+        Wrapper of a streamed response body.
+        The body is hashed chunk by chunk while it's read and validated against the
+        Content-MD5 header sent by Amazon once it's exhausted, so it never has to be held in memory.
+    """
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, response):
+        self.response = response
+        self.bytes_read = 0
+        self._md5 = hashlib.md5()
+
+    def iter_content(self, chunk_size=CHUNK_SIZE):
+        """
+        Generator yielding the body in chunks of `chunk_size` bytes.
+        Raises MWSError after the last chunk if the body doesn't match its Content-MD5 header.
+        """
+        try:
+            for chunk in self.response.iter_content(chunk_size):
+                self._md5.update(chunk)
+                self.bytes_read += len(chunk)
+                yield chunk
+        finally:
+            self.close()
+        self.verify()
+
+    def __iter__(self):
+        return self.iter_content()
+
+    def verify(self):
+        if 'content-md5' in self.response.headers:
+            if self.response.headers['content-md5'] != base64.b64encode(self._md5.digest()):
+                raise MWSError("Wrong Contentlength, maybe amazon error...")
+
+    def write_to(self, sink, chunk_size=CHUNK_SIZE):
+        """
+        Write the body to `sink` in constant memory.
+
+        :param sink: Path of the file to write or any object with a `write` method.
+        :return: Number of bytes written.
+        """
+        if isinstance(sink, basestring):
+            with open(sink, 'wb') as f:
+                return self.write_to(f, chunk_size)
+        for chunk in self.iter_content(chunk_size):
+            sink.write(chunk)
+        return self.bytes_read
+
+    def close(self):
+        """
+        Release the connection back to the pool. Needed when the body isn't read to the end.
+        """
+        self.response.close()
+
+
 class MWS(object):
     """ Base Amazon API class """
 
@@ -147,7 +227,8 @@ class MWS(object):
     # Which is the name of the parameter for that specific account type.
     ACCOUNT_TYPE = "SellerId"
 
-    def __init__(self, access_key, secret_key, account_id, region='US', domain='', uri="", version="", auth_token=""):
+    def __init__(self, access_key, secret_key, account_id, region='US', domain='', uri="", version="", auth_token="",
+                 session_pool=None, scheduler=None, retry_policy=None):
         self.access_key = access_key
         self.secret_key = secret_key
         self.account_id = account_id
@@ -155,6 +236,15 @@ class MWS(object):
         self.version = version or self.VERSION
         self.uri = uri or self.URI
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Every instance shares the module level pool unless given its own, so connections are reused
+        # across api classes and across instances.
+        self.session_pool = session_pool or default_session_pool
+        # Throttling state is per seller and shared the same way, so separate instances don't
+        # spend the same quota twice.
+        self.scheduler = scheduler or default_scheduler
+        self.retry_policy = retry_policy or default_retry_policy
+        # Action: QuotaState of the last response which reported an hourly quota.
+        self.quotas = {}
 
         if domain:
             self.domain = domain
@@ -167,14 +257,55 @@ class MWS(object):
             }
             raise MWSError(error_msg)
 
+    @property
+    def session(self):
+        """
+            Returns the pooled session for this instance's endpoint.
+        """
+        return self.session_pool.get(self.domain)
+
     def make_request(self, extra_data, method="GET", **kwargs):
         """Make request to Amazon MWS API with these parameters
+
+        Throttled calls, and failed calls to idempotent operations, are retried according to `self.retry_policy`.
+
+        Pass `raw=True` to get a DataWrapper of the body back without any XML parsing of successful responses,
+        or `stream=True` to get a StreamWrapper which reads the body lazily.
+        """
+        action = extra_data.get('Action')
+        attempt = 0
+        while True:
+            try:
+                return self._make_request(extra_data, method, **kwargs)
+            except (MWSError, ValueError), e:
+                # ErrorResponse is a ValueError with a `code`, http errors are MWSError with a `response`.
+                code = getattr(e, 'code', None)
+                status_code = getattr(e.response, 'status_code', None) if isinstance(e, MWSError) else None
+                if code is None and status_code is None:
+                    raise
+                if code in self.retry_policy.throttled_codes:
+                    self.scheduler.throttled(self.account_id, action)
+                if not self.retry_policy.is_retryable(action, code, status_code):
+                    raise
+                if attempt >= self.retry_policy.max_retries:
+                    self.retry_policy.metrics.record_failure(action)
+                    raise
+                attempt += 1
+                self.retry_policy.wait(action, attempt)
+
+    def _make_request(self, extra_data, method="GET", **kwargs):
+        """
+            Sign and send a single request. Called by `make_request` once per attempt so that
+            every attempt is signed with a fresh timestamp.
         """
 
         # Remove all keys with an empty value because
         # Amazon's MWS does not allow such a thing.
         extra_data = remove_empty(extra_data)
 
+        # Wait for the operation's quota before signing, the timestamp has to be fresh when sent.
+        self.scheduler.acquire(self.account_id, extra_data.get('Action'))
+
         params = {
             'AWSAccessKeyId': self.access_key,
             self.ACCOUNT_TYPE: self.account_id,
@@ -204,33 +335,55 @@ class MWS(object):
 
         self.logger.debug('request_url: {}'.format(url))
 
+        body = kwargs.get('body', '')
+        if hasattr(body, 'seek'):
+            # Streamed bodies are read again from their start by every attempt.
+            body.seek(0)
+
         try:
             # Some might wonder as to why i don't pass the params dict as the params argument to request.
             # My answer is, here i have to get the url parsed string of params in order to sign it, so
             # if i pass the params dict as params to request, request will repeat that step because it will need
             # to convert the dict to a url parsed string, so why do it twice if i can just pass the full url :).
-            response = request(method, url, data=kwargs.get('body', ''), headers=headers, timeout=15)
+            # verify is passed explicitly since requests lets REQUESTS_CA_BUNDLE override `Session.verify`.
+            response = self.session.request(method, url, data=body, headers=headers, timeout=15,
+                                            verify=self.session_pool.verify, stream=kwargs.get('stream', False))
             self.logger.debug('response headers:\n    {}'.format('\n    '.join([' = '.join(x) for x in response.headers.items()])))
+            quota = self._update_quota(extra_data.get('Action'), response.headers)
 
-            try:
-                from parsers.errors import ErrorResponse
-                err = ErrorResponse.load(response.content)
-                if err.message:
-                    raise err
-            except XMLSyntaxError:
-                pass
+            if kwargs.get('stream') and response.status_code < 400:
+                parsed_response = StreamWrapper(response)
+                parsed_response.quota = quota
+                return parsed_response
 
-            response.raise_for_status()
             # When retrieving data from the response object,
             # be aware that response.content returns the content in bytes while response.text calls
             # response.content and converts it to unicode.
             data = response.content
 
+            # The body is parsed only once. The error check, the dict view and the typed parsers
+            # (through `BaseResponseMixin.from_response`) all work off this same tree.
             # I do not check the headers to decide which content structure to server simply because sometimes
             # Amazon's MWS API returns XML error responses with "text/plain" as the Content-Type.
-            try:
-                parsed_response = DictWrapper(data, extra_data.get("Action") + "Result")
-            except XMLError:
+            # In raw mode only error responses are parsed, amazon always sends those with a 4xx/5xx status.
+            tree = None
+            if response.status_code >= 400 or not kwargs.get('raw'):
+                try:
+                    tree = etree.fromstring(data)
+                except XMLSyntaxError:
+                    pass
+
+            if tree is not None and etree.QName(tree).localname == 'ErrorResponse':
+                from parsers.errors import ErrorResponse
+                err = ErrorResponse(tree)
+                if err.message:
+                    raise err
+
+            response.raise_for_status()
+
+            if tree is not None:
+                parsed_response = DictWrapper(data, extra_data.get("Action") + "Result", tree=tree)
+            else:
                 parsed_response = DataWrapper(data, response.headers)
 
         except HTTPError, e:
@@ -240,8 +393,20 @@ class MWS(object):
 
         # Store the response object in the parsed_response for quick access
         parsed_response.response = response
+        parsed_response.quota = quota
         return parsed_response
 
+    def _update_quota(self, action, headers):
+        """
+            Parse the x-mws-quota-* headers of a response, store them in `self.quotas`
+            and hand them to the scheduler so that it can pace the following calls.
+        """
+        quota = QuotaState.from_headers(headers)
+        if quota is not None:
+            self.quotas[action] = quota
+            self.scheduler.update_quota(self.account_id, action, quota)
+        return quota
+
     def get_service_status(self):
         """
             Returns a GREEN, GREEN_I, YELLOW or RED status.
@@ -274,6 +439,21 @@ class MWS(object):
         """
         return strftime("%Y-%m-%dT%H:%M:%SZ", gmtime())
 
+    def paginate(self, operation, next_operation, records, record_class, args, kwargs):
+        """
+        Return a Paginator of the records of `operation` and the pages following it.
+
+        :param operation: Api method requesting the first page, ie. `self.list_orders`.
+        :param next_operation: Its ByNextToken counterpart, ie. `self.list_orders_by_next_token`.
+        :param records: xpath of the records, see `Paginator`.
+        :param record_class: Parser class of the records or None.
+        :param args: Positional arguments of `operation`.
+        :param kwargs: Keyword arguments of `operation` and optionally `prefetch`.
+        """
+        prefetch = kwargs.pop('prefetch', 0)
+        return Paginator(functools.partial(operation, *args, **kwargs), next_operation, records, record_class,
+                         prefetch=prefetch)
+
     def enumerate_param(self, param, values):
         """
             Builds a dictionary of an enumerated parameter.
@@ -306,12 +486,15 @@ class Feeds(MWS):
         """
         Uploads a feed ( xml or .tsv ) to the seller's inventory.
         Can be used for creating/updating products on Amazon.
+
+        :param feed: The feed as a string, or a `mws.spool.SpooledFeed` to upload without holding it in memory.
         """
         data = dict(Action='SubmitFeed',
                     FeedType=feed_type,
                     PurgeAndReplace=purge)
         data.update(self.enumerate_param('MarketplaceIdList.Id.', marketplaceids))
-        md = calc_md5(feed)
+        # A SpooledFeed is hashed while it's written and streamed from its file.
+        md = feed.md5 if isinstance(feed, SpooledFeed) else calc_md5(feed)
         return self.make_request(data, method="POST", body=feed,
                                  extra_headers={'Content-MD5': md, 'Content-Type': content_type})
 
@@ -335,6 +518,18 @@ class Feeds(MWS):
         data = dict(Action='GetFeedSubmissionListByNextToken', NextToken=token)
         return self.make_request(data)
 
+    def iter_feed_submission_list(self, *args, **kwargs):
+        """
+        Iterate the feed submissions of `get_feed_submission_list` across all pages.
+
+        Takes the arguments of `get_feed_submission_list` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `mws.parsers.feeds.submitfeedresponse.FeedSubmissionInfo`.
+        """
+        from parsers.feeds.submitfeedresponse import FeedSubmissionInfo
+        return self.paginate(self.get_feed_submission_list, self.get_submission_list_by_next_token,
+                             local_path('FeedSubmissionInfo'), FeedSubmissionInfo, args, kwargs)
+
     def get_feed_submission_count(self, feedtypes=None, processingstatuses=None, fromdate=None, todate=None):
         data = dict(Action='GetFeedSubmissionCount',
                     SubmittedFromDate=fromdate,
@@ -363,9 +558,35 @@ class Reports(MWS):
 
     ## REPORTS ###
 
-    def get_report(self, report_id):
+    def get_report(self, report_id, raw=False):
+        """
+        :param raw: Return the report body in a DataWrapper without attempting to parse it as XML.
+        """
         data = dict(Action='GetReport', ReportId=report_id)
-        return self.make_request(data)
+        return self.make_request(data, raw=raw)
+
+    def stream_report(self, report_id):
+        """
+        Request a report without reading its body.
+
+        usage:
+
+        >>> for chunk in api.stream_report(report_id):
+        >>>     process(chunk)
+
+        :return: StreamWrapper. Its Content-MD5 is verified once the body is read to the end.
+        """
+        data = dict(Action='GetReport', ReportId=report_id)
+        return self.make_request(data, stream=True)
+
+    def download_report(self, report_id, sink, chunk_size=StreamWrapper.CHUNK_SIZE):
+        """
+        Download a report to a file in constant memory, verifying its Content-MD5 on the way.
+
+        :param sink: Path of the file to write or any object with a `write` method.
+        :return: Number of bytes written.
+        """
+        return self.stream_report(report_id).write_to(sink, chunk_size)
 
     def get_report_count(self, report_types=(), acknowledged=None, fromdate=None, todate=None):
         data = dict(Action='GetReportCount',
@@ -390,6 +611,18 @@ class Reports(MWS):
         data = dict(Action='GetReportListByNextToken', NextToken=token)
         return self.make_request(data)
 
+    def iter_report_list(self, *args, **kwargs):
+        """
+        Iterate the reports of `get_report_list` across all pages.
+
+        Takes the arguments of `get_report_list` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `mws.parsers.reports.requestreport.ReportInfo`.
+        """
+        from parsers.reports.requestreport import ReportInfo
+        return self.paginate(self.get_report_list, self.get_report_list_by_next_token,
+                             local_path('ReportInfo'), ReportInfo, args, kwargs)
+
     def get_report_request_count(self, report_types=(), processingstatuses=(), fromdate=None, todate=None):
         data = dict(Action='GetReportRequestCount',
                     RequestedFromDate=fromdate,
@@ -413,6 +646,18 @@ class Reports(MWS):
         data = dict(Action='GetReportRequestListByNextToken', NextToken=token)
         return self.make_request(data)
 
+    def iter_report_request_list(self, *args, **kwargs):
+        """
+        Iterate the report requests of `get_report_request_list` across all pages.
+
+        Takes the arguments of `get_report_request_list` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `mws.parsers.reports.requestreport.ReportRequestInfo`.
+        """
+        from parsers.reports.requestreport import ReportRequestInfo
+        return self.paginate(self.get_report_request_list, self.get_report_request_list_by_next_token,
+                             local_path('ReportRequestInfo'), ReportRequestInfo, args, kwargs)
+
     def request_report(self, report_type, start_date=None, end_date=None, marketplaceids=()):
         data = dict(Action='RequestReport',
                     ReportType=report_type,
@@ -470,6 +715,18 @@ class Orders(MWS):
         data = dict(Action='ListOrdersByNextToken', NextToken=token)
         return self.make_request(data)
 
+    def iter_orders(self, *args, **kwargs):
+        """
+        Iterate the orders of `list_orders` across all pages.
+
+        Takes the arguments of `list_orders` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `mws.parsers.orders.listorders.Order`.
+        """
+        from parsers.orders.listorders import Order
+        return self.paginate(self.list_orders, self.list_orders_by_next_token,
+                             local_path('Orders', 'Order'), Order, args, kwargs)
+
     def get_order(self, amazon_order_ids):
         data = dict(Action='GetOrder')
         data.update(self.enumerate_param('AmazonOrderId.Id.', amazon_order_ids))
@@ -483,6 +740,18 @@ class Orders(MWS):
         data = dict(Action='ListOrderItemsByNextToken', NextToken=token)
         return self.make_request(data)
 
+    def iter_order_items(self, *args, **kwargs):
+        """
+        Iterate the items of `list_order_items` across all pages.
+
+        Takes the arguments of `list_order_items` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `mws.parsers.orders.listorderitems.OrderItem`.
+        """
+        from parsers.orders.listorderitems import OrderItem
+        return self.paginate(self.list_order_items, self.list_order_items_by_next_token,
+                             local_path('OrderItems', 'OrderItem'), OrderItem, args, kwargs)
+
 
 class Products(MWS):
     """ Amazon MWS Products API """
@@ -711,9 +980,20 @@ class Sellers(MWS):
             Takes a "NextToken" and returns the same information as "list_marketplace_participations".
             Based on the "NextToken".
         """
-        data = dict(Action='ListMarketplaceParticipations', NextToken=token)
+        data = dict(Action='ListMarketplaceParticipationsByNextToken', NextToken=token)
         return self.make_request(data)
 
+    def iter_marketplace_participations(self, *args, **kwargs):
+        """
+        Iterate the participations of `list_marketplace_participations` across all pages.
+
+        Takes the arguments of `list_marketplace_participations` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `utils.object_dict`.
+        """
+        return self.paginate(self.list_marketplace_participations, self.list_marketplace_participations_by_next_token,
+                             local_path('ListParticipations', 'Participation'), None, args, kwargs)
+
 
 #### Fulfillment APIs ####
 
@@ -755,6 +1035,30 @@ class InboundShipments(MWS):
         )
         return self.make_request(data)
 
+    def iter_inbound_shipments(self, *args, **kwargs):
+        """
+        Iterate the shipments of `list_inbound_shipments` across all pages.
+
+        Takes the arguments of `list_inbound_shipments` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `mws.parsers.fulfillment.listinboundshipments.Member`.
+        """
+        from parsers.fulfillment.listinboundshipments import Member
+        return self.paginate(self.list_inbound_shipments, self.list_inbound_shipments_by_next_token,
+                             local_path('ShipmentData', 'member'), Member, args, kwargs)
+
+    def iter_inbound_shipment_items(self, *args, **kwargs):
+        """
+        Iterate the items of `list_inbound_shipment_items` across all pages.
+
+        Takes the arguments of `list_inbound_shipment_items` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `mws.parsers.fulfillment.listinboundshipmentitems.Member`.
+        """
+        from parsers.fulfillment.listinboundshipmentitems import Member
+        return self.paginate(self.list_inbound_shipment_items, self.list_inbound_shipment_items_by_next_token,
+                             local_path('ItemData', 'member'), Member, args, kwargs)
+
     def get_prep_instructions_for_asin(self, asin_list, ship_to_country_code):
         """
 
@@ -793,6 +1097,18 @@ class Inventory(MWS):
         data = dict(Action='ListInventorySupplyByNextToken', NextToken=token)
         return self.make_request(data, "POST")
 
+    def iter_inventory_supply(self, *args, **kwargs):
+        """
+        Iterate the inventory supply of `list_inventory_supply` across all pages.
+
+        Takes the arguments of `list_inventory_supply` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `mws.parsers.fulfillment.listinventorysupply.InventorySupply`.
+        """
+        from parsers.fulfillment.listinventorysupply import InventorySupply
+        return self.paginate(self.list_inventory_supply, self.list_inventory_supply_by_next_token,
+                             local_path('InventorySupplyList', 'member'), InventorySupply, args, kwargs)
+
 
 class OutboundShipments(MWS):
     URI = "/FulfillmentOutboundShipment/2010-10-01"
@@ -836,3 +1152,16 @@ class Recommendations(MWS):
         data = dict(Action="ListRecommendationsByNextToken",
                     NextToken=token)
         return self.make_request(data, "POST")
+
+    def iter_recommendations(self, *args, **kwargs):
+        """
+        Iterate the recommendations of every category of `list_recommendations` across all pages.
+
+        Takes the arguments of `list_recommendations` and `prefetch`, see `Paginator`.
+
+        :return: Paginator of `utils.object_dict`.
+        """
+        # ie. ListingQualityRecommendations/member, PricingRecommendations/member...
+        records = '//*[substring(local-name(), string-length(local-name()) - 14) = "Recommendations"]/*[local-name()="member"]'
+        return self.paginate(self.list_recommendations, self.list_recommendations_by_next_token,
+                             records, None, args, kwargs)
@@ -0,0 +1,214 @@
+"""
+Write-behind buffer turning many small price or quantity updates into few feeds.
+
+`CoalescingBuffer` keeps only the latest message per SKU and submits everything it holds as one feed
+once it holds `max_skus` SKUs or its oldest update waited `max_delay` seconds. Every flush is reported
+as a `FlushResult`, with the number of updates which were replaced by a later one for the same SKU.
+
+usage:
+
+>>> buffer = CoalescingBuffer(functools.partial(PriceFeed, access_key, secret_key, account_id),
+>>>                           max_skus=5000, max_delay=120, on_flush=log_flush)
+>>> for sku, price in repricer.changes():
+>>>     buffer.update({'sku': sku, 'price': price})
+>>> buffer.close()
+"""
+import time
+import logging
+import threading
+
+__all__ = [
+    'FlushResult',
+    'CoalescingBuffer',
+]
+
+# Default flush triggers.
+MAX_SKUS = 10000
+MAX_DELAY = 60
+
+
+class FlushResult(object):
+    """
+    A flush of a `CoalescingBuffer`.
+
+    `updates` is the number of updates received since the previous flush, `skus` the number of messages
+    of the feed and `coalesced` the difference: updates dropped for a later one of the same SKU.
+    `reason` is 'size', 'time' or 'flush' (explicit `flush` or `close`). `submission` is what submitting the
+    feed returned, `error` the exception if it failed; the messages are then put back in the buffer.
+    """
+
+    def __init__(self, reason, updates, skus, submission=None, error=None):
+        self.reason = reason
+        self.updates = updates
+        self.skus = skus
+        self.coalesced = updates - skus
+        self.submission = submission
+        self.error = error
+
+    def __repr__(self):
+        return '<FlushResult %s %d updates %d skus %d coalesced>' % (self.reason, self.updates, self.skus,
+                                                                     self.coalesced)
+
+
+class CoalescingBuffer(object):
+    """
+    Latest message per SKU, flushed into one feed by a background thread on size or time.
+
+    Flushes are queued and submitted one after the other in the order they were taken, so a SKU's updates reach
+    amazon in order. Every update gets a sequence number: the messages of a failed flush are only put back for
+    the SKUs which got no later update since, the later one is sent instead.
+    """
+
+    def __init__(self, feed_factory, max_skus=MAX_SKUS, max_delay=MAX_DELAY, tracker=None, on_flush=None):
+        """
+        :param feed_factory: Called with `messages=[...]` to build the feed of a flush, ie.
+            `functools.partial(InventoryFeed, access_key, secret_key, account_id)`.
+        :param max_skus: Flush once this many SKUs are waiting.
+        :param max_delay: Flush once the oldest waiting update is this many seconds old.
+        :param tracker: `mws.tracking.FeedTracker` to submit the feeds with, `BaseFeed.submit` otherwise.
+        :param on_flush: Called with the `FlushResult` of every flush, from the thread which flushed.
+        """
+        self.feed_factory = feed_factory
+        self.max_skus = max_skus
+        self.max_delay = max_delay
+        self.tracker = tracker
+        self.on_flush = on_flush
+        self.logger = logging.getLogger(self.__class__.__name__)
+        # sku: (sequence, message)
+        self._pending = {}
+        self._updates = 0
+        self._oldest = None
+        # sku: sequence of its latest update, for the SKUs waiting or in a flush not submitted yet.
+        self._latest = {}
+        self._sequence = 0
+        # Flushes taken and not submitted yet, oldest first: [messages, updates, FlushResult].
+        self._ready = []
+        self._closed = False
+        self._condition = threading.Condition()
+        # Held while submitting the `_ready` flushes, reentrant for an `on_flush` calling `flush`.
+        self._submit_lock = threading.RLock()
+        # Totals over every flush.
+        self.total_updates = 0
+        self.total_coalesced = 0
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def update(self, message):
+        """
+        Queue a message, replacing the waiting one of the same SKU.
+
+        :param message: Message dict of the feed, see `PriceFeed` and `InventoryFeed`.
+        """
+        with self._condition:
+            if self._closed:
+                raise ValueError('The buffer is closed')
+            self._sequence += 1
+            self._latest[message['sku']] = self._sequence
+            self._pending[message['sku']] = self._sequence, message
+            self._updates += 1
+            if len(self._pending) >= self.max_skus:
+                # Handed to the flushing thread right away, so that feeds keep to about `max_skus` messages.
+                self._take('size')
+                self._condition.notify()
+            elif self._oldest is None:
+                self._oldest = time.time()
+                self._condition.notify()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def _take(self, reason):
+        # Queue the waiting messages as a flush, with `_condition` held.
+        result = FlushResult(reason, self._updates, len(self._pending))
+        self._ready.append([self._pending, self._updates, result])
+        self._pending = {}
+        self._updates = 0
+        self._oldest = None
+        return result
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._ready and not self._closed:
+                    if self._oldest is None:
+                        self._condition.wait()
+                        continue
+                    remaining = self._oldest + self.max_delay - time.time()
+                    if remaining <= 0:
+                        self._take('time')
+                    else:
+                        self._condition.wait(remaining)
+                if not self._ready:
+                    # Closed, `close` flushes what's left.
+                    return
+            self._submit_ready()
+
+    def flush(self):
+        """
+        Submit the waiting messages now, after the flushes queued before them.
+
+        :return: FlushResult, or None if nothing was waiting.
+        """
+        with self._condition:
+            if not self._pending:
+                return
+            result = self._take('flush')
+        # Once it returns the flush is submitted, by this thread or by the one holding the lock meanwhile.
+        self._submit_ready()
+        return result
+
+    def _submit_ready(self):
+        with self._submit_lock:
+            while True:
+                with self._condition:
+                    if not self._ready:
+                        return
+                    pending, updates, result = self._ready.pop(0)
+                self._submit(pending, updates, result)
+
+    def _submit(self, pending, updates, result):
+        feed = self.feed_factory(messages=[message for _, message in pending.itervalues()])
+        try:
+            result.submission = self.tracker.submit(feed) if self.tracker is not None else feed.submit()
+        except Exception as e:
+            self.logger.exception('Submitting %d messages failed', len(pending))
+            result.error = e
+            with self._condition:
+                # Retry with the next flush the SKUs which got no later update, the dropped messages count as
+                # coalesced into the later ones.
+                for sku, (sequence, message) in pending.iteritems():
+                    if self._latest.get(sku) == sequence:
+                        self._pending[sku] = sequence, message
+                self._updates += updates
+                if self._oldest is None and self._pending:
+                    self._oldest = time.time()
+                    self._condition.notify()
+        else:
+            with self._condition:
+                for sku, (sequence, _) in pending.iteritems():
+                    if self._latest.get(sku) == sequence:
+                        del self._latest[sku]
+            self.total_updates += updates
+            self.total_coalesced += result.coalesced
+        self.logger.debug('%r', result)
+        if self.on_flush is not None:
+            self.on_flush(result)
+
+    def close(self):
+        """
+        Stop the background thread once it submitted the queued flushes, and flush what's left.
+
+        :return: FlushResult of the last flush, or None if nothing was waiting.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        return self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
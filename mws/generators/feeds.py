@@ -1,14 +1,33 @@
 import abc
-import time
 import logging
 
-from mws.parsers.feeds.submitfeedresponse import SubmitFeedResponse, GetFeedSubmissionListResponse
+from mws import Feeds
+from mws.parsers.feeds.submitfeedresponse import SubmitFeedResponse
+from mws.tracking import FeedTracker
+from mws.spool import SpooledFeed, SPOOL_MAX_SIZE, buffer_chunks
+
+# Default limits of the shards of a feed, see `BaseFeed.shards`. Amazon processes small feeds faster.
+MAX_SHARD_BYTES = 10 * 1024 * 1024
+MAX_SHARD_MESSAGES = 10000
+
+
+class FeedMeta(abc.ABCMeta):
+    """
+    ABCMeta taking an overridden `generate` as the implementation of the abstract `iter_chunks`, so that the feeds
+    which only implement `generate` keep working.
+    """
+
+    def __new__(mcls, name, bases, namespace):
+        cls = abc.ABCMeta.__new__(mcls, name, bases, namespace)
+        if 'iter_chunks' in cls.__abstractmethods__ and not getattr(cls.generate, '_joins_chunks', False):
+            cls.__abstractmethods__ = cls.__abstractmethods__ - frozenset(['iter_chunks'])
+        return cls
 
 
 # flat file feeds
 class BaseFeed(object):
 
-    __metaclass__ = abc.ABCMeta
+    __metaclass__ = FeedMeta
     enumeration_value = ""
 
     def __init__(self, access_key, secret_key, account_id, region="US", domain='', uri='', version='', auth_token='', marketplace_ids=('ATVPDKIKX0DER',), content_type='text/xml', purge_and_replace=False):
@@ -21,13 +40,40 @@ class BaseFeed(object):
         self.auth_token = auth_token
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    @abc.abstractmethod
     def generate(self):
         """
-        Generate the feed contents
+        Generate the feed contents, the chunks of `iter_chunks` joined.
         :return:
         """
-        raise NotImplementedError("method `generate` is not implemented")
+        return ''.join(self.iter_chunks())
+    generate._joins_chunks = True
+
+    @abc.abstractmethod
+    def iter_chunks(self):
+        """
+        Generator of the feed contents in chunks.
+
+        Feeds implement either `iter_chunks` or, for small feeds, `generate`: a feed which only overrides `generate`
+        gets its whole contents as a single chunk.
+        """
+        yield self.generate()
+
+    def spool(self, max_size=SPOOL_MAX_SIZE):
+        """
+        Write the feed to a SpooledFeed, computing its MD5 on the way. Only the first `max_size` bytes are kept
+        in memory, the rest goes to a temporary file.
+        :return: SpooledFeed, close it once it's uploaded.
+        """
+        return SpooledFeed.from_chunks(self.iter_chunks(), max_size)
+
+    def shards(self, max_bytes=MAX_SHARD_BYTES, max_messages=MAX_SHARD_MESSAGES):
+        """
+        Generator cutting the feed into SpooledFeeds of at most `max_bytes` bytes and `max_messages` messages.
+
+        Only feeds made of messages (see `mws.generators.xmlfeeds.XmlFeed`) can be cut, the others are a single
+        shard whatever their size.
+        """
+        yield self.spool()
 
     @property
     def _purge_and_replace(self):
@@ -39,21 +85,33 @@ class BaseFeed(object):
             return 'true'
         return 'false'
 
-    def upload(self):
-        response = SubmitFeedResponse.request(self.access_key, self.secret_key, self.account_id, self.generate(), self.enumeration_value, self.auth_token, self.marketplace_ids, self.content_type, self._purge_and_replace)
-        done = False
-        status = ''
-        feed_submission_id = None
-        while not done:
-            feed_submission_id = response.feed_submission_id
-            time.sleep(60)  # sleep before querying since it takes time to process and so that when the report is _DONE_ the loop is immediately broken.
-            r = GetFeedSubmissionListResponse.request(self.access_key, self.secret_key, self.account_id, self.auth_token, (feed_submission_id,))
-            request_result = r.feed_submission_info_list()[0]
-            status = request_result.feed_processing_status
-            self.logger.debug('feed_submission_id=%s report_processing_status=%s' % (feed_submission_id, status))
-            done = bool(request_result._completed_processing_date)
-        if status != '_DONE_':
-            raise ValueError("GetFeedSubmissionListResult for feed_submission_id=%s returned %s" % (feed_submission_id, status))
+    def submit(self, feed=None):
+        """
+        Submit the feed without waiting for it to be processed.
+
+        The feed is spooled (see `spool`) and streamed from there.
+
+        Use a started `mws.tracking.FeedTracker` to follow many submitted feeds, ie. `tracker.submit(feed)`.
+        :param feed: SpooledFeed to submit instead of the whole feed, ie. one of its `shards`. It's closed once sent.
+        :return: SubmitFeedResponse
+        """
+        with feed or self.spool() as feed:
+            return SubmitFeedResponse.request(self.access_key, self.secret_key, self.account_id, feed, self.enumeration_value, self.auth_token, self.marketplace_ids, self.content_type, self.purge_and_replace)
+
+    def upload(self, schedule=None):
+        """
+        Submit the feed and wait for it to be processed.
+
+        :param schedule: `mws.tracking.PollSchedule` of the status polls.
+        :return: The FeedSubmissionId.
+        """
+        tracker = FeedTracker(Feeds(self.access_key, self.secret_key, self.account_id, auth_token=self.auth_token), schedule)
+        handle = tracker.track(self.submit())
+        tracker.wait()
+        self.logger.debug('feed_submission_id=%s feed_processing_status=%s' % (handle.id, handle.status))
+        if handle.status != '_DONE_':
+            raise ValueError("GetFeedSubmissionListResult for feed_submission_id=%s returned %s" % (handle.id, handle.status))
+        return handle.id
 
 
 class UpdateInboundShipmentPlanFeed(BaseFeed):
@@ -65,7 +123,7 @@ class UpdateInboundShipmentPlanFeed(BaseFeed):
 
         :param plan_id: The plan id to update
             ex. PLN2RHD
-        :param data: a list containing tuples of merchant sku, quantity.
+        :param data: an iterable of tuples of merchant sku, quantity, ie. a generator over millions of rows.
             ex. [(MySku123, 5), (MySku999, 12)]
         """
         self.plan_id = kwargs.pop('plan_id')
@@ -73,8 +131,15 @@ class UpdateInboundShipmentPlanFeed(BaseFeed):
         kwargs['content_type'] = 'text/tab-separated-values; charset=iso-8859-1'
         BaseFeed.__init__(self, *args, **kwargs)
 
-    def generate(self):
-        feed_header = "PlanId\t{}\n\n".format(self.plan_id)
-        column_headers = "MerchantSKU\tQuantity\n"
-        column_data = "\n".join(["{sku}\t{quantity}".format(sku=x[0], quantity=x[1]) for x in self.data])
-        return feed_header + column_headers + column_data
+    def iter_chunks(self):
+        yield "PlanId\t{}\n\n".format(self.plan_id)
+        yield "MerchantSKU\tQuantity\n"
+        rows = ("{sku}\t{quantity}".format(sku=x[0], quantity=x[1]) for x in self.data)
+        for chunk in buffer_chunks(self._separated(rows)):
+            yield chunk
+
+    @staticmethod
+    def _separated(rows):
+        # Rows separated by line breaks, without one after the last row.
+        for i, row in enumerate(rows):
+            yield '\n' + row if i else row
@@ -0,0 +1,242 @@
+"""
+XML feeds written message by message.
+
+The AmazonEnvelope is written with lxml's `xmlfile` while the messages are read from any iterable of
+dicts, so memory stays flat however many messages a feed has. MessageIDs are numbered from 1 in
+the order of the messages.
+
+usage:
+
+>>> feed = PriceFeed(access_key, secret_key, account_id, messages=({'sku': sku, 'price': price} for sku, price in prices))
+>>> feed.upload()
+"""
+import datetime
+from contextlib import contextmanager
+from decimal import Decimal
+
+from lxml import etree
+
+from mws.generators.feeds import BaseFeed, MAX_SHARD_BYTES, MAX_SHARD_MESSAGES
+from mws.spool import SpooledFeed, CHUNK_SIZE
+
+XSI = 'http://www.w3.org/2001/XMLSchema-instance'
+DOCUMENT_VERSION = '1.01'
+
+
+def format_value(value):
+    """
+    Return the text of an element for a python value.
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float):
+        return '%.2f' % value
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, int, long)):
+        return str(value)
+    return value
+
+
+def build_element(tag, value):
+    """
+    Build an element from a value: a string or number for its text, a list of (tag, value) pairs for its
+    children in order. Pairs whose value is None are skipped.
+
+    ie. build_element('StandardPrice', ('9.99', {'currency': 'USD'})) for text with attributes.
+    """
+    attributes = None
+    if isinstance(value, tuple):
+        value, attributes = value
+    element = etree.Element(tag, attributes)
+    if isinstance(value, list):
+        for child_tag, child_value in value:
+            if child_value is not None:
+                element.append(build_element(child_tag, child_value))
+    else:
+        element.text = format_value(value)
+    return element
+
+
+class _ChunkBuffer(object):
+    """
+    File-like target of `xmlfile` handing out what was written so far in chunks.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.size = 0
+
+    def write(self, data):
+        self.parts.append(data)
+        self.size += len(data)
+
+    def take(self):
+        chunk = ''.join(self.parts)
+        self.parts = []
+        self.size = 0
+        return chunk
+
+
+class XmlFeed(BaseFeed):
+    """
+    Base class of the XML feeds: subclasses set `enumeration_value` and `message_type` and implement `payload`.
+    """
+    message_type = ''
+
+    def __init__(self, *args, **kwargs):
+        """
+
+        :param messages: an iterable of message dicts, see `payload` of the feed. A message's 'operation_type'
+            key overrides the OperationType of `operation_type`.
+        :param operation_type: OperationType of the messages: Update, Delete or PartialUpdate.
+        :param merchant_identifier: MerchantIdentifier of the header, the account id by default.
+        """
+        self.messages = kwargs.pop('messages')
+        self.operation_type = kwargs.pop('operation_type', 'Update')
+        self.merchant_identifier = kwargs.pop('merchant_identifier', None)
+        kwargs['content_type'] = 'text/xml'
+        BaseFeed.__init__(self, *args, **kwargs)
+        # Number of messages written by the last generation of the feed.
+        self.message_count = 0
+
+    def payload(self, message):
+        """
+        Return the element of the message type for a message dict, ie. <Price>.
+        """
+        raise NotImplementedError("method `payload` is not implemented")
+
+    def build_message(self, message_id, message):
+        element = build_element('Message', [
+            ('MessageID', message_id),
+            ('OperationType', message.get('operation_type', self.operation_type)),
+        ])
+        element.append(self.payload(message))
+        return element
+
+    @contextmanager
+    def envelope(self, xf):
+        """
+        Write the AmazonEnvelope with its header to an `xmlfile`, the messages are written inside the with block.
+        """
+        xf.write_declaration()
+        with xf.element('AmazonEnvelope', {'{%s}noNamespaceSchemaLocation' % XSI: 'amzn-envelope.xsd'},
+                        nsmap={'xsi': XSI}):
+            xf.write(build_element('Header', [
+                ('DocumentVersion', DOCUMENT_VERSION),
+                ('MerchantIdentifier', self.merchant_identifier or self.account_id),
+            ]))
+            xf.write(build_element('MessageType', self.message_type))
+            yield
+
+    def iter_chunks(self):
+        out = _ChunkBuffer()
+        self.message_count = 0
+        with etree.xmlfile(out, encoding='utf-8') as xf:
+            with self.envelope(xf):
+                for message_id, message in enumerate(self.messages, 1):
+                    xf.write(self.build_message(message_id, message))
+                    self.message_count = message_id
+                    if out.size >= CHUNK_SIZE:
+                        yield out.take()
+        yield out.take()
+
+    def shards(self, max_bytes=MAX_SHARD_BYTES, max_messages=MAX_SHARD_MESSAGES):
+        """
+        Generator of SpooledFeeds of at most `max_bytes` bytes and `max_messages` messages, each a complete envelope
+        with MessageIDs numbered from 1. A single message bigger than `max_bytes` gets a shard of its own.
+
+        The messages are read as the shards are consumed, so only the current shard is spooled at once.
+        """
+        messages = iter(self.messages)
+        self.message_count = 0
+        # Size of an envelope without messages.
+        empty = _ChunkBuffer()
+        with etree.xmlfile(empty, encoding='utf-8') as xf:
+            with self.envelope(xf):
+                pass
+        overhead = empty.size
+        carried = None
+        while True:
+            if carried is None:
+                message = next(messages, None)
+                if message is None:
+                    return
+                carried = self.build_message(1, message)
+            shard = SpooledFeed()
+            size = overhead
+            count = 0
+            with etree.xmlfile(shard, encoding='utf-8') as xf:
+                with self.envelope(xf):
+                    while carried is not None:
+                        # MessageID is the first child.
+                        carried[0].text = str(count + 1)
+                        message_size = len(etree.tostring(carried, encoding='utf-8'))
+                        if count and size + message_size > max_bytes:
+                            break
+                        xf.write(carried)
+                        size += message_size
+                        count += 1
+                        self.message_count += 1
+                        carried = None
+                        if count >= max_messages:
+                            break
+                        message = next(messages, None)
+                        if message is not None:
+                            carried = self.build_message(count + 1, message)
+            shard.seek(0)
+            yield shard
+
+
+class PriceFeed(XmlFeed):
+    """
+    _POST_PRODUCT_PRICING_DATA_ feed.
+
+    Messages: {'sku': ..., 'price': ..., 'currency': 'USD', 'minimum_price': ..., 'maximum_price': ...,
+    'sale_price': ..., 'sale_start': datetime, 'sale_end': datetime}, only 'sku' and 'price' are required.
+    """
+    enumeration_value = '_POST_PRODUCT_PRICING_DATA_'
+    message_type = 'Price'
+
+    def payload(self, message):
+        currency = {'currency': message.get('currency', 'USD')}
+
+        def amount(key):
+            if message.get(key) is not None:
+                return message[key], currency
+
+        sale = None
+        if message.get('sale_price') is not None:
+            sale = [
+                ('StartDate', message['sale_start']),
+                ('EndDate', message['sale_end']),
+                ('SalePrice', amount('sale_price')),
+            ]
+        return build_element('Price', [
+            ('SKU', message['sku']),
+            ('StandardPrice', amount('price')),
+            ('MinimumSellerAllowedPrice', amount('minimum_price')),
+            ('MaximumSellerAllowedPrice', amount('maximum_price')),
+            ('Sale', sale),
+        ])
+
+
+class InventoryFeed(XmlFeed):
+    """
+    _POST_INVENTORY_AVAILABILITY_DATA_ feed.
+
+    Messages: {'sku': ..., 'quantity': ..., 'fulfillment_center_id': ..., 'available': bool, 'restock_date': date,
+    'fulfillment_latency': days}, with 'sku' and either 'quantity' or 'available'.
+    """
+    enumeration_value = '_POST_INVENTORY_AVAILABILITY_DATA_'
+    message_type = 'Inventory'
+
+    def payload(self, message):
+        return build_element('Inventory', [
+            ('SKU', message['sku']),
+            ('FulfillmentCenterID', message.get('fulfillment_center_id')),
+            ('Available', message.get('available')),
+            ('Quantity', message.get('quantity')),
+            ('RestockDate', message.get('restock_date')),
+            ('FulfillmentLatency', message.get('fulfillment_latency')),
+        ])
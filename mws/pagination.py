@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Iterate the records of paginated MWS operations across all of their pages.
+
+Operations returning a NextToken are continued with their *ByNextToken counterpart. `Paginator`
+does that lazily: the next page is only requested once every record of the current one has been
+consumed, so memory is bounded by a single page and breaking out of the loop stops the requests.
+
+With `prefetch` the pages are instead requested by a background thread while the records of the
+previous ones are processed, staying at most `prefetch` pages ahead of the consumer.
+
+usage:
+
+>>> api = Orders('access_key', 'secret_key', 'account_id')
+>>> for order in api.iter_orders(marketplaceids, created_after='2016-09-01T00:00:00Z'):
+>>>     print order.amazon_order_id, order.purchase_date
+>>> for order in api.iter_orders(marketplaceids, created_after='2016-09-01T00:00:00Z', prefetch=2):
+>>>     process(order)
+"""
+import sys
+import Queue
+import threading
+
+from lxml import etree
+
+import utils
+
+__all__ = [
+    'Paginator',
+    'local_path',
+]
+
+NEXT_TOKEN = etree.XPath('/*/*/*[local-name()="NextToken"]/text()')
+# Reports and Feeds state whether there is a next page in HasNext, the NextToken may still be present.
+HAS_NEXT = etree.XPath('/*/*/*[local-name()="HasNext"]/text()')
+
+# xpath: compiled etree.XPath
+_record_paths = {}
+
+# How often a prefetching thread blocked on a full queue checks whether the consumer went away.
+PREFETCH_POLL_SECONDS = 0.1
+
+# Marks the end of the pages put in a prefetch queue.
+_DONE = object()
+
+
+def local_path(*names):
+    """
+    Build a namespace agnostic xpath selecting the elements with the given local names anywhere in a response.
+
+    `local_path('Orders', 'Order')` is the equivalent of `//a:Orders/a:Order`.
+    """
+    return '//' + '/'.join('*[local-name()="%s"]' % name for name in names)
+
+
+class Paginator(object):
+    """
+    Lazy iterable of the records of every page of a paginated operation.
+
+    Each iteration starts over from the first page.
+    """
+
+    def __init__(self, first_page, next_page, records, record_class=None, prefetch=0):
+        """
+        :param first_page: Function without arguments requesting the first page, ie. `partial(api.list_orders, ...)`.
+        :param next_page: Function requesting the page of a NextToken, ie. `api.list_orders_by_next_token`.
+        :param records: xpath selecting the records of a page, see `local_path`.
+        :param record_class: `BaseElementWrapper` subclass each record is wrapped in. Without it records are
+            returned as `utils.object_dict` like the `parsed` view of a response.
+        :param prefetch: Number of pages requested ahead of the consumer by a background thread. With 0 (the
+            default) pages are requested on demand. The thread blocks once `prefetch` pages are waiting, so at
+            most `prefetch` + 2 pages are held at once.
+        """
+        self.first_page = first_page
+        self.next_page = next_page
+        self.records = records
+        self.record_class = record_class
+        self.prefetch = prefetch
+
+    @staticmethod
+    def next_token(response):
+        """
+        Return the NextToken of a page or None if it's the last one.
+        """
+        tree = response.tree
+        has_next = HAS_NEXT(tree)
+        if has_next and has_next[0] != 'true':
+            return
+        token = NEXT_TOKEN(tree)
+        if token:
+            return token[0]
+
+    def page_records(self, response):
+        """
+        Return the records of a page wrapped in `record_class`.
+        """
+        try:
+            select = _record_paths[self.records]
+        except KeyError:
+            select = _record_paths[self.records] = etree.XPath(self.records)
+        elements = select(response.tree)
+        if self.record_class is not None:
+            return [self.record_class(x) for x in elements]
+        converter = utils.lxml2dict()
+        return [converter.fromtree(x).values()[0] for x in elements]
+
+    def pages(self):
+        """
+        Generator of the response of every page.
+        """
+        if self.prefetch > 0:
+            return self._prefetched_pages()
+        return self._pages()
+
+    def _pages(self):
+        response = self.first_page()
+        while True:
+            token = self.next_token(response)
+            yield response
+            if not token:
+                return
+            # Let go of the page before requesting the next one.
+            response = None
+            response = self.next_page(token)
+
+    def _prefetched_pages(self):
+        pages = Queue.Queue(self.prefetch)
+        stop = threading.Event()
+        worker = threading.Thread(target=self._prefetch, args=(pages, stop))
+        worker.daemon = True
+        worker.start()
+        try:
+            while True:
+                response = pages.get()
+                if response is _DONE:
+                    return
+                if isinstance(response, tuple):
+                    # exc_info of the failed request
+                    raise response[0], response[1], response[2]
+                yield response
+        finally:
+            # Also reached when the consumer stops early, the worker then exits without requesting more pages.
+            stop.set()
+
+    def _prefetch(self, pages, stop):
+        """
+        Body of the prefetching thread: put every page in `pages` until the last one or until `stop` is set.
+        """
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=PREFETCH_POLL_SECONDS)
+                    return True
+                except Queue.Full:
+                    pass
+            return False
+
+        try:
+            for response in self._pages():
+                if not put(response) or stop.is_set():
+                    return
+                response = None
+        except Exception:
+            put(sys.exc_info())
+            return
+        put(_DONE)
+
+    def __iter__(self):
+        for response in self.pages():
+            records = self.page_records(response)
+            # Only the records keep the page alive from here on.
+            response = None
+            for record in records:
+                yield record
+            record = records = None
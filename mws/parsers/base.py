@@ -1,3 +1,4 @@
+import functools
 import logging
 
 from lxml import etree
@@ -22,6 +23,7 @@ def first_element(f):
     :param f:
     :return:
     """
+    @functools.wraps(f)
     def inner(*args, **kwargs):
         return first_element_or_none(f(*args, **kwargs))
     return inner
@@ -29,13 +31,38 @@ def first_element(f):
 
 def parse_bool(f):
 
+    @functools.wraps(f)
     def inner(*args, **kwargs):
         return f(*args, **kwargs) == 'true'
     return inner
 
 
+class cached_property(object):
+    """
+    Read-only property computed once per instance.
+
+    The value is stored in the instance `__dict__` under the property's name, which shadows the descriptor,
+    so every read after the first one is a plain attribute lookup. Use `BaseElementWrapper.invalidate`
+    to drop the stored values.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.__name__ = f.__name__
+        self.__doc__ = f.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.__name__] = self.f(instance)
+        return value
+
+
 class BaseElementWrapper(object):
 
+    # Prefix -> namespace mapping used by the xpath expressions of a wrapper class.
+    namespaces = None
+
     def __init__(self, element, mws_access_key=None, mws_secret_key=None, mws_account_id=None, mws_auth_token=None):
         """
 
@@ -47,6 +74,41 @@ class BaseElementWrapper(object):
     def __str__(self):
         return etree.tostring(self.element)
 
+    def xpath(self, path, element=None):
+        """
+        Evaluate an xpath expression against the wrapped element.
+
+        Every expression is compiled into an `etree.XPath` object the first time it's used and kept on the
+        class, so all instances of a wrapper share the compiled version instead of recompiling it on each access.
+        :param path: xpath expression, using the prefixes of `namespaces`.
+        :param element: Evaluate against this element instead of the wrapped one.
+        :return:
+        """
+        cls = self.__class__
+        compiled = cls.__dict__.get('_compiled_xpaths')
+        if compiled is None:
+            compiled = {}
+            cls._compiled_xpaths = compiled
+        try:
+            expression = compiled[path]
+        except KeyError:
+            expression = compiled[path] = etree.XPath(path, namespaces=cls.namespaces)
+        return expression(self.element if element is None else element)
+
+    def invalidate(self, *names):
+        """
+        Forget memoized field values so they are read from the element again on next access.
+
+        Call it after modifying `element` in place.
+        :param names: Names of the fields to forget, all of them when omitted.
+        :return:
+        """
+        if not names:
+            names = [name for klass in self.__class__.__mro__ for name, value in vars(klass).items()
+                     if isinstance(value, cached_property)]
+        for name in names:
+            self.__dict__.pop(name, None)
+
 
 class BaseResponseMixin(object):
 
@@ -71,3 +133,17 @@ class BaseResponseMixin(object):
         """
         tree = etree.fromstring(xml_string)
         return cls(tree, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
+
+    @classmethod
+    def from_response(cls, response, mws_access_key=None, mws_secret_key=None, mws_account_id=None, mws_auth_token=None):
+        """
+        Create an instance of this class from the wrapper returned by `MWS.make_request`.
+
+        Reuses the tree parsed by `make_request` instead of parsing the response body again.
+        :param response: DictWrapper returned by an api call.
+        :return:
+        """
+        tree = getattr(response, 'tree', None)
+        if tree is None:
+            return cls.load(response.original, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
+        return cls(tree, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
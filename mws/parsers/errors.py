@@ -1,6 +1,4 @@
-import re
-from base import first_element, BaseResponseMixin, BaseElementWrapper
-from lxml import etree
+from base import first_element, BaseResponseMixin, BaseElementWrapper, cached_property
 
 
 class ErrorResponse(ValueError, BaseElementWrapper, BaseResponseMixin):
@@ -9,39 +7,25 @@ class ErrorResponse(ValueError, BaseElementWrapper, BaseResponseMixin):
         BaseElementWrapper.__init__(self, element)
         ValueError.__init__(self, self.message)
 
-    @property
+    @cached_property
     @first_element
     def type(self):
-        return self.element.xpath('//ErrorResponse/Error/Type/text()')
+        return self.xpath('//*[local-name()="ErrorResponse"]/*[local-name()="Error"]/*[local-name()="Type"]/text()')
 
-    @property
+    @cached_property
     @first_element
     def code(self):
-        return self.element.xpath('//ErrorResponse/Error/Code/text()')
+        return self.xpath('//*[local-name()="ErrorResponse"]/*[local-name()="Error"]/*[local-name()="Code"]/text()')
 
-    @property
+    @cached_property
     @first_element
     def message(self):
-        return self.element.xpath('//ErrorResponse/Error/Message/text()')
+        return self.xpath('//*[local-name()="ErrorResponse"]/*[local-name()="Error"]/*[local-name()="Message"]/text()')
 
-    @property
+    @cached_property
     @first_element
     def request_id(self):
-        return self.element.xpath('//ErrorResponse/RequestID/text()')
-
-    @classmethod
-    def load(cls, xml_string, mws_access_key=None, mws_secret_key=None, mws_account_id=None, mws_auth_token=None):
-        """
-        Create an instance of this class using an xml string.
-
-        overridden so that we can remove any namespace from the response.
-        :param xml_string:
-        :return:
-        """
-        ptn = '\s+xmlns=\".*?\"'
-        xml_string = re.sub(ptn, '', xml_string)
-        tree = etree.fromstring(xml_string)
-        return cls(tree)
+        return self.xpath('//*[local-name()="ErrorResponse"]/*[local-name()="RequestID"]/text()')
 
 
 class ProductError(ValueError, BaseElementWrapper):
@@ -58,17 +42,17 @@ class ProductError(ValueError, BaseElementWrapper):
         ValueError.__init__(self, self.message)
         self.identifier = identifier
 
-    @property
+    @cached_property
     @first_element
     def message(self):
-        return self.element.xpath('./a:Message/text()', namespaces=self.namespaces)
+        return self.xpath('./a:Message/text()')
 
-    @property
+    @cached_property
     @first_element
     def code(self):
-        return self.element.xpath('./a:Code/text()', namespaces=self.namespaces)
+        return self.xpath('./a:Code/text()')
 
-    @property
+    @cached_property
     @first_element
     def type(self):
-        return self.element.xpath('./a:Type/text()', namespaces=self.namespaces)
+        return self.xpath('./a:Type/text()')
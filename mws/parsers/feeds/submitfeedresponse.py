@@ -1,5 +1,4 @@
-from mws.parsers import ErrorResponse
-from mws.parsers.base import BaseElementWrapper, BaseResponseMixin, first_element
+from mws.parsers.base import BaseElementWrapper, BaseResponseMixin, first_element, cached_property
 from mws import Feeds
 
 namespaces = {
@@ -9,61 +8,64 @@ namespaces = {
 
 class FeedSubmissionInfo(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def feed_processing_status(self):
-        return self.element.xpath('//a:FeedProcessingStatus/text()', namespaces=namespaces)
+        return self.xpath('./a:FeedProcessingStatus/text()')
 
-    @property
+    @cached_property
     @first_element
     def feed_type(self):
-        return self.element.xpath('//a:FeedType/text()', namespaces=namespaces)
+        return self.xpath('./a:FeedType/text()')
 
-    @property
+    @cached_property
     @first_element
     def feed_submission_id(self):
-        return self.element.xpath('//a:FeedSubmissionId/text()', namespaces=namespaces)
+        return self.xpath('./a:FeedSubmissionId/text()')
 
-    @property
+    @cached_property
     @first_element
     def _started_processing_date(self):
-        return self.element.xpath('//a:StartedProcessingDate/text()', namespaces=namespaces)
+        return self.xpath('./a:StartedProcessingDate/text()')
 
-    @property
+    @cached_property
     @first_element
     def _completed_processing_date(self):
-        return self.element.xpath('//a:CompletedProcessingDate/text()', namespaces=namespaces)
+        return self.xpath('./a:CompletedProcessingDate/text()')
 
-    @property
+    @cached_property
     @first_element
     def _submitted_date(self):
-        return self.element.xpath('//a:SubmittedDate/text()', namespaces=namespaces)
+        return self.xpath('./a:SubmittedDate/text()')
 
 
 class GetFeedSubmissionListResponse(BaseElementWrapper, BaseResponseMixin):
 
+    namespaces = namespaces
+
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token=None, feed_submission_id_list=(), max_count=None, feedtypes=(), processingstatuses=(), fromdate=None, todate=None):
         api = Feeds(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         response = api.get_feed_submission_list(feed_submission_id_list, max_count, feedtypes, processingstatuses, fromdate, todate)
         with open('GetFeedSubmissionListResponse.xml', 'wb') as f:
             f.write(response.original)
-        err = ErrorResponse.load(response.original)
-        if err.message:
-            raise err
-        return cls.load(response.original, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
+        return cls.from_response(response, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
 
-    @property
+    @cached_property
     @first_element
     def next_token(self):
-        return self.element.xpath('//a:NextToken/text()', namespaces=namespaces)
+        return self.xpath('//a:NextToken/text()')
 
     def feed_submission_info_list(self):
-        return [FeedSubmissionInfo(x) for x in self.element.xpath('//a:FeedSubmissionInfo', namespaces=namespaces)]
+        return [FeedSubmissionInfo(x) for x in self.xpath('//a:FeedSubmissionInfo')]
 
 
 class SubmitFeedResponse(BaseElementWrapper, BaseResponseMixin):
 
+    namespaces = namespaces
+
     def __init__(self, element, mws_access_key=None, mws_secret_key=None, mws_account_id=None, mws_auth_token=None):
         BaseElementWrapper.__init__(self, element)
         BaseResponseMixin.__init__(self)
@@ -72,34 +74,31 @@ class SubmitFeedResponse(BaseElementWrapper, BaseResponseMixin):
         self.mws_account_id = mws_account_id
         self.mws_auth_token = mws_auth_token
 
-    @property
+    @cached_property
     @first_element
     def feed_submission_id(self):
-        return self.element.xpath('//a:FeedSubmissionId/text()', namespaces=namespaces)
+        return self.xpath('//a:FeedSubmissionId/text()')
 
-    @property
+    @cached_property
     @first_element
     def feed_type(self):
-        return self.element.xpath('//a:FeedType/text()', namespaces=namespaces)
+        return self.xpath('//a:FeedType/text()')
 
-    @property
+    @cached_property
     @first_element
     def _submitted_date(self):
-        return self.element.xpath('//a:SubmittedDate/text()', namespaces=namespaces)
+        return self.xpath('//a:SubmittedDate/text()')
 
-    @property
+    @cached_property
     @first_element
     def feed_processing_status(self):
-        return self.element.xpath('//a:FeedProcessingStatus/text()', namespaces=namespaces)
+        return self.xpath('//a:FeedProcessingStatus/text()')
 
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id, feed_contents, feed_type, mws_auth_token=None, marketplace_ids=('ATVPDKIKX0DER',), content_type='text/xml', purge=False):
         api = Feeds(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         purge = 'true' if purge else 'false'
         response = api.submit_feed(feed_contents, feed_type, marketplace_ids, content_type, purge)
-        err = ErrorResponse.load(response.original)
-        if err.message:
-            raise err
         with open('SubmitFeedResponse.xml', 'wb') as f:
             f.write(response.original)
-        return cls.load(response.original, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
+        return cls.from_response(response, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
@@ -1,3 +1,4 @@
 from listinboundshipments import ListInboundShipmentResponse
 from listinboundshipmentitems import ListInboundShipmentItemsResponse
 from getprepinstructionsforasin import GetPrepInstructionsForASINResponse
+from listinventorysupply import ListInventorySupplyResponse
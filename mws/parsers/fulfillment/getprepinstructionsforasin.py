@@ -1,6 +1,5 @@
-from mws.parsers.base import first_element, BaseElementWrapper, BaseResponseMixin
+from mws.parsers.base import first_element, BaseElementWrapper, BaseResponseMixin, cached_property
 from mws._mws import InboundShipments
-from mws.parsers.errors import ErrorResponse
 
 
 namespaces = {
@@ -10,49 +9,55 @@ namespaces = {
 
 class ASINPrepInstructions(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def asin(self):
-        return self.element.xpath('./a:ASIN/text()', namespaces=namespaces)
+        return self.xpath('./a:ASIN/text()')
 
-    @property
+    @cached_property
     @first_element
     def barcode_instruction(self):
-        return self.element.xpath('./a:BarcodeInstruction/text()', namespaces=namespaces)
+        return self.xpath('./a:BarcodeInstruction/text()')
 
-    @property
+    @cached_property
     @first_element
     def prep_guidance(self):
-        return self.element.xpath('./a:PrepGuidance/text()', namespaces=namespaces)
+        return self.xpath('./a:PrepGuidance/text()')
 
-    @property
+    @cached_property
     def prep_instruction_list(self):
         l = []
-        for elem in self.element.xpath('.//a:PrepInstructionList/a:PrepInstruction/text()', namespaces=namespaces):
+        for elem in self.xpath('.//a:PrepInstructionList/a:PrepInstruction/text()'):
             l.append(elem)
         return l
 
 
 class InvalidASIN(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def asin(self):
-        return self.element.xpath('./a:ASIN/text()', namespaces=namespaces)
+        return self.xpath('./a:ASIN/text()')
 
-    @property
+    @cached_property
     @first_element
     def error_reason(self):
-        return self.element.xpath('./a:ErrorReason/text()', namespaces=namespaces)
+        return self.xpath('./a:ErrorReason/text()')
 
 
 class GetPrepInstructionsForASINResponse(BaseElementWrapper, BaseResponseMixin):
 
+    namespaces = namespaces
+
     def asin_prep_instructions_list(self):
-        return [ASINPrepInstructions(x) for x in self.element.xpath('//a:ASINPrepInstructions', namespaces=namespaces)]
+        return [ASINPrepInstructions(x) for x in self.xpath('//a:ASINPrepInstructions')]
 
     def invalid_asin_list(self):
-        return [InvalidASIN(x) for x in self.element.xpath('//a:InvalidASIN', namespaces=namespaces)]
+        return [InvalidASIN(x) for x in self.xpath('//a:InvalidASIN')]
 
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id,
@@ -60,7 +65,4 @@ class GetPrepInstructionsForASINResponse(BaseElementWrapper, BaseResponseMixin):
         api = InboundShipments(access_key=mws_access_key, secret_key=mws_secret_key, account_id=mws_account_id,
                                auth_token=mws_auth_token)
         response = api.get_prep_instructions_for_asin(asin_list, ship_to_country_code)
-        err = ErrorResponse.load(response.original)
-        if err.message:
-            raise err
-        return cls.load(response.original, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
+        return cls.from_response(response, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
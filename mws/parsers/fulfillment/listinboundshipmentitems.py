@@ -1,4 +1,4 @@
-from mws.parsers.base import first_element, BaseElementWrapper, BaseResponseMixin
+from mws.parsers.base import first_element, BaseElementWrapper, BaseResponseMixin, cached_property
 from mws._mws import InboundShipments
 
 
@@ -9,64 +9,68 @@ namespaces = {
 
 class Member(BaseElementWrapper):
 
+    namespaces = namespaces
+
     def __init__(self, element):
         BaseElementWrapper.__init__(self, element)
 
-    @property
+    @cached_property
     @first_element
     def quantity_shipped(self):
-        return self.element.xpath('./a:QuantityShipped/text()', namespaces=namespaces)
+        return self.xpath('./a:QuantityShipped/text()')
 
-    @property
+    @cached_property
     @first_element
     def shipment_id(self):
-        return self.element.xpath('./a:ShipmentId/text()', namespaces=namespaces)
+        return self.xpath('./a:ShipmentId/text()')
 
-    @property
+    @cached_property
     @first_element
     def fulfillment_network_sku(self):
-        return self.element.xpath('./a:FulfillmentNetworkSKU/text()', namespaces=namespaces)
+        return self.xpath('./a:FulfillmentNetworkSKU/text()')
 
-    @property
+    @cached_property
     def asin(self):
         return self.fulfillment_network_sku
 
-    @property
+    @cached_property
     @first_element
     def seller_sku(self):
-        return self.element.xpath('./a:SellerSKU/text()', namespaces=namespaces)
+        return self.xpath('./a:SellerSKU/text()')
 
-    @property
+    @cached_property
     @first_element
     def quantity_received(self):
-        return self.element.xpath('./a:QuantityReceived/text()', namespaces=namespaces)
+        return self.xpath('./a:QuantityReceived/text()')
 
-    @property
+    @cached_property
     @first_element
     def quantity_in_case(self):
-        return self.element.xpath('./a:QuantityInCase/text()', namespaces=namespaces)
+        return self.xpath('./a:QuantityInCase/text()')
 
 
 class ListInboundShipmentItemsResponse(BaseElementWrapper, BaseResponseMixin):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     def shipment_items(self):
-        return [Member(x) for x in self.element.xpath('//a:member', namespaces=namespaces)]
+        return [Member(x) for x in self.xpath('//a:member')]
 
-    @property
+    @cached_property
     @first_element
     def next_token(self):
-        return self.element.xpath('//a:NextToken/text()', namespaces=namespaces)
+        return self.xpath('//a:NextToken/text()')
 
     @classmethod
     def from_next_token(cls, mws_access_key, mws_secret_key, mws_account_id, next_token, mws_auth_token=None):
         api = InboundShipments(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         response = api.list_inbound_shipment_items_by_next_token(next_token)
-        return cls.load(response.original)
+        return cls.from_response(response)
 
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id, shipment_id,
                 mws_auth_token=None, last_updated_after=None, last_updated_before=None):
         api = InboundShipments(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         response = api.list_inbound_shipment_items(shipment_id, last_updated_after, last_updated_before)
-        return cls.load(response.original)
+        return cls.from_response(response)
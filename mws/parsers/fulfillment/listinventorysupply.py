@@ -0,0 +1,74 @@
+from mws.parsers.base import first_element, BaseElementWrapper, BaseResponseMixin, cached_property
+from mws._mws import Inventory
+
+
+namespaces = {
+    'a': 'http://mws.amazonaws.com/FulfillmentInventory/2010-10-01/'
+}
+
+
+class InventorySupply(BaseElementWrapper):
+
+    namespaces = namespaces
+
+    @cached_property
+    @first_element
+    def seller_sku(self):
+        return self.xpath('./a:SellerSKU/text()')
+
+    @cached_property
+    @first_element
+    def asin(self):
+        return self.xpath('./a:ASIN/text()')
+
+    @cached_property
+    @first_element
+    def fnsku(self):
+        return self.xpath('./a:FNSKU/text()')
+
+    @cached_property
+    @first_element
+    def condition(self):
+        return self.xpath('./a:Condition/text()')
+
+    @cached_property
+    @first_element
+    def total_supply_quantity(self):
+        return self.xpath('./a:TotalSupplyQuantity/text()')
+
+    @cached_property
+    @first_element
+    def in_stock_supply_quantity(self):
+        return self.xpath('./a:InStockSupplyQuantity/text()')
+
+    @cached_property
+    @first_element
+    def earliest_availability(self):
+        return self.xpath('./a:EarliestAvailability/a:TimepointType/text()')
+
+
+class ListInventorySupplyResponse(BaseElementWrapper, BaseResponseMixin):
+
+    namespaces = namespaces
+
+    @cached_property
+    def inventory_supply_list(self):
+        return [InventorySupply(x) for x in self.xpath('//a:InventorySupplyList/a:member')]
+
+    @cached_property
+    @first_element
+    def next_token(self):
+        return self.xpath('//a:NextToken/text()')
+
+    @classmethod
+    def from_next_token(cls, mws_access_key, mws_secret_key, mws_account_id, next_token, mws_auth_token=None):
+        api = Inventory(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
+        response = api.list_inventory_supply_by_next_token(next_token)
+        return cls.from_response(response)
+
+    @classmethod
+    def request(cls, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token=None,
+                skus=(), query_start_datetime=None, response_group='Basic'):
+        api = Inventory(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
+        response = api.list_inventory_supply(skus, query_start_datetime, response_group)
+        return cls.from_response(response)
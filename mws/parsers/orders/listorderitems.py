@@ -1,6 +1,6 @@
 import datetime
 
-from mws.parsers.base import BaseResponseMixin, BaseElementWrapper, first_element
+from mws.parsers.base import BaseResponseMixin, BaseElementWrapper, first_element, cached_property
 from mws import Orders
 
 namespaces = {
@@ -10,82 +10,86 @@ namespaces = {
 
 class OrderItem(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def quantity_ordered(self):
-        return self.element.xpath('./a:QuantityOrdered/text()', namespaces=namespaces)
+        return self.xpath('./a:QuantityOrdered/text()')
 
-    @property
+    @cached_property
     @first_element
     def title(self):
-        return self.element.xpath('./a:Title/text()', namespaces=namespaces)
+        return self.xpath('./a:Title/text()')
 
-    @property
+    @cached_property
     @first_element
     def promotion_discount(self):
-        return self.element.xpath('./a:PromotionDiscount/a:Amount/text()', namespaces=namespaces)
+        return self.xpath('./a:PromotionDiscount/a:Amount/text()')
 
-    @property
+    @cached_property
     @first_element
     def currency_code(self):
-        return self.element.xpath('./a:PromotionDiscount/a:CurrencyCode/text()', namespaces=namespaces)
+        return self.xpath('./a:PromotionDiscount/a:CurrencyCode/text()')
 
-    @property
+    @cached_property
     @first_element
     def asin(self):
-        return self.element.xpath('./a:ASIN/text()', namespaces=namespaces)
+        return self.xpath('./a:ASIN/text()')
 
-    @property
+    @cached_property
     @first_element
     def seller_sku(self):
-        return self.element.xpath('./a:SellerSKU/text()', namespaces=namespaces)
+        return self.xpath('./a:SellerSKU/text()')
 
-    @property
+    @cached_property
     @first_element
     def order_item_id(self):
-        return self.element.xpath('./a:OrderItemId/text()', namespaces=namespaces)
+        return self.xpath('./a:OrderItemId/text()')
 
-    @property
+    @cached_property
     @first_element
     def quantity_shipped(self):
-        return self.element.xpath('./a:QuantityShipped/text()', namespaces=namespaces)
+        return self.xpath('./a:QuantityShipped/text()')
 
-    @property
+    @cached_property
     @first_element
     def item_price(self):
-        return self.element.xpath('./a:ItemPrice/a:Amount/text()', namespaces=namespaces)
+        return self.xpath('./a:ItemPrice/a:Amount/text()')
 
-    @property
+    @cached_property
     @first_element
     def item_tax(self):
-        return self.element.xpath('./a:ItemTax/a:Amount/text()', namespaces=namespaces)
+        return self.xpath('./a:ItemTax/a:Amount/text()')
 
 
 class ListOrderItemsResponse(BaseElementWrapper, BaseResponseMixin):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def next_token(self):
-        return self.element.xpath('//a:NextToken/text()', namespaces=namespaces)
+        return self.xpath('//a:NextToken/text()')
 
-    @property
+    @cached_property
     @first_element
     def amazon_order_id(self):
-        return self.element.xpath('//a:AmazonOrderId/text()', namespaces=namespaces)
+        return self.xpath('//a:AmazonOrderId/text()')
 
-    @property
+    @cached_property
     def order_items(self):
-        return [OrderItem(x) for x in self.element.xpath('//a:OrderItem', namespaces=namespaces)]
+        return [OrderItem(x) for x in self.xpath('//a:OrderItem')]
 
     @classmethod
     def from_next_token(cls, mws_access_key, mws_secret_key, mws_account_id, next_token, mws_auth_token=None):
         api = Orders(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         response = api.list_order_items_by_next_token(next_token)
-        return cls.load(response.original)
+        return cls.from_response(response)
 
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id, amazon_order_id,
                 mws_auth_token=None):
         api = Orders(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         response = api.list_order_items(amazon_order_id)
-        return cls.load(response.original)
+        return cls.from_response(response)
@@ -1,8 +1,7 @@
 import re
 
-from dateutil import parser
-
-from mws.parsers.base import BaseResponseMixin, BaseElementWrapper, first_element
+from mws.parsers.base import BaseResponseMixin, BaseElementWrapper, first_element, cached_property
+from mws.utils import parse_timestamp
 from mws import Orders
 
 namespaces = {
@@ -84,165 +83,167 @@ def mk_ship_state(state_value):
 
 class Order(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def _latest_ship_date(self):
-        return self.element.xpath('./a:LatestShipDate/text()', namespaces=namespaces)
+        return self.xpath('./a:LatestShipDate/text()')
 
-    @property
+    @cached_property
     def latest_ship_date(self):
         if self._latest_ship_date:
-            return parser.parse(self._latest_ship_date)
+            return parse_timestamp(self._latest_ship_date)
         return
 
-    @property
+    @cached_property
     @first_element
     def order_type(self):
-        return self.element.xpath('./a:OrderType/text()', namespaces=namespaces)
+        return self.xpath('./a:OrderType/text()')
 
-    @property
+    @cached_property
     @first_element
     def _purchase_date(self):
-        return self.element.xpath('./a:PurchaseDate/text()', namespaces=namespaces)
+        return self.xpath('./a:PurchaseDate/text()')
 
-    @property
+    @cached_property
     def purchase_date(self):
         if self._purchase_date:
-            return parser.parse(self._purchase_date)
+            return parse_timestamp(self._purchase_date)
         return
 
-    @property
+    @cached_property
     @first_element
     def buyer_email(self):
-        return self.element.xpath('./a:BuyerEmail/text()', namespaces=namespaces)
+        return self.xpath('./a:BuyerEmail/text()')
 
-    @property
+    @cached_property
     @first_element
     def amazon_order_id(self):
-        return self.element.xpath('./a:AmazonOrderId/text()', namespaces=namespaces)
+        return self.xpath('./a:AmazonOrderId/text()')
 
-    @property
+    @cached_property
     @first_element
     def _last_update_date(self):
-        return self.element.xpath('./a:LastUpdateDate/text()', namespaces=namespaces)
+        return self.xpath('./a:LastUpdateDate/text()')
 
-    @property
+    @cached_property
     def last_update_date(self):
         if self._last_update_date:
-            return parser.parse(self._last_update_date)
+            return parse_timestamp(self._last_update_date)
         return
 
-    @property
+    @cached_property
     @first_element
     def number_of_items_shipped(self):
-        return self.element.xpath('./a:NumberOfItemsShipped/text()', namespaces=namespaces)
+        return self.xpath('./a:NumberOfItemsShipped/text()')
 
-    @property
+    @cached_property
     @first_element
     def ship_service_level(self):
-        return self.element.xpath('./a:ShipServiceLevel/text()', namespaces=namespaces)
+        return self.xpath('./a:ShipServiceLevel/text()')
 
-    @property
+    @cached_property
     @first_element
     def order_status(self):
-        return self.element.xpath('./a:OrderStatus/text()', namespaces=namespaces)
+        return self.xpath('./a:OrderStatus/text()')
 
-    @property
+    @cached_property
     @first_element
     def sales_channel(self):
-        return self.element.xpath('./a:SalesChannel/text()', namespaces=namespaces)
+        return self.xpath('./a:SalesChannel/text()')
 
-    @property
+    @cached_property
     @first_element
     def _is_business_order(self):
-        return self.element.xpath('./a:IsBusinessOrder/text()', namespaces=namespaces)
+        return self.xpath('./a:IsBusinessOrder/text()')
 
-    @property
+    @cached_property
     def is_business_order(self):
         return self._is_business_order == 'true'
 
-    @property
+    @cached_property
     @first_element
     def number_of_items_unshipped(self):
-        return self.element.xpath('./a:NumberOfItemsUnshipped/text()', namespaces=namespaces)
+        return self.xpath('./a:NumberOfItemsUnshipped/text()')
 
-    @property
+    @cached_property
     @first_element
     def buyer_name(self):
-        return self.element.xpath('./a:BuyerName/text()', namespaces=namespaces)
+        return self.xpath('./a:BuyerName/text()')
 
-    @property
+    @cached_property
     @first_element
     def currency_code(self):
-        return self.element.xpath('./a:OrderTotal/a:CurrencyCode/text()', namespaces=namespaces)
+        return self.xpath('./a:OrderTotal/a:CurrencyCode/text()')
 
-    @property
+    @cached_property
     @first_element
     def order_total(self):
-        return self.element.xpath('./a:OrderTotal/a:Amount/text()', namespaces=namespaces)
+        return self.xpath('./a:OrderTotal/a:Amount/text()')
 
-    @property
+    @cached_property
     @first_element
     def _is_premium_order(self):
-        return self.element.xpath('./a:IsPremiumOrder/text()', namespaces=namespaces)
+        return self.xpath('./a:IsPremiumOrder/text()')
 
-    @property
+    @cached_property
     def is_premium_order(self):
         return self._is_premium_order == 'true'
 
-    @property
+    @cached_property
     @first_element
     def _earliest_ship_date(self):
-        return self.element.xpath('./a:EarliestShipDate/text()', namespaces=namespaces)
+        return self.xpath('./a:EarliestShipDate/text()')
 
-    @property
+    @cached_property
     def earliest_ship_date(self):
         if self._earliest_ship_date:
-            return parser.parse(self._earliest_ship_date)
+            return parse_timestamp(self._earliest_ship_date)
         return
 
-    @property
+    @cached_property
     @first_element
     def marketplace_id(self):
-        return self.element.xpath('./a:MarketplaceId/text()', namespaces=namespaces)
+        return self.xpath('./a:MarketplaceId/text()')
 
-    @property
+    @cached_property
     @first_element
     def fulfillment_channel(self):
-        return self.element.xpath('./a:FulfillmentChannel/text()', namespaces=namespaces)
+        return self.xpath('./a:FulfillmentChannel/text()')
 
-    @property
+    @cached_property
     @first_element
     def payment_method(self):
-        return self.element.xpath('./a:PaymentMethod/text()', namespaces=namespaces)
+        return self.xpath('./a:PaymentMethod/text()')
 
-    @property
+    @cached_property
     @first_element
     def _is_prime(self):
-        return self.element.xpath('./a:IsPrime/text()', namespaces=namespaces)
+        return self.xpath('./a:IsPrime/text()')
 
-    @property
+    @cached_property
     def is_prime(self):
         return self._is_prime == 'true'
 
-    @property
+    @cached_property
     @first_element
     def shipment_service_level_category(self):
-        return self.element.xpath('./a:ShipmentServiceLevelCategory/text()', namespaces=namespaces)
+        return self.xpath('./a:ShipmentServiceLevelCategory/text()')
 
-    @property
+    @cached_property
     @first_element
     def seller_order_id(self):
-        return self.element.xpath('./a:SellerOrderId/text()', namespaces=namespaces)
+        return self.xpath('./a:SellerOrderId/text()')
 
     # Address Stuff
 
-    @property
+    @cached_property
     @first_element
     def state_or_region(self):
-        return self.element.xpath('./a:ShippingAddress/a:StateOrRegion/text()', namespaces=namespaces)
+        return self.xpath('./a:ShippingAddress/a:StateOrRegion/text()')
 
-    @property
+    @cached_property
     def ship_state_abbreviation(self):
         """
         Convert the value in state_or_region to a state abbreviation. (ex. Massachusets -> MA)
@@ -252,58 +253,60 @@ class Order(BaseElementWrapper):
             return mk_ship_state(self.state_or_region)
         return
 
-    @property
+    @cached_property
     @first_element
     def city(self):
-        return self.element.xpath('./a:ShippingAddress/a:City/text()', namespaces=namespaces)
+        return self.xpath('./a:ShippingAddress/a:City/text()')
 
-    @property
+    @cached_property
     @first_element
     def phone(self):
-        return self.element.xpath('./a:ShippingAddress/a:Phone/text()', namespaces=namespaces)
+        return self.xpath('./a:ShippingAddress/a:Phone/text()')
 
-    @property
+    @cached_property
     @first_element
     def country_code(self):
-        return self.element.xpath('./a:ShippingAddress/a:CountryCode/text()', namespaces=namespaces)
+        return self.xpath('./a:ShippingAddress/a:CountryCode/text()')
 
-    @property
+    @cached_property
     @first_element
     def postal_code(self):
-        return self.element.xpath('./a:ShippingAddress/a:PostalCode/text()', namespaces=namespaces)
+        return self.xpath('./a:ShippingAddress/a:PostalCode/text()')
 
-    @property
+    @cached_property
     @first_element
     def name(self):
-        return self.element.xpath('./a:ShippingAddress/a:Name/text()', namespaces=namespaces)
+        return self.xpath('./a:ShippingAddress/a:Name/text()')
 
-    @property
+    @cached_property
     @first_element
     def address_line_1(self):
-        return self.element.xpath('./a:ShippingAddress/a:AddressLine1/text()', namespaces=namespaces)
+        return self.xpath('./a:ShippingAddress/a:AddressLine1/text()')
 
-    @property
+    @cached_property
     @first_element
     def address_line_2(self):
-        return self.element.xpath('./a:ShippingAddress/a:AddressLine2/text()', namespaces=namespaces)
+        return self.xpath('./a:ShippingAddress/a:AddressLine2/text()')
 
 
 class ListOrdersResponse(BaseElementWrapper, BaseResponseMixin):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def next_token(self):
-        return self.element.xpath('//a:NextToken/text()', namespaces=namespaces)
+        return self.xpath('//a:NextToken/text()')
 
-    @property
+    @cached_property
     def orders(self):
-        return [Order(x) for x in self.element.xpath('//a:Order', namespaces=namespaces)]
+        return [Order(x) for x in self.xpath('//a:Order')]
 
     @classmethod
     def from_next_token(cls, mws_access_key, mws_secret_key, mws_account_id, next_token, mws_auth_token=None):
         api = Orders(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         response = api.list_orders_by_next_token(next_token)
-        return cls.load(response.original)
+        return cls.from_response(response)
 
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id, marketplace_ids,
@@ -313,4 +316,4 @@ class ListOrdersResponse(BaseElementWrapper, BaseResponseMixin):
                 mws_auth_token=None):
         api = Orders(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         response = api.list_orders(marketplace_ids, created_after, created_before, lastupdatedafter, lastupdatedbefore, orderstatus, fulfillment_channels, payment_methods, buyer_email, seller_orderid, max_results)
-        return cls.load(response.original)
+        return cls.from_response(response)
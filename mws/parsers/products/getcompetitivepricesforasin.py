@@ -1,4 +1,4 @@
-from ..base import BaseElementWrapper, BaseResponseMixin, first_element, first_element_or_none
+from ..base import BaseElementWrapper, BaseResponseMixin, first_element, first_element_or_none, cached_property
 from ..errors import ProductError
 import mws
 
@@ -15,9 +15,11 @@ namespaces = {
 
 class CompetitivePriceElement(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     def belongs_to_requester(self):
-        data = first_element_or_none(self.element.xpath('./@belongsToRequester', namespaces=namespaces))
+        data = first_element_or_none(self.xpath('./@belongsToRequester'))
         if not data:
             return
         if data == 'true':
@@ -25,80 +27,84 @@ class CompetitivePriceElement(BaseElementWrapper):
         else:
             return False
 
-    @property
+    @cached_property
     @first_element
     def condition(self):
-        return self.element.xpath('./@condition', namespaces=namespaces)
+        return self.xpath('./@condition')
 
-    @property
+    @cached_property
     @first_element
     def subcondition(self):
-        return self.element.xpath('./@subcondition', namespaces=namespaces)
+        return self.xpath('./@subcondition')
 
-    @property
+    @cached_property
     @first_element
     def landed_price(self):
-        return self.element.xpath('./a:Price/a:LandedPrice/a:Amount/text()', namespaces=namespaces)
+        return self.xpath('./a:Price/a:LandedPrice/a:Amount/text()')
 
-    @property
+    @cached_property
     @first_element
     def listing_price(self):
-        return self.element.xpath('./a:Price/a:ListingPrice/a:Amount/text()', namespaces=namespaces)
+        return self.xpath('./a:Price/a:ListingPrice/a:Amount/text()')
 
-    @property
+    @cached_property
     @first_element
     def shipping(self):
-        return self.element.xpath('./a:Price/a:Shipping/a:Amount/text()', namespaces=namespaces)
+        return self.xpath('./a:Price/a:Shipping/a:Amount/text()')
 
 
 class GetCompetitivePricingForAsinProduct(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def asin(self):
-        return self.element.xpath('./a:Identifiers/a:MarketplaceASIN/a:ASIN/text()', namespaces=namespaces)
+        return self.xpath('./a:Identifiers/a:MarketplaceASIN/a:ASIN/text()')
 
-    @property
+    @cached_property
     @first_element
     def marketplace_id(self):
-        return self.element.xpath('./a:Identifiers/a:MarketplaceASIN/a:MarketplaceId/text()', namespaces=namespaces)
+        return self.xpath('./a:Identifiers/a:MarketplaceASIN/a:MarketplaceId/text()')
 
-    @property
+    @cached_property
     def sales_rankings(self):
-        rankings = self.element.xpath('./a:SalesRankings/a:SalesRank', namespaces=namespaces)
+        rankings = self.xpath('./a:SalesRankings/a:SalesRank')
         ranks = []
         for ranking in rankings:
-            pcid = first_element_or_none(ranking.xpath('./a:ProductCategoryId/text()', namespaces=namespaces))
-            r = first_element_or_none(ranking.xpath('./a:Rank/text()', namespaces=namespaces))
+            pcid = first_element_or_none(self.xpath('./a:ProductCategoryId/text()', ranking))
+            r = first_element_or_none(self.xpath('./a:Rank/text()', ranking))
             ranks.append((pcid, r))
         return ranks
 
-    @property
+    @cached_property
     def competitive_prices(self):
-        return [CompetitivePriceElement(x) for x in self.element.xpath('./a:CompetitivePricing/a:CompetitivePrices/a:CompetitivePrice', namespaces=namespaces)]
+        return [CompetitivePriceElement(x) for x in self.xpath('./a:CompetitivePricing/a:CompetitivePrices/a:CompetitivePrice')]
 
 
 class GetCompetitivePricingForAsinResult(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def asin(self):
-        return self.element.xpath('./@ASIN')
+        return self.xpath('./@ASIN')
 
-    @property
+    @cached_property
     @first_element
     def status(self):
-        return self.element.xpath('./@status')
+        return self.xpath('./@status')
 
-    @property
+    @cached_property
     def products(self):
         """
         :rtype: list[GetCompetitivePricingForAsinProduct]
         :return:
         """
-        return [GetCompetitivePricingForAsinProduct(x) for x in self.element.xpath('.//a:Product', namespaces=namespaces)]
+        return [GetCompetitivePricingForAsinProduct(x) for x in self.xpath('.//a:Product')]
 
-    @property
+    @cached_property
     def error(self):
         """
         Return mws error instance which can be raised if necessary.
@@ -114,7 +120,7 @@ class GetCompetitivePricingForAsinResult(BaseElementWrapper):
             >>>         raise result.error
         :return:
         """
-        x = first_element_or_none(self.element.xpath('./a:Error', namespaces=namespaces))
+        x = first_element_or_none(self.xpath('./a:Error'))
         if x is None:
             return
         return ProductError(x, self.asin)
@@ -130,9 +136,11 @@ class GetCompetitivePricingForAsinResult(BaseElementWrapper):
 
 class GetCompetitivePricingForAsinResponse(BaseElementWrapper, BaseResponseMixin):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     def competitive_pricing_for_asin_results(self):
-        return [GetCompetitivePricingForAsinResult(x) for x in self.element.xpath('.//a:GetCompetitivePricingForASINResult', namespaces=namespaces)]
+        return [GetCompetitivePricingForAsinResult(x) for x in self.xpath('.//a:GetCompetitivePricingForASINResult')]
 
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id,
@@ -149,4 +157,4 @@ class GetCompetitivePricingForAsinResponse(BaseElementWrapper, BaseResponseMixin
         """
         products_api = mws.Products(mws_access_key, mws_secret_key, mws_account_id)
         response = products_api.get_competitive_pricing_for_asin(mws_marketplace_id, asins=asins)
-        return cls.load(response.original)
+        return cls.from_response(response)
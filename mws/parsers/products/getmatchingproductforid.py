@@ -1,4 +1,4 @@
-from ..base import BaseElementWrapper, BaseResponseMixin, first_element, first_element_or_none
+from ..base import BaseElementWrapper, BaseResponseMixin, first_element, first_element_or_none, cached_property
 from ..errors import ProductError
 import mws
 
@@ -15,68 +15,70 @@ namespaces = {
 
 class GetMatchingProductForIdProduct(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def _marketplace_asin(self):
-        return self.element.xpath('./a:/Identifiers/a:MarketplaceASIN', namespaces=namespaces)
+        return self.xpath('./a:/Identifiers/a:MarketplaceASIN')
 
-    @property
+    @cached_property
     @first_element
     def marketplace_id(self):
-        return self.element.xpath('./a:Identifiers/a:MarketplaceASIN/a:MarketplaceId/text()', namespaces=namespaces)
+        return self.xpath('./a:Identifiers/a:MarketplaceASIN/a:MarketplaceId/text()')
 
-    @property
+    @cached_property
     @first_element
     def asin(self):
-        return self.element.xpath('./a:Identifiers/a:MarketplaceASIN/a:ASIN/text()', namespaces=namespaces)
+        return self.xpath('./a:Identifiers/a:MarketplaceASIN/a:ASIN/text()')
 
-    @property
+    @cached_property
     @first_element
     def product_group(self):
-        return self.element.xpath('./a:AttributeSets/b:ItemAttributes/b:ProductGroup/text()', namespaces=namespaces)
+        return self.xpath('./a:AttributeSets/b:ItemAttributes/b:ProductGroup/text()')
 
-    @property
+    @cached_property
     @first_element
     def product_type_name(self):
-        return self.element.xpath('./a:AttributeSets/b:ItemAttributes/b:ProductTypeName/text()', namespaces=namespaces)
+        return self.xpath('./a:AttributeSets/b:ItemAttributes/b:ProductTypeName/text()')
 
-    @property
+    @cached_property
     @first_element
     def title(self):
-        return self.element.xpath('./a:AttributeSets/b:ItemAttributes/b:Title/text()', namespaces=namespaces)
+        return self.xpath('./a:AttributeSets/b:ItemAttributes/b:Title/text()')
 
-    @property
+    @cached_property
     @first_element
     def weight(self):
-        return self.element.xpath('./a:AttributeSets/b:ItemAttributes/b:PackageDimensions/b:Weight/text()', namespaces=namespaces)
+        return self.xpath('./a:AttributeSets/b:ItemAttributes/b:PackageDimensions/b:Weight/text()')
 
-    @property
+    @cached_property
     @first_element
     def part_number(self):
-        return self.element.xpath('./a:AttributeSets/b:ItemAttributes/b:PartNumber/text()', namespaces=namespaces)
+        return self.xpath('./a:AttributeSets/b:ItemAttributes/b:PartNumber/text()')
 
-    @property
+    @cached_property
     @first_element
     def model(self):
-        return self.element.xpath('./a:AttributeSets/b:ItemAttributes/b:Model/text()', namespaces=namespaces)
+        return self.xpath('./a:AttributeSets/b:ItemAttributes/b:Model/text()')
 
-    @property
+    @cached_property
     @first_element
     def color(self):
-        return self.element.xpath('./a:AttributeSets/b:ItemAttributes/b:Color/text()', namespaces=namespaces)
+        return self.xpath('./a:AttributeSets/b:ItemAttributes/b:Color/text()')
 
     # ToDo: Add attribute sets and included children
 
     # ToDo: Add relationships and included children
 
-    @property
+    @cached_property
     def sales_rankings(self):
-        rankings = self.element.xpath('.//a:SalesRankings/a:SalesRank', namespaces=namespaces)
+        rankings = self.xpath('.//a:SalesRankings/a:SalesRank')
         if rankings:
             data = []
             for rank in rankings:
-                pcid = first_element_or_none(rank.xpath('./a:ProductCategoryId/text()', namespaces=namespaces))
-                r = first_element_or_none(rank.xpath('./a:Rank/text()', namespaces=namespaces))
+                pcid = first_element_or_none(self.xpath('./a:ProductCategoryId/text()', rank))
+                r = first_element_or_none(self.xpath('./a:Rank/text()', rank))
                 d = (pcid, r)
                 data.append(d)
             return data
@@ -85,30 +87,32 @@ class GetMatchingProductForIdProduct(BaseElementWrapper):
 
 class GetMatchingProductForIdResult(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def identifier(self):
         """
         Typically UPC, EAN, or ISBN
         :return:
         """
-        return self.element.xpath('./@Id')
+        return self.xpath('./@Id')
 
-    @property
+    @cached_property
     @first_element
     def id_type(self):
-        return self.element.xpath('./@IdType')
+        return self.xpath('./@IdType')
 
-    @property
+    @cached_property
     @first_element
     def status(self):
-        return self.element.xpath('./@status')
+        return self.xpath('./@status')
 
-    @property
+    @cached_property
     def products(self):
-        return [GetMatchingProductForIdProduct(x) for x in self.element.xpath('.//a:Products/a:Product', namespaces=namespaces)]
+        return [GetMatchingProductForIdProduct(x) for x in self.xpath('.//a:Products/a:Product')]
 
-    @property
+    @cached_property
     def error(self):
         """
         Return mws error instance which can be raised if necessary.
@@ -124,7 +128,7 @@ class GetMatchingProductForIdResult(BaseElementWrapper):
             >>>         raise result.error
         :return:
         """
-        x = first_element_or_none(self.element.xpath('./a:Error', namespaces=namespaces))
+        x = first_element_or_none(self.xpath('./a:Error'))
         if x is None:
             return
         return ProductError(x, self.identifier)
@@ -140,9 +144,11 @@ class GetMatchingProductForIdResult(BaseElementWrapper):
 
 class GetMatchingProductForIdResponse(BaseElementWrapper, BaseResponseMixin):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     def matching_product_for_id_results(self):
-        return [GetMatchingProductForIdResult(x) for x in self.element.xpath('//a:GetMatchingProductForIdResult', namespaces=namespaces)]
+        return [GetMatchingProductForIdResult(x) for x in self.xpath('//a:GetMatchingProductForIdResult')]
 
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id,
@@ -160,4 +166,4 @@ class GetMatchingProductForIdResponse(BaseElementWrapper, BaseResponseMixin):
         """
         products_api = mws.Products(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         response = products_api.get_matching_product_for_id(mws_marketplace_id, id_type, ids)
-        return cls.load(response.original)
\ No newline at end of file
+        return cls.from_response(response)
\ No newline at end of file
@@ -1 +1,4 @@
-from requestreport import RequestReportResponse
+from requestreport import RequestReportResponse, FlatFileWrapper
+from flatfile import FlatFileReader
+from columns import DictionaryArray
+from parallel import ParallelFlatFile
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Typed numpy arrays of flat file report columns, see `FlatFileWrapper.to_numpy`.
+
+numpy is an optional dependency (`pip install python-amazon-mws[numpy]`), only needed to build the arrays.
+
+usage:
+
+>>> columns = FlatFileWrapper.stream(path, convert_numerical=True, report_type=report_type).to_numpy()
+>>> skus = columns['sku']
+>>> fees_per_sku = numpy.bincount(skus.codes[skus.codes >= 0], weights=columns['amount'][skus.codes >= 0])
+>>> dict(zip(skus.categories, fees_per_sku))
+"""
+import datetime
+
+from dateutil.tz import tzutc
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import schemas
+
+__all__ = [
+    'DictionaryArray',
+    'ColumnBuilder',
+    'to_arrays',
+]
+
+DATETIME_DTYPE = 'datetime64[us]'
+EPOCH = datetime.datetime(1970, 1, 1)
+EPOCH_UTC = EPOCH.replace(tzinfo=tzutc())
+# int64 value of numpy's NaT.
+NAT = -2 ** 63
+
+
+class DictionaryArray(object):
+    """
+    Dictionary encoded text column: every row holds the index of its value in `categories`.
+
+    Grouping and counting by the column work on the int `codes` instead of the strings, ie.
+    `numpy.bincount(column.codes[column.codes >= 0])` counts the rows of every category.
+    """
+
+    def __init__(self, codes, categories):
+        """
+        :param codes: int32 array, -1 for empty cells.
+        :param categories: Object array of the distinct values in order of appearance.
+        """
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self):
+        return len(self.codes)
+
+    def decode(self):
+        """
+        Return the column as an object array of its values, None for empty cells.
+        """
+        values = numpy.empty(len(self.codes), dtype=object)
+        present = self.codes >= 0
+        values[present] = self.categories[self.codes[present]]
+        return values
+
+    def __repr__(self):
+        return 'DictionaryArray(%d rows, %d categories)' % (len(self.codes), len(self.categories))
+
+
+def require_numpy():
+    if numpy is None:
+        raise ImportError('numpy is required for the numpy output of flat file reports: pip install numpy')
+
+
+def _microseconds(dt):
+    # Microseconds since the epoch, naive datetimes are taken as UTC.
+    if dt is None:
+        return NAT
+    delta = dt - (EPOCH if dt.tzinfo is None else EPOCH_UTC)
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _encode(values, index):
+    # Codes of `values` in `index` (value: code, seeded with None: -1), adding the new values to it.
+    return numpy.fromiter((index.setdefault(x, len(index) - 1) for x in values), numpy.int32, len(values))
+
+
+def _categories(index):
+    categories = numpy.empty(len(index) - 1, dtype=object)
+    for value, code in index.iteritems():
+        if code >= 0:
+            categories[code] = value
+    return categories
+
+
+def dictionary_encode(values):
+    """
+    Return a DictionaryArray of a list of values.
+    """
+    require_numpy()
+    index = {None: -1}
+    codes = _encode(values, index)
+    return DictionaryArray(codes, _categories(index))
+
+
+def to_array(values, column_type):
+    """
+    Convert the values of a column to a numpy array according to its type.
+
+    INTEGER columns become int64 arrays, or float64 with NaN for the empty cells when there are any.
+    FLOAT columns become float64 with NaN, DATETIME columns datetime64 in UTC with NaT, TEXT columns a
+    DictionaryArray and columns of mixed types an object array.
+    :param values: List of the converted cells of the column.
+    :param column_type: Type from `schemas`, `FlatFileWrapper.MIXED` or None for a column which was always empty.
+    """
+    require_numpy()
+    if column_type in (schemas.INTEGER, schemas.FLOAT):
+        if column_type == schemas.INTEGER and None not in values:
+            return numpy.array(values, dtype=numpy.int64)
+        return numpy.array([numpy.nan if x is None else x for x in values], dtype=numpy.float64)
+    if column_type == schemas.DATETIME:
+        # Much faster than letting numpy convert the datetime objects.
+        return numpy.fromiter((_microseconds(x) for x in values), numpy.int64, len(values)).view(DATETIME_DTYPE)
+    if column_type in (schemas.TEXT, None):
+        return dictionary_encode(values)
+    array = numpy.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def to_arrays(columns, types):
+    """
+    Convert the lists of `FlatFileWrapper.to_columns` to numpy arrays, in place.
+
+    Each list is released as soon as it's converted to limit the peak memory.
+    :param columns: OrderedDict of header: list of values.
+    :param types: Type of every column, in the same order.
+    :return: `columns`
+    """
+    require_numpy()
+    for name, column_type in zip(columns.keys(), types):
+        columns[name] = to_array(columns[name], column_type)
+    return columns
+
+
+class ColumnBuilder(object):
+    """
+    Typed numpy array of a column built from batches of its values, so that the values of a whole report are
+    never held in python lists at once. The result is the same as `to_array` of all the values.
+
+    The type of a column can change while the report is read: from None to the type inferred from its first
+    non empty cell, and from any type to `FlatFileWrapper.MIXED` when a cell doesn't fit. The chunks built
+    before are then converted back to python values, the datetimes with the timezone of the column's first one.
+    """
+
+    def __init__(self):
+        self.column_type = None
+        # Arrays, or the number of rows of the batches appended while the type was unknown (all empty).
+        self.chunks = []
+        # value: code of TEXT columns, shared by all the chunks.
+        self._index = {None: -1}
+        # Epoch of the datetimes of a DATETIME column, naive or UTC like its first value.
+        self._epoch = None
+
+    def append(self, values, column_type):
+        """
+        Convert a batch of the converted cells of the column.
+
+        :param column_type: Type of the column after reading the batch.
+        """
+        if column_type != self.column_type:
+            self._retype(column_type)
+        if column_type is None:
+            self.chunks.append(len(values))
+        elif column_type == schemas.TEXT:
+            self.chunks.append(_encode(values, self._index))
+        elif column_type == schemas.DATETIME:
+            if self._epoch is None:
+                first = next((x for x in values if x is not None), None)
+                if first is not None:
+                    self._epoch = EPOCH if first.tzinfo is None else EPOCH_UTC
+            self.chunks.append(to_array(values, column_type))
+        else:
+            self.chunks.append(to_array(values, column_type))
+
+    def append_empty(self, rows):
+        """
+        Add `rows` empty cells, ie. for the lines read before the column showed up.
+        """
+        if not rows:
+            # An empty chunk would still turn an int64 column to float64.
+            return
+        if self.column_type is None:
+            self.chunks.append(rows)
+        else:
+            self.chunks.append(self._empty(rows))
+
+    def _retype(self, column_type):
+        if self.column_type is not None:
+            # Only a typed column turning MIXED.
+            self.chunks = [x if isinstance(x, (int, long)) else self._objects(x) for x in self.chunks]
+            self._index = {None: -1}
+        self.column_type = column_type
+
+    def _objects(self, chunk):
+        # Object array of the python values of a chunk of the current type.
+        values = numpy.empty(len(chunk), dtype=object)
+        if self.column_type == schemas.TEXT:
+            values[:] = DictionaryArray(chunk, _categories(self._index)).decode()
+        elif self.column_type == schemas.DATETIME:
+            values[:] = [None if x == NAT else self._epoch + datetime.timedelta(microseconds=x)
+                         for x in chunk.view(numpy.int64).tolist()]
+        elif chunk.dtype == numpy.float64:
+            cast = int if self.column_type == schemas.INTEGER else float
+            values[:] = [None if x != x else cast(x) for x in chunk.tolist()]
+        else:
+            values[:] = chunk.tolist()
+        return values
+
+    def _empty(self, rows):
+        if self.column_type in (schemas.INTEGER, schemas.FLOAT):
+            return numpy.full(rows, numpy.nan)
+        if self.column_type == schemas.DATETIME:
+            return numpy.full(rows, NAT, numpy.int64).view(DATETIME_DTYPE)
+        if self.column_type in (schemas.TEXT, None):
+            return numpy.full(rows, -1, numpy.int32)
+        # Filled with None.
+        return numpy.empty(rows, dtype=object)
+
+    def finish(self, column_type):
+        """
+        Return the array of the column, a DictionaryArray for TEXT columns and the ones which were always empty.
+
+        :param column_type: Type of the column once the whole report is read, ie. the schema type of a column
+            no line had a cell for.
+        """
+        if column_type != self.column_type:
+            self._retype(column_type)
+        chunks = [self._empty(x) if isinstance(x, (int, long)) else x for x in self.chunks]
+        self.chunks = []
+        if not chunks:
+            array = self._empty(0) if self.column_type in (schemas.TEXT, None) else to_array([], self.column_type)
+        else:
+            array = chunks[0] if len(chunks) == 1 else numpy.concatenate(chunks)
+        if self.column_type in (schemas.TEXT, None):
+            return DictionaryArray(array, _categories(self._index))
+        return array
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Constant memory reading of tab separated flat file reports.
+
+`FlatFileReader` reads a report from a file path, a file object or any iterable of byte chunks
+(ie. the `StreamWrapper` returned by `Reports.stream_report`) and yields its lines one at a time,
+so only a chunk and the line being assembled are ever held in memory.
+
+usage:
+
+>>> reader = FlatFileReader(api.stream_report(report_id))
+>>> print reader.headers
+>>> for line in reader:
+>>>     process(line.split(u'\\t'))
+"""
+import re
+import codecs
+
+__all__ = [
+    'FlatFileReader',
+    'AUTO',
+]
+
+CHUNK_SIZE = 64 * 1024
+
+# Detect the encoding from the byte order mark or the charset of the response, see `FlatFileReader`.
+AUTO = 'auto'
+
+# Encoding of reports which have neither a byte order mark nor a charset. It's what amazon uses for
+# the flat files of the north american and european marketplaces.
+DEFAULT_ENCODING = 'cp1252'
+
+# Java charset names amazon sends in the Content-Type of reports which python calls differently.
+CHARSET_ALIASES = {
+    'windows-31j': 'cp932',
+}
+
+# Checked in order, the UTF-32 marks start with the UTF-16 ones.
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+CHARSET_RE = re.compile(r'charset\s*=\s*"?([^\s;"]+)', re.I)
+
+
+def iter_chunks(source, chunk_size=CHUNK_SIZE):
+    """
+    Generator yielding the bytes of `source` in chunks.
+
+    :param source: Path of a file, file object opened in binary mode or iterable of byte strings.
+    """
+    if isinstance(source, basestring):
+        with open(source, 'rb') as f:
+            for chunk in iter_chunks(f, chunk_size):
+                yield chunk
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+def response_charset(source):
+    """
+    Return the charset of the Content-Type of a streamed response, if `source` is one.
+    """
+    response = getattr(source, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return
+    match = CHARSET_RE.search(headers.get('content-type', ''))
+    if match:
+        charset = match.group(1).lower()
+        return CHARSET_ALIASES.get(charset, charset)
+
+
+def strip_bom(chunks):
+    """
+    Return the encoding announced by the byte order mark of `chunks` and the chunks without it.
+
+    :param chunks: Iterator of byte strings, or of unicode strings which only get their u'\\ufeff' removed.
+    :return: (encoding or None, iterator of the chunks)
+    """
+    head = ''
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= 4:
+            break
+    encoding = None
+    if isinstance(head, unicode):
+        # Already decoded, ie. a report given as a unicode string.
+        if head.startswith(u'\ufeff'):
+            head = head[1:]
+    else:
+        for bom, bom_encoding in BOMS:
+            if head.startswith(bom):
+                head = head[len(bom):]
+                encoding = bom_encoding
+                break
+
+    def rest():
+        if head:
+            yield head
+        for chunk in chunks:
+            yield chunk
+    return encoding, rest()
+
+
+def iter_lines(chunks, encoding=None, errors='strict', newline='\n'):
+    """
+    Generator yielding the lines of a stream of byte chunks without their line ending.
+
+    Both LF and CRLF line endings are handled and an empty last line is dropped.
+    :param chunks: Iterable of byte strings. Unicode chunks are split as they are, without decoding.
+    :param encoding: Decode the lines with this codec, None to yield byte strings.
+    :param errors: Error handling of the decoder, see `codecs`.
+    """
+    if encoding is not None:
+        decode = codecs.getincrementaldecoder(encoding)(errors).decode
+        newline = newline.decode('ascii')
+    else:
+        decode = None
+    rest = None
+    for chunk in chunks:
+        if decode is not None and not isinstance(chunk, unicode):
+            chunk = decode(chunk)
+        if rest:
+            chunk = rest + chunk
+        lines = chunk.split(newline)
+        rest = lines.pop()
+        for line in lines:
+            if line[-1:] == '\r':
+                line = line[:-1]
+            yield line
+    if decode is not None:
+        rest = (rest or u'') + decode('', True)
+    if rest:
+        if rest[-1:] == '\r':
+            rest = rest[:-1]
+        yield rest
+
+
+class FlatFileReader(object):
+    """
+    Iterable of the lines of a flat file report, read in constant memory.
+
+    The first line is available as `headers`, iterating yields the following ones. Reports read from a
+    path can be iterated more than once, the other sources only once.
+    """
+
+    def __init__(self, source, encoding=AUTO, errors='strict', chunk_size=CHUNK_SIZE):
+        """
+        :param source: Path of the report file, file object opened in binary mode or iterable of byte chunks
+            such as `Reports.stream_report(report_id)`.
+        :param encoding: Codec to decode the report with. With `AUTO` it's taken from the byte order mark, then
+            from the charset of a streamed response and falls back to `DEFAULT_ENCODING`.
+            None yields the lines as undecoded byte strings (any byte order mark is still removed).
+        :param errors: Error handling of the decoder, ie. 'replace' to accept badly encoded characters.
+        """
+        self.source = source
+        self.encoding = encoding
+        self.errors = errors
+        self.chunk_size = chunk_size
+        self._lines = None
+        self._headers = None
+
+    def _open(self):
+        bom_encoding, chunks = strip_bom(iter_chunks(self.source, self.chunk_size))
+        encoding = self.encoding
+        if encoding == AUTO:
+            encoding = bom_encoding or response_charset(self.source) or DEFAULT_ENCODING
+        return iter_lines(chunks, encoding, self.errors)
+
+    @property
+    def headers(self):
+        """
+        The first line of the report.
+        """
+        if self._headers is None:
+            self._lines = self._open()
+            self._headers = next(self._lines, '')
+        return self._headers
+
+    def __iter__(self):
+        self.headers
+        lines, self._lines = self._lines, None
+        if lines is None:
+            # Iterated before, start over.
+            lines = self._open()
+            next(lines, None)
+        for line in lines:
+            yield line
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Parse a downloaded flat file report on several cores.
+
+The report file is memory mapped and cut into byte ranges ending on a line break. Each range is parsed
+by a `FlatFileWrapper` in a process of a pool and the results come back in the order of the file, so
+iterating a `ParallelFlatFile` yields the same rows as iterating `FlatFileWrapper.stream(path)`.
+
+Columns without a type in the schema of `report_type` are inferred for every range on its own, pass the
+report type to get the same types in every range.
+
+usage:
+
+>>> report = FlatFileWrapper.parallel('settlement.txt', processes=4, convert_numerical=True,
+>>>                                   report_type='_GET_V2_SETTLEMENT_REPORT_DATA_FLAT_FILE_V2_')
+>>> for row in report:
+>>>     process(row)
+>>> for columns in report.column_chunks(numpy=True):
+>>>     process(columns)
+"""
+import mmap
+import os
+from collections import deque
+from itertools import imap, islice
+from multiprocessing import Pool, cpu_count
+
+from mws.parsers.reports.flatfile import FlatFileReader, AUTO, BOMS, DEFAULT_ENCODING, CHUNK_SIZE
+from mws.parsers.reports.requestreport import FlatFileWrapper
+
+__all__ = [
+    'ParallelFlatFile',
+    'split_ranges',
+]
+
+# Number of ranges per process. More ranges than processes keeps the processes busy when some ranges parse
+# slower than others.
+RANGES_PER_PROCESS = 4
+
+# Ranges submitted to the pool ahead of the one being yielded, per process. Bounds the results waiting to be
+# yielded in order when a range parses slower than the ones after it.
+PENDING_PER_PROCESS = 2
+
+# Ranges are never smaller than this, small reports aren't worth the round trips to the pool.
+MIN_RANGE_SIZE = 1024 * 1024
+
+# Encodings whose line breaks aren't a single '\n' byte, their files can't be cut on bytes.
+WIDE_ENCODINGS = ('utf-16', 'utf-32')
+
+
+def split_ranges(data, start, parts, min_size=MIN_RANGE_SIZE):
+    """
+    Cut `data` from `start` into at most `parts` (start, end) byte ranges, each ending after a line break.
+
+    :param data: Memory mapped file or byte string.
+    """
+    size = len(data)
+    step = max((size - start) // max(parts, 1), min_size)
+    ranges = []
+    while start < size:
+        end = data.find('\n', start + step - 1)
+        end = size if end == -1 else end + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _range_chunks(data, start, end, chunk_size=CHUNK_SIZE):
+    for position in xrange(start, end, chunk_size):
+        yield data[position:min(position + chunk_size, end)]
+
+
+def _chunks_after(first, chunks):
+    yield first
+    for chunk in chunks:
+        yield chunk
+
+
+def _parse_range(args):
+    """
+    Parse a range of the report in a pool process: the rows, or the columns with `to_columns` or `to_numpy`.
+    """
+    path, start, end, header, options, output = args
+    convert_numerical, encoding, errors, report_type = options
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # The header line first so that the wrapper of every range knows the columns.
+            reader = FlatFileReader(_chunks_after(header, _range_chunks(data, start, end)), encoding, errors)
+            wrapper = FlatFileWrapper(None, convert_numerical, reader, report_type)
+            if output == 'rows':
+                return list(wrapper.lines())
+            if output == 'numpy':
+                return wrapper.to_numpy()
+            return wrapper.to_columns()
+        finally:
+            data.close()
+
+
+class ParallelFlatFile(object):
+    """
+    Flat file report parsed by a pool of processes, see `FlatFileWrapper.parallel`.
+    """
+
+    def __init__(self, path, processes=None, convert_numerical=False, encoding=AUTO, errors='strict',
+                 report_type=None, min_range_size=MIN_RANGE_SIZE):
+        """
+        :param path: Path of the downloaded report, ie. written by `StreamWrapper.write_to`.
+        :param processes: Number of processes, the number of cores by default. With 1 the report is parsed in
+            the calling process.
+        :param encoding: See `FlatFileReader`. With `AUTO` it's taken from the byte order mark and falls back to
+            `DEFAULT_ENCODING`. UTF-16 and UTF-32 reports can't be parsed in parallel.
+        :param errors: Error handling of the decoder.
+        """
+        self.path = path
+        self.processes = processes or cpu_count()
+        self.convert_numerical = convert_numerical
+        self.errors = errors
+        self.report_type = report_type
+        self.min_range_size = min_range_size
+        with open(path, 'rb') as f:
+            head = f.read(4)
+        for bom, bom_encoding in BOMS:
+            if head.startswith(bom):
+                self._body_start = len(bom)
+                break
+        else:
+            bom_encoding = None
+            self._body_start = 0
+        if encoding == AUTO:
+            encoding = bom_encoding or DEFAULT_ENCODING
+        if encoding and encoding.lower().replace('_', '-').startswith(WIDE_ENCODINGS):
+            raise ValueError('%s reports can\'t be split on line breaks, use FlatFileWrapper.stream' % encoding)
+        self.encoding = encoding
+        self.header = self._header()
+        self.headers = FlatFileReader([self.header], encoding, errors).headers
+
+    def _open(self):
+        with open(self.path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return ''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _header(self):
+        data = self._open()
+        try:
+            end = data.find('\n', self._body_start)
+            end = len(data) if end == -1 else end + 1
+            return data[self._body_start:end]
+        finally:
+            if data:
+                data.close()
+
+    def ranges(self):
+        """
+        Return the (start, end) byte ranges of the report after its header, one per task of the pool.
+        """
+        data = self._open()
+        try:
+            return split_ranges(data, self._body_start + len(self.header), self.processes * RANGES_PER_PROCESS,
+                                self.min_range_size)
+        finally:
+            if data:
+                data.close()
+
+    def _results(self, output):
+        options = (self.convert_numerical, self.encoding, self.errors, self.report_type)
+        tasks = [(self.path, start, end, self.header, options, output) for start, end in self.ranges()]
+        if self.processes == 1 or len(tasks) < 2:
+            for result in imap(_parse_range, tasks):
+                yield result
+            return
+        processes = min(self.processes, len(tasks))
+        pool = Pool(processes)
+        try:
+            # Pool.imap would parse every range as fast as it can whatever is consumed, a window of
+            # `PENDING_PER_PROCESS` tasks per process is topped up as each result is yielded instead.
+            tasks = iter(tasks)
+            pending = deque(pool.apply_async(_parse_range, (task,))
+                            for task in islice(tasks, processes * PENDING_PER_PROCESS))
+            while pending:
+                result = pending.popleft().get()
+                for task in islice(tasks, 1):
+                    pending.append(pool.apply_async(_parse_range, (task,)))
+                yield result
+            pool.close()
+        finally:
+            # Also reached when the consumer stops early.
+            pool.terminate()
+            pool.join()
+
+    def rows(self):
+        """
+        Generator of the rows of the report, in order.
+        """
+        for rows in self._results('rows'):
+            for row in rows:
+                yield row
+
+    def column_chunks(self, numpy=False):
+        """
+        Generator of the columns of every range of the report, in order.
+
+        :param numpy: Yield the arrays of `FlatFileWrapper.to_numpy` instead of the lists of `to_columns`.
+        :return: OrderedDict of header: values per range.
+        """
+        return self._results('numpy' if numpy else 'columns')
+
+    def __iter__(self):
+        return self.rows()
@@ -1,115 +1,124 @@
-import time
 import datetime
 import re
+from collections import OrderedDict
+from itertools import izip
 
 import mws
-from mws.parsers.base import BaseElementWrapper, BaseResponseMixin, first_element, parse_bool
-from mws.parsers.errors import ErrorResponse
-from dateutil import parser
+from mws.parsers.base import BaseElementWrapper, BaseResponseMixin, first_element, parse_bool, cached_property
+from mws.utils import parse_timestamp
+from mws.parsers.reports.flatfile import FlatFileReader, AUTO
+from mws.parsers.reports import schemas, columns
 
 namespaces = {'a': 'http://mws.amazonaws.com/doc/2009-01-01/'}
 
+# Rows transposed at once by `FlatFileWrapper.to_columns` and `to_numpy`.
+COLUMNS_BATCH_SIZE = 4096
+
 
 class ReportRequestInfo(BaseElementWrapper):
 
+    namespaces = namespaces
+
     def __init__(self, element):
         BaseElementWrapper.__init__(self, element)
 
-    @property
+    @cached_property
     @first_element
     def report_type(self):
-        return self.element.xpath('./a:ReportType/text()', namespaces=namespaces)
+        return self.xpath('./a:ReportType/text()')
 
-    @property
+    @cached_property
     @first_element
     def report_processing_status(self):
-        return self.element.xpath('./a:ReportProcessingStatus/text()', namespaces=namespaces)
+        return self.xpath('./a:ReportProcessingStatus/text()')
 
-    @property
+    @cached_property
     @first_element
     def _end_date(self):
-        return self.element.xpath('./a:EndDate/text()', namespaces=namespaces)
+        return self.xpath('./a:EndDate/text()')
 
-    @property
+    @cached_property
     def end_date(self):
         if self._end_date:
-            return parser.parse(self._end_date)
+            return parse_timestamp(self._end_date)
         return
 
-    @property
+    @cached_property
     @first_element
     def _scheduled(self):
-        return self.element.xpath('./a:Scheduled/text()', namespaces=namespaces)
+        return self.xpath('./a:Scheduled/text()')
 
-    @property
+    @cached_property
     def scheduled(self):
         return self._scheduled == 'true'
 
-    @property
+    @cached_property
     @first_element
     def report_request_id(self):
-        return self.element.xpath('./a:ReportRequestId/text()', namespaces=namespaces)
+        return self.xpath('./a:ReportRequestId/text()')
 
-    @property
+    @cached_property
     @first_element
     def _started_processing_date(self):
-        return self.element.xpath('./a:StartedProcessingDate/text()', namespaces=namespaces)
+        return self.xpath('./a:StartedProcessingDate/text()')
 
-    @property
+    @cached_property
     def started_processing_date(self):
         if not self._started_processing_date:
             return
-        return parser.parse(self._started_processing_date)
+        return parse_timestamp(self._started_processing_date)
 
-    @property
+    @cached_property
     @first_element
     def _submitted_date(self):
-        return self.element.xpath('./a:SubmittedDate/text()', namespaces=namespaces)
+        return self.xpath('./a:SubmittedDate/text()')
 
-    @property
+    @cached_property
     def submitted_date(self):
         if not self._submitted_date:
             return
-        return parser.parse(self._submitted_date)
+        return parse_timestamp(self._submitted_date)
 
-    @property
+    @cached_property
     @first_element
     def _start_date(self):
-        return self.element.xpath('./a:StartDate/text()', namespaces=namespaces)
+        return self.xpath('./a:StartDate/text()')
 
-    @property
+    @cached_property
     def start_date(self):
         if not self._start_date:
             return
-        return parser.parse(self._start_date)
+        return parse_timestamp(self._start_date)
 
-    @property
+    @cached_property
     @first_element
     def _completed_date(self):
-        return self.element.xpath('./a:CompletedDate/text()', namespaces=namespaces)
+        return self.xpath('./a:CompletedDate/text()')
 
-    @property
+    @cached_property
     def completed_date(self):
         if self._completed_date:
-            return parser.parse(self._completed_date)
+            return parse_timestamp(self._completed_date)
         return
 
-    @property
+    @cached_property
     @first_element
     def generated_report_id(self):
-        return self.element.xpath('./a:GeneratedReportId/text()', namespaces=namespaces)
+        return self.xpath('./a:GeneratedReportId/text()')
 
 
 class GetReportRequestList(BaseElementWrapper, BaseResponseMixin):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     def get_report_request_list(self):
-        return [ReportRequestInfo(x) for x in self.element.xpath('//a:ReportRequestInfo', namespaces=namespaces)]
+        return [ReportRequestInfo(x) for x in self.xpath('//a:ReportRequestInfo')]
 
-    @property
+    @cached_property
     @first_element
     def next_token(self):
-        return self.element.xpath('//a:NextToken/text()', namespaces=namespaces)
+        return self.xpath('//a:NextToken/text()')
 
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token=None,
@@ -119,60 +128,58 @@ class GetReportRequestList(BaseElementWrapper, BaseResponseMixin):
         response = api.get_report_request_list(requestids=report_request_ids, types=report_types,
                                                processingstatuses=report_processing_statuses, max_count=max_count,
                                                fromdate=requested_from_date, todate=requested_to_date)
-        err = ErrorResponse.load(response.original)
-        if err.message:
-            raise err
-        return cls.load(response.original, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
+        return cls.from_response(response, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
 
     @classmethod
     def from_next_token(cls, mws_access_key, mws_secret_key, mws_account_id, next_token, mws_auth_token=None):
         api = mws.Reports(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
-        response = api.get_report_list_by_next_token(next_token)
-        err = ErrorResponse.load(response.original)
-        if err.message:
-            raise err
-        return cls.load(response.original, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
+        response = api.get_report_request_list_by_next_token(next_token)
+        return cls.from_response(response, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
 
 
 class ReportInfo(BaseElementWrapper):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def report_type(self):
-        return self.element.xpath('./a:ReportType/text()', namespaces=namespaces)
+        return self.xpath('./a:ReportType/text()')
 
-    @property
+    @cached_property
     @parse_bool
     @first_element
     def acknowledged(self):
-        return self.element.xpath('./a:Acknowledged/text()', namespaces=namespaces)
+        return self.xpath('./a:Acknowledged/text()')
 
-    @property
+    @cached_property
     @first_element
     def report_id(self):
-        return self.element.xpath('./a:ReportId/text()', namespaces=namespaces)
+        return self.xpath('./a:ReportId/text()')
 
-    @property
+    @cached_property
     @first_element
     def report_request_id(self):
-        return self.element.xpath('./a:ReportRequestId/text()', namespaces=namespaces)
+        return self.xpath('./a:ReportRequestId/text()')
 
-    @property
+    @cached_property
     @first_element
     def available_date(self):
-        return self.element.xpath('./a:AvailableDate/text()', namespaces=namespaces)
+        return self.xpath('./a:AvailableDate/text()')
 
 
 class GetReportList(BaseElementWrapper, BaseResponseMixin):
 
-    @property
+    namespaces = namespaces
+
+    @cached_property
     @first_element
     def next_token(self):
-        return self.element.xpath('//a:NextToken/text()', namespaces=namespaces)
+        return self.xpath('//a:NextToken/text()')
 
-    @property
+    @cached_property
     def report_info_list(self):
-        return [ReportInfo(x) for x in self.element.xpath('./a:GetReportListResult//a:ReportInfo|./a:GetReportListByNextTokenResult//a:ReportInfo', namespaces=namespaces)]
+        return [ReportInfo(x) for x in self.xpath('./a:GetReportListResult//a:ReportInfo|./a:GetReportListByNextTokenResult//a:ReportInfo')]
 
     @classmethod
     def request(cls, mws_access_key, mws_secret_key, mws_account_id, request_ids=(), max_count=None, types=(),
@@ -181,14 +188,13 @@ class GetReportList(BaseElementWrapper, BaseResponseMixin):
         response = api.get_report_list(requestids=request_ids, max_count=max_count, types=types,
                                        acknowledged=acknowledged, fromdate=fromdate, todate=todate)
 
-        err = ErrorResponse.load(response.original)
-        if err.message:
-            raise err
-
-        return cls.load(response.original, mws_access_key, mws_secret_key, mws_account_id)
+        return cls.from_response(response, mws_access_key, mws_secret_key, mws_account_id)
 
 
 class RequestReportResponse(BaseElementWrapper, BaseResponseMixin):
+
+    namespaces = namespaces
+
     # How many days to look back for start of report
     START_DATE_DAYS = 30
 
@@ -204,22 +210,22 @@ class RequestReportResponse(BaseElementWrapper, BaseResponseMixin):
         self.mws_auth_token = mws_auth_token
         self.report_id = ''
 
-    @property
+    @cached_property
     @first_element
     def report_type(self):
-        return self.element.xpath("//a:ReportType/text()", namespaces=namespaces)
+        return self.xpath("//a:ReportType/text()")
 
-    @property
+    @cached_property
     @first_element
     def report_processing_status(self):
-        return self.element.xpath('//a:ReportProcessingStatus/text()', namespaces=namespaces)
+        return self.xpath('//a:ReportProcessingStatus/text()')
 
-    @property
+    @cached_property
     @first_element
     def _end_date(self):
-        return self.element.xpath('//a:EndDate/text()', namespaces=namespaces)
+        return self.xpath('//a:EndDate/text()')
 
-    @property
+    @cached_property
     def end_date(self):
         """
         Parse end_date and return datetime object
@@ -227,71 +233,74 @@ class RequestReportResponse(BaseElementWrapper, BaseResponseMixin):
         """
         if not self._end_date:
             return
-        return parser.parse(self._end_date)
+        return parse_timestamp(self._end_date)
 
-    @property
+    @cached_property
     @first_element
     def _scheduled(self):
-        return self.element.xpath('//a:Scheduled/text()', namespaces=namespaces)
+        return self.xpath('//a:Scheduled/text()')
 
-    @property
+    @cached_property
     def scheduled(self):
         return self._scheduled == 'true'
 
-    @property
+    @cached_property
     @first_element
     def report_request_id(self):
-        return self.element.xpath('//a:ReportRequestId/text()', namespaces=namespaces)
+        return self.xpath('//a:ReportRequestId/text()')
 
-    @property
+    @cached_property
     @first_element
     def _submitted_date(self):
-        return self.element.xpath('//a:SubmittedDate/text()', namespaces=namespaces)
+        return self.xpath('//a:SubmittedDate/text()')
 
-    @property
+    @cached_property
     def submitted_date(self):
         if not self._submitted_date:
             return
-        return parser.parse(self._submitted_date)
+        return parse_timestamp(self._submitted_date)
 
-    @property
+    @cached_property
     @first_element
     def _start_date(self):
-        return self.element.xpath('//a:StartDate/text()', namespaces=namespaces)
+        return self.xpath('//a:StartDate/text()')
 
-    @property
+    @cached_property
     def start_date(self):
         if not self._start_date:
             return
-        return parser.parse(self._start_date)
+        return parse_timestamp(self._start_date)
 
-    def wait(self):
+    def wait(self, schedule=None):
         """
         Wait for report to finish processing.
         Blocking method. Will return once report has finished processing.
+
+        To wait for many reports at once use a `mws.tracking.ReportTracker`, it polls them together.
+        :param schedule: `mws.tracking.PollSchedule` of the status polls.
         :return:
         """
-        done = False
-        status = ''
-        report_id = None
-        while not done:
-            time.sleep(60)  # sleep before querying since it takes time to process and so that when the report is _DONE_ the loop is immediately broken.
-            response = GetReportRequestList.request(self.mws_access_key, self.mws_secret_key, self.mws_account_id, mws_auth_token=self.mws_auth_token, report_request_ids=(self.report_request_id,))
-            request_result = response.get_report_request_list[0]
-            status = request_result.report_processing_status
-            self.logger.debug('report_request_id=%s report_processing_status=%s' % (self.report_request_id, status))
-            done = bool(request_result.completed_date)
-            report_id = request_result.generated_report_id
-        if status != '_DONE_':
-            raise ValueError("GetReportRequestList for report_request_id=%s returned %s" % (self.report_request_id, status))
-        return report_id
-
-    def report_contents(self):
+        from mws.tracking import ReportTracker
+        api = mws.Reports(self.mws_access_key, self.mws_secret_key, self.mws_account_id, auth_token=self.mws_auth_token)
+        tracker = ReportTracker(api, schedule)
+        handle = tracker.track(self.report_request_id)
+        tracker.wait()
+        self.logger.debug('report_request_id=%s report_processing_status=%s' % (self.report_request_id, handle.status))
+        if handle.status != '_DONE_':
+            raise ValueError("GetReportRequestList for report_request_id=%s returned %s" % (self.report_request_id, handle.status))
+        return handle.report_id
+
+    def report_contents(self, sink=None):
         """
         Return report response contents
-        :return:
+
+        :param sink: Path of a file or file-like object. When given the report is streamed into it
+            in constant memory instead of being returned.
+        :return: The report contents, or the number of bytes written to `sink`.
         """
         api = mws.Reports(self.mws_access_key, self.mws_secret_key, self.mws_account_id, auth_token=self.mws_auth_token)
+        if sink is not None:
+            return api.download_report(self.report_id, sink)
         response = api.get_report(self.report_id)
         return response.original
 
@@ -303,15 +312,17 @@ class RequestReportResponse(BaseElementWrapper, BaseResponseMixin):
         api = mws.Reports(self.mws_access_key, self.mws_secret_key, self.mws_account_id, auth_token=self.mws_auth_token)
         api.update_report_acknowledgements(report_ids=(self.report_id,), acknowledged=True)
 
-    def wait_and_download(self):
+    def wait_and_download(self, sink=None):
         """
         Wait for the report to finish processing and return the report contents
+
+        :param sink: Path of a file or file-like object to stream the report into. See `report_contents`.
         :return:
         """
         self.logger.info('Waiting for report (request_id=%s) to finish processing' % self.report_request_id)
         self.report_id = self.wait()
         self.logger.info('Downloading report (request_id=%s - generated_report_id=%s)' % (self.report_request_id, self.report_id))
-        contents = self.report_contents()
+        contents = self.report_contents(sink)
         self.logger.info('Acknowledging report (request_id=%s - generated_report_id=%s)' % (self.report_request_id, self.report_id))
         self._acknowledge_report()
         return contents
@@ -343,23 +354,93 @@ class RequestReportResponse(BaseElementWrapper, BaseResponseMixin):
         """
         api = mws.Reports(mws_access_key, mws_secret_key, mws_account_id, auth_token=mws_auth_token)
         response = api.request_report(report_enumeration_type, start_date=start_date, end_date=end_date)
-        err = ErrorResponse.load(response.original)
-        if err.message:
-            raise err
-        return cls.load(response.original, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
+        return cls.from_response(response, mws_access_key, mws_secret_key, mws_account_id, mws_auth_token)
 
 
 class FlatFileWrapper(object):
     """
     Parser/generator for flat file report contents
-    """
 
-    def __init__(self, report_contents, convert_numerical=False):
+    Use `FlatFileWrapper.stream` to read big reports from a file or a streamed response in constant memory.
+
+    Each column gets a converter picked once: from the schema of `report_type` (see `schemas`) or,
+    for columns it doesn't list, inferred from the first non empty cell of the column. An inferred column
+    turns `MIXED` at the first cell `convert_text` would convert to another type, and is then converted
+    cell by cell like `convert_text` does.
+    """
+    DATETIME_RE = re.compile('\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\+\d{2}:\d{2})?')
+    FLOAT_RE = re.compile('^\d+\.\d+$')
+    INTEGER_RE = re.compile('^\d+$')
+    # Cells without a digit are text whatever the column, see `_inferred_text`.
+    DIGIT_RE = re.compile('\d')
+    # Type of the columns converted cell by cell by `convert_text`.
+    MIXED = 'mixed'
+
+    def __init__(self, report_contents, convert_numerical=False, reader=None, report_type=None):
+        """
+        :param report_contents: The report as a string. Its lines are yielded as byte strings.
+        :param convert_numerical: Convert numbers to int and float, they are left as text otherwise.
+        :param reader: FlatFileReader to read the report from instead, see `stream`.
+        :param report_type: Report enumeration type, selects the column types from `schemas.REPORT_SCHEMAS`.
+        """
         self.report_contents = report_contents
-        # Split the report into lines and strip any excess whitespace from each line.
-        self._lines = self.report_contents.split('\n')
-        self.headers = self._lines.pop(0)
+        self._reader = reader or FlatFileReader([report_contents], encoding=None)
+        self.headers = self._reader.headers
         self.convert_numerical = convert_numerical
+        self.report_type = report_type
+        # Type of every column read so far (see `schemas`), None until it's known. Set by `lines`.
+        self.types = []
+        # Amazon uses GMT, computed once rather than for every date.
+        offset = datetime.datetime.utcnow() - datetime.datetime.now()
+        self._utc_offset = datetime.timedelta(seconds=round(offset.total_seconds()) / 60)
+        # column type: converter
+        self._converters = {
+            schemas.TEXT: self._text,
+            schemas.INTEGER: self._integer if convert_numerical else self._text,
+            schemas.FLOAT: self._float if convert_numerical else self._text,
+            schemas.DATETIME: self._datetime,
+        }
+        # column type: converter of the inferred columns, raising ValueError for a cell of another type
+        self._inferred_converters = {
+            schemas.TEXT: self._inferred_text,
+            schemas.INTEGER: self._inferred_integer,
+            schemas.FLOAT: self._inferred_float,
+            schemas.DATETIME: self._inferred_datetime,
+        }
+
+    @classmethod
+    def stream(cls, source, convert_numerical=False, encoding=AUTO, errors='strict', report_type=None):
+        """
+        Read a report in constant memory.
+
+        usage:
+
+        >>> for row in FlatFileWrapper.stream(api.stream_report(report_id), report_type='_GET_FLAT_FILE_ORDERS_DATA_'):
+        >>>     process(row)
+
+        :param source: Path of the report file, file object opened in binary mode or iterable of byte chunks
+            such as `Reports.stream_report(report_id)`. Only a path can be iterated more than once.
+        :param encoding: See `FlatFileReader`. By default the lines are decoded to unicode using the
+            byte order mark or charset of the report.
+        :param errors: Error handling of the decoder.
+        """
+        return cls(None, convert_numerical, FlatFileReader(source, encoding, errors), report_type)
+
+    @classmethod
+    def parallel(cls, path, processes=None, convert_numerical=False, encoding=AUTO, errors='strict', report_type=None):
+        """
+        Parse a report file on several cores, see `parallel.ParallelFlatFile`.
+
+        usage:
+
+        >>> for row in FlatFileWrapper.parallel('report.txt', processes=4, report_type='_GET_FLAT_FILE_ORDERS_DATA_'):
+        >>>     process(row)
+
+        :param path: Path of the report file.
+        :param processes: Number of processes, the number of cores by default.
+        """
+        from mws.parsers.reports.parallel import ParallelFlatFile
+        return ParallelFlatFile(path, processes, convert_numerical, encoding, errors, report_type)
 
     def offset_dt(self, dt):
         """
@@ -367,9 +448,7 @@ class FlatFileWrapper(object):
         :param dt:
         :return:
         """
-        offset = datetime.datetime.utcnow() - datetime.datetime.now()
-        seconds_offset = round(offset.total_seconds()) / 60
-        return dt - datetime.timedelta(seconds=seconds_offset)
+        return dt - self._utc_offset
 
     def convert_text(self, t):
         """
@@ -378,29 +457,195 @@ class FlatFileWrapper(object):
         :return:
         """
         # Convert datetime
-        if re.search('\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\+\d{2}:\d{2})?', t):
-            return self.offset_dt(parser.parse(t))
+        if self.DATETIME_RE.search(t):
+            return self.offset_dt(parse_timestamp(t))
         if self.convert_numerical:
-            if re.search('^\d+\.\d+$', t):
+            if self.FLOAT_RE.match(t):
                 return float(t)
-            if re.search('^\d+$', t):
+            if self.INTEGER_RE.match(t):
                 return int(t)
         if not t:
             return None
         return t
 
+    def infer_type(self, t):
+        """
+        Return the column type `convert_text` would convert the non empty cell `t` to.
+        """
+        if self.DATETIME_RE.search(t):
+            return schemas.DATETIME
+        if self.convert_numerical:
+            if self.FLOAT_RE.match(t):
+                return schemas.FLOAT
+            if self.INTEGER_RE.match(t):
+                return schemas.INTEGER
+        return schemas.TEXT
+
+    @staticmethod
+    def _text(t):
+        return t or None
+
+    @staticmethod
+    def _integer(t):
+        return int(t) if t else None
+
+    @staticmethod
+    def _float(t):
+        return float(t) if t else None
+
+    def _datetime(self, t):
+        return self.offset_dt(parse_timestamp(t)) if t else None
+
+    def _inferred_text(self, t):
+        if t and self.DIGIT_RE.search(t) and self.infer_type(t) != schemas.TEXT:
+            raise ValueError('%r is not text' % t)
+        return t or None
+
+    def _inferred_integer(self, t):
+        if t and not self.INTEGER_RE.match(t):
+            raise ValueError('%r is not an integer' % t)
+        return int(t) if t else None
+
+    def _inferred_float(self, t):
+        if t and not self.FLOAT_RE.match(t):
+            raise ValueError('%r is not a float' % t)
+        return float(t) if t else None
+
+    def _inferred_datetime(self, t):
+        if t and not self.DATETIME_RE.search(t):
+            raise ValueError('%r is not a datetime' % t)
+        return self._datetime(t)
+
+    def column_types(self):
+        """
+        Return the type of every column in the schema of the report, None for the ones to infer.
+        """
+        schema = schemas.get_schema(self.report_type)
+        return [schema.get(name.strip()) for name in self.headers.split('\t')]
+
     def lines(self):
         """
         Generator function yielding each line's contents in a tuple.
         :return:
         """
-        for line in self._lines:
-            t = tuple(self.convert_text(x.strip()) for x in line.split('\t'))
-            yield t
+        types = self.types = self.column_types()
+        if not self.convert_numerical:
+            types[:] = [schemas.TEXT if x in (schemas.INTEGER, schemas.FLOAT) else x for x in types]
+        converters = [self._converters.get(x) for x in types]
+        # Columns whose converter is inferred from their first non empty cell.
+        pending = set(i for i, x in enumerate(converters) if x is None)
+        width = len(converters)
+        for line in self._reader:
+            cells = [x.strip() for x in line.split('\t')]
+            if len(cells) > width:
+                # More cells than headers, infer the extra columns too.
+                pending.update(xrange(width, len(cells)))
+                converters.extend([None] * (len(cells) - width))
+                types.extend([None] * (len(cells) - width))
+                width = len(cells)
+            if pending:
+                for i in list(pending):
+                    if i < len(cells) and cells[i]:
+                        types[i] = self.infer_type(cells[i])
+                        converters[i] = self._inferred_converters[types[i]]
+                        pending.discard(i)
+            try:
+                yield tuple([convert(x) if convert else None for convert, x in izip(converters, cells)])
+            except ValueError:
+                # A cell which doesn't fit the type of its column, fall back to converting each cell of the
+                # offending columns on its own from now on.
+                yield tuple(self._convert_cells(converters, types, cells))
+
+    def _convert_cells(self, converters, types, cells):
+        for i, x in enumerate(cells):
+            convert = converters[i]
+            if convert is None:
+                yield None
+                continue
+            try:
+                yield convert(x)
+            except ValueError:
+                converters[i] = self.convert_text
+                types[i] = self.MIXED
+                yield self.convert_text(x)
+
+    def to_columns(self):
+        """
+        Read the report into a list of values per column instead of a tuple per line.
+
+        Missing cells are None. Columns without a header (lines with more cells than headers) are named by
+        their index. The type of every column is in `types` afterwards.
+        :return: OrderedDict of header: list of values.
+        """
+        names = [x.strip() for x in self.headers.split('\t')]
+        values = []
+        rows = 0
+        for batch in self._batches(COLUMNS_BATCH_SIZE):
+            width = max(len(x) for x in batch)
+            if width > len(values):
+                values.extend([None] * rows for _ in xrange(width - len(values)))
+            if any(len(x) < len(values) for x in batch):
+                padding = (None,) * len(values)
+                batch = [x + padding[len(x):] for x in batch]
+            # Transposing a batch of rows at once is much faster than appending cell by cell.
+            for column, batch_values in izip(values, izip(*batch)):
+                column.extend(batch_values)
+            rows += len(batch)
+        if len(values) < len(names):
+            values.extend([None] * rows for _ in xrange(len(names) - len(values)))
+        names.extend(str(i) for i in xrange(len(names), len(values)))
+        return OrderedDict(izip(names, values))
+
+    def _batches(self, size):
+        batch = []
+        for row in self.lines():
+            batch.append(row)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def to_numpy(self):
+        """
+        Read the report into a typed numpy array per column, requires numpy.
+
+        INTEGER columns are int64 (float64 when they have empty cells), FLOAT columns float64 with NaN for the
+        empty cells and DATETIME columns datetime64 in UTC. Text columns are dictionary encoded in a
+        `columns.DictionaryArray` and columns of mixed types are object arrays.
+        Numbers are only converted with `convert_numerical`.
+
+        Every batch of `COLUMNS_BATCH_SIZE` lines is converted to typed chunks before the next one is read,
+        so the report is never held as python values.
+        :return: OrderedDict of header: array.
+        """
+        columns.require_numpy()
+        names = [x.strip() for x in self.headers.split('\t')]
+        builders = []
+        rows = 0
+        for batch in self._batches(COLUMNS_BATCH_SIZE):
+            width = max(len(x) for x in batch)
+            for _ in xrange(len(builders), width):
+                builders.append(columns.ColumnBuilder())
+                builders[-1].append_empty(rows)
+            if any(len(x) < len(builders) for x in batch):
+                padding = (None,) * len(builders)
+                batch = [x + padding[len(x):] for x in batch]
+            for i, (builder, values) in enumerate(izip(builders, izip(*batch))):
+                builder.append(values, self.types[i] if i < len(self.types) else None)
+            rows += len(batch)
+            del batch
+        for _ in xrange(len(builders), len(names)):
+            builders.append(columns.ColumnBuilder())
+            builders[-1].append_empty(rows)
+        names.extend(str(i) for i in xrange(len(names), len(builders)))
+        types = self.types + [None] * (len(builders) - len(self.types))
+        return OrderedDict((name, builder.finish(column_type))
+                           for name, builder, column_type in izip(names, builders, types))
 
     def __iter__(self):
         for line in self.lines():
             yield line
 
     def __str__(self):
-        return self.report_contents
+        return self.report_contents or ''
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+Column types of the flat file reports, by report enumeration type.
+
+`FlatFileWrapper` converts the cells of a column listed here with the converter of its type instead
+of guessing the type of every cell. Columns missing from a schema (or reports without one) get
+their type inferred once from their first non empty cell.
+
+Identifiers which look numerical (order ids, postal codes, settlement ids...) are deliberately TEXT.
+"""
+
+__all__ = [
+    'TEXT',
+    'INTEGER',
+    'FLOAT',
+    'DATETIME',
+    'REPORT_SCHEMAS',
+    'register_schema',
+    'get_schema',
+]
+
+TEXT = 'text'
+INTEGER = 'int'
+FLOAT = 'float'
+DATETIME = 'datetime'
+
+SETTLEMENT = {
+    'settlement-id': TEXT,
+    'settlement-start-date': DATETIME,
+    'settlement-end-date': DATETIME,
+    'deposit-date': DATETIME,
+    'total-amount': FLOAT,
+    'currency': TEXT,
+    'transaction-type': TEXT,
+    'order-id': TEXT,
+    'merchant-order-id': TEXT,
+    'adjustment-id': TEXT,
+    'shipment-id': TEXT,
+    'marketplace-name': TEXT,
+    'amount-type': TEXT,
+    'amount-description': TEXT,
+    'amount': FLOAT,
+    'fulfillment-id': TEXT,
+    'posted-date': DATETIME,
+    'posted-date-time': DATETIME,
+    'order-item-code': TEXT,
+    'merchant-order-item-id': TEXT,
+    'merchant-adjustment-item-id': TEXT,
+    'sku': TEXT,
+    'quantity-purchased': INTEGER,
+    'promotion-id': TEXT,
+}
+
+LISTINGS = {
+    'item-name': TEXT,
+    'item-description': TEXT,
+    'listing-id': TEXT,
+    'seller-sku': TEXT,
+    'price': FLOAT,
+    'quantity': INTEGER,
+    # Local time with a zone abbreviation, ie. 2016-09-13 22:21:47 PDT, kept as it is.
+    'open-date': TEXT,
+    'image-url': TEXT,
+    'item-is-marketplace': TEXT,
+    'product-id-type': TEXT,
+    'zshop-shipping-fee': FLOAT,
+    'item-note': TEXT,
+    'item-condition': TEXT,
+    'zshop-category1': TEXT,
+    'zshop-browse-path': TEXT,
+    'zshop-storefront-feature': TEXT,
+    'asin1': TEXT,
+    'asin2': TEXT,
+    'asin3': TEXT,
+    'will-ship-internationally': TEXT,
+    'expedited-shipping': TEXT,
+    'zshop-boldface': TEXT,
+    'product-id': TEXT,
+    'bid-for-featured-placement': TEXT,
+    'add-delete': TEXT,
+    'pending-quantity': INTEGER,
+    'fulfillment-channel': TEXT,
+    'merchant-shipping-group': TEXT,
+    'status': TEXT,
+}
+
+FBA_MANAGE_INVENTORY = {
+    'sku': TEXT,
+    'fnsku': TEXT,
+    'asin': TEXT,
+    'product-name': TEXT,
+    'condition': TEXT,
+    'your-price': FLOAT,
+    'mfn-listing-exists': TEXT,
+    'mfn-fulfillable-quantity': INTEGER,
+    'afn-listing-exists': TEXT,
+    'afn-warehouse-quantity': INTEGER,
+    'afn-fulfillable-quantity': INTEGER,
+    'afn-unsellable-quantity': INTEGER,
+    'afn-reserved-quantity': INTEGER,
+    'afn-total-quantity': INTEGER,
+    'per-unit-volume': FLOAT,
+    'afn-inbound-working-quantity': INTEGER,
+    'afn-inbound-shipped-quantity': INTEGER,
+    'afn-inbound-receiving-quantity': INTEGER,
+}
+
+AFN_INVENTORY = {
+    'seller-sku': TEXT,
+    'fulfillment-channel-sku': TEXT,
+    'asin': TEXT,
+    'condition-type': TEXT,
+    'Warehouse-Condition-code': TEXT,
+    'Quantity Available': INTEGER,
+}
+
+ALL_ORDERS = {
+    'amazon-order-id': TEXT,
+    'merchant-order-id': TEXT,
+    'purchase-date': DATETIME,
+    'last-updated-date': DATETIME,
+    'order-status': TEXT,
+    'fulfillment-channel': TEXT,
+    'sales-channel': TEXT,
+    'order-channel': TEXT,
+    'url': TEXT,
+    'ship-service-level': TEXT,
+    'product-name': TEXT,
+    'sku': TEXT,
+    'asin': TEXT,
+    'item-status': TEXT,
+    'quantity': INTEGER,
+    'currency': TEXT,
+    'item-price': FLOAT,
+    'item-tax': FLOAT,
+    'shipping-price': FLOAT,
+    'shipping-tax': FLOAT,
+    'gift-wrap-price': FLOAT,
+    'gift-wrap-tax': FLOAT,
+    'item-promotion-discount': FLOAT,
+    'ship-promotion-discount': FLOAT,
+    'ship-city': TEXT,
+    'ship-state': TEXT,
+    'ship-postal-code': TEXT,
+    'ship-country': TEXT,
+    'promotion-ids': TEXT,
+    'is-business-order': TEXT,
+    'purchase-order-number': TEXT,
+    'price-designation': TEXT,
+}
+
+ORDERS = {
+    'order-id': TEXT,
+    'order-item-id': TEXT,
+    'purchase-date': DATETIME,
+    'payments-date': DATETIME,
+    'buyer-email': TEXT,
+    'buyer-name': TEXT,
+    'buyer-phone-number': TEXT,
+    'sku': TEXT,
+    'product-name': TEXT,
+    'quantity-purchased': INTEGER,
+    'currency': TEXT,
+    'item-price': FLOAT,
+    'item-tax': FLOAT,
+    'shipping-price': FLOAT,
+    'shipping-tax': FLOAT,
+    'ship-service-level': TEXT,
+    'recipient-name': TEXT,
+    'ship-address-1': TEXT,
+    'ship-address-2': TEXT,
+    'ship-address-3': TEXT,
+    'ship-city': TEXT,
+    'ship-state': TEXT,
+    'ship-postal-code': TEXT,
+    'ship-country': TEXT,
+    'ship-phone-number': TEXT,
+    'delivery-start-date': DATETIME,
+    'delivery-end-date': DATETIME,
+    'delivery-time-zone': TEXT,
+    'delivery-Instructions': TEXT,
+    'sales-channel': TEXT,
+}
+
+# Report enumeration type: {column name: type}
+REPORT_SCHEMAS = {
+    '_GET_V2_SETTLEMENT_REPORT_DATA_FLAT_FILE_': SETTLEMENT,
+    '_GET_V2_SETTLEMENT_REPORT_DATA_FLAT_FILE_V2_': SETTLEMENT,
+    '_GET_MERCHANT_LISTINGS_ALL_DATA_': LISTINGS,
+    '_GET_MERCHANT_LISTINGS_DATA_': LISTINGS,
+    '_GET_MERCHANT_LISTINGS_INACTIVE_DATA_': LISTINGS,
+    '_GET_FBA_MYI_UNSUPPRESSED_INVENTORY_DATA_': FBA_MANAGE_INVENTORY,
+    '_GET_FBA_MYI_ALL_INVENTORY_DATA_': FBA_MANAGE_INVENTORY,
+    '_GET_AFN_INVENTORY_DATA_': AFN_INVENTORY,
+    '_GET_FLAT_FILE_ALL_ORDERS_DATA_BY_ORDER_DATE_': ALL_ORDERS,
+    '_GET_FLAT_FILE_ALL_ORDERS_DATA_BY_LAST_UPDATE_': ALL_ORDERS,
+    '_GET_FLAT_FILE_ORDERS_DATA_': ORDERS,
+}
+
+
+def register_schema(report_type, columns):
+    """
+    Add or replace the schema of a report type.
+
+    :param report_type: Report enumeration type, ie. '_GET_FLAT_FILE_ORDERS_DATA_'.
+    :param columns: {column name: TEXT, INTEGER, FLOAT or DATETIME}
+    """
+    REPORT_SCHEMAS[report_type] = dict(columns)
+
+
+def get_schema(report_type):
+    """
+    Return the schema of a report type, an empty one if it's unknown.
+    """
+    return REPORT_SCHEMAS.get(report_type) or {}
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Request, wait for, download and acknowledge many reports at once.
+
+`ReportPipeline` overlaps the stages of every report it's given:
+
+- the RequestReport calls are made by a background thread, which the api's `RequestScheduler` keeps
+  within the RequestReport throttle,
+- the requests are tracked together by a started `ReportTracker` (batched GetReportRequestList polls),
+- finished reports are downloaded to disk in constant memory by a pool of threads,
+- downloaded reports are acknowledged with one UpdateReportAcknowledgements call for up to 100 of them,
+
+and reports every finished job as a `ReportEvent`.
+
+usage:
+
+>>> with ReportPipeline(Reports('access_key', 'secret_key', 'account_id'), '/data/reports') as pipeline:
+>>>     for marketplace in marketplaces:
+>>>         pipeline.submit('_GET_FLAT_FILE_ORDERS_DATA_', start_date, end_date, (marketplace,))
+>>>     for event in pipeline.events():
+>>>         if event.error is None:
+>>>             load(event.job.marketplaceids, event.path)
+"""
+import os
+import time
+import Queue
+import logging
+import threading
+from multiprocessing.pool import ThreadPool
+
+from tracking import ReportTracker
+
+__all__ = [
+    'PipelineClosed',
+    'ReportJob',
+    'ReportEvent',
+    'ReportPipeline',
+]
+
+# Number of concurrent downloads.
+DOWNLOAD_WORKERS = 4
+
+# ReportIdList takes at most 100 ids.
+MAX_ACKNOWLEDGEMENTS = 100
+
+# Seconds a downloaded report waits for others to be acknowledged with.
+ACKNOWLEDGE_DELAY = 30
+
+# Marks the end of the queues of the background threads.
+_STOP = object()
+
+
+class PipelineClosed(Exception):
+    """
+    Error of the jobs dropped by `ReportPipeline.close(wait=False)` before they were requested.
+    """
+
+
+class ReportJob(object):
+    """
+    A report to request, see `ReportPipeline.submit`.
+    """
+
+    def __init__(self, report_type, start_date=None, end_date=None, marketplaceids=()):
+        self.report_type = report_type
+        self.start_date = start_date
+        self.end_date = end_date
+        self.marketplaceids = tuple(marketplaceids)
+        # Set once the report is requested.
+        self.report_request_id = None
+
+    def __repr__(self):
+        return '<ReportJob %s %s>' % (self.report_type, self.report_request_id)
+
+
+class ReportEvent(object):
+    """
+    Completion of a `ReportJob`.
+
+    `status` is the final processing status of the request (_DONE_, _CANCELLED_ or _DONE_NO_DATA_), or None
+    if the job failed before. `path` is set once a _DONE_ report is downloaded, `error` to the exception of the
+    request or download which failed.
+    """
+
+    def __init__(self, job, status=None, report_id=None, path=None, size=None, error=None):
+        self.job = job
+        self.status = status
+        self.report_id = report_id
+        self.path = path
+        self.size = size
+        self.error = error
+
+    def __repr__(self):
+        return '<ReportEvent %s %s %s>' % (self.job.report_type, self.status, self.path or self.error)
+
+
+class ReportPipeline(object):
+    """
+    Concurrent request, polling, download and acknowledgement of reports.
+    """
+
+    def __init__(self, api, directory, download_workers=DOWNLOAD_WORKERS, schedule=None, acknowledge=True,
+                 acknowledge_delay=ACKNOWLEDGE_DELAY):
+        """
+        :param api: `mws.Reports` instance, its scheduler throttles every stage.
+        :param directory: Directory the reports are downloaded to, see `report_path`.
+        :param download_workers: Number of concurrent downloads.
+        :param schedule: `PollSchedule` of the status polls.
+        :param acknowledge: Acknowledge the downloaded reports.
+        :param acknowledge_delay: Seconds to wait for more reports to acknowledge in the same call.
+        """
+        self.api = api
+        self.directory = directory
+        self.acknowledge = acknowledge
+        self.acknowledge_delay = acknowledge_delay
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.tracker = ReportTracker(api, schedule).start()
+        self._downloads = ThreadPool(download_workers)
+        self._events = Queue.Queue()
+        self._submitted = 0
+        self._reported = 0
+        # Events put in `_events`, from several threads.
+        self._finished = 0
+        self._finished_lock = threading.Lock()
+        self._requests = Queue.Queue()
+        self._requester = self._thread(self._request_reports)
+        self._acknowledgements = Queue.Queue()
+        self._acknowledger = self._thread(self._acknowledge_reports)
+        self._closed = False
+
+    def _thread(self, target):
+        thread = threading.Thread(target=target, name='%s.%s' % (self.__class__.__name__, target.__name__))
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def submit(self, report_type, start_date=None, end_date=None, marketplaceids=()):
+        """
+        Queue a report to request, returns right away.
+
+        :return: The ReportJob, its `ReportEvent` comes out of `events` once it's finished.
+        """
+        if self._closed:
+            raise ValueError('The pipeline is closed')
+        job = ReportJob(report_type, start_date, end_date, marketplaceids)
+        self._submitted += 1
+        self._requests.put(job)
+        return job
+
+    def report_path(self, job, report_id):
+        """
+        Return the path a report is downloaded to. Override to name the files differently.
+        """
+        return os.path.join(self.directory, '%s%s.txt' % (job.report_type, report_id))
+
+    def events(self, timeout=None):
+        """
+        Generator of the `ReportEvent` of every submitted job, in the order they finish.
+
+        Stops once every job submitted so far is reported.
+        :param timeout: Seconds to wait for each event, raises Queue.Empty when it passes.
+        """
+        while self._reported < self._submitted:
+            event = self._events.get(timeout=timeout)
+            if event is _STOP:
+                # Closed without waiting, `_submitted` was lowered.
+                continue
+            self._reported += 1
+            yield event
+
+    def _finish(self, event):
+        self.logger.debug('%r', event)
+        with self._finished_lock:
+            self._finished += 1
+        self._events.put(event)
+
+    def _request_reports(self):
+        while True:
+            job = self._requests.get()
+            if job is _STOP:
+                return
+            try:
+                handle = self.tracker.track(self.api.request_report(job.report_type, job.start_date, job.end_date,
+                                                                    job.marketplaceids))
+            except Exception as e:
+                self._finish(ReportEvent(job, error=e))
+                continue
+            job.report_request_id = handle.id
+            handle.add_done_callback(lambda handle, job=job: self._processed(job, handle))
+
+    def _processed(self, job, handle):
+        # Called from the polling thread.
+        if handle.status != '_DONE_':
+            self._finish(ReportEvent(job, handle.status))
+            return
+        self._downloads.apply_async(self._download, (job, handle.status, handle.report_id))
+
+    def _download(self, job, status, report_id):
+        path = self.report_path(job, report_id)
+        try:
+            size = self.api.download_report(report_id, path)
+        except Exception as e:
+            self._finish(ReportEvent(job, status, report_id, error=e))
+            return
+        if self.acknowledge:
+            self._acknowledgements.put(report_id)
+        self._finish(ReportEvent(job, status, report_id, path, size))
+
+    def _acknowledge_reports(self):
+        """
+        Body of the acknowledging thread: acknowledge up to `MAX_ACKNOWLEDGEMENTS` reports per call, once there are
+        that many or the first of them waited `acknowledge_delay` seconds.
+        """
+        batch = []
+        deadline = None
+        stopping = False
+        while not stopping:
+            try:
+                timeout = None if deadline is None else max(deadline - time.time(), 0)
+                report_id = self._acknowledgements.get(timeout=timeout)
+                if report_id is _STOP:
+                    stopping = True
+                else:
+                    batch.append(report_id)
+                    if deadline is None:
+                        deadline = time.time() + self.acknowledge_delay
+            except Queue.Empty:
+                pass
+            if batch and (stopping or len(batch) >= MAX_ACKNOWLEDGEMENTS or time.time() >= deadline):
+                try:
+                    self.api.update_report_acknowledgements(batch, acknowledged=True)
+                except Exception:
+                    self.logger.exception('UpdateReportAcknowledgements failed for %s', batch)
+                batch = []
+                deadline = None
+
+    def close(self, wait=True):
+        """
+        Stop the background threads after acknowledging the downloaded reports.
+
+        :param wait: Wait for the submitted reports to be processed and downloaded first. Otherwise the reports
+            which aren't requested yet are dropped, with a `PipelineClosed` error event each, and the ones
+            requested or downloading are abandoned without an event.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if not wait:
+            # Drop the jobs waiting to be requested, reporting them so that `events` doesn't wait for them.
+            while True:
+                try:
+                    job = self._requests.get_nowait()
+                except Queue.Empty:
+                    break
+                self._finish(ReportEvent(job, error=PipelineClosed('The pipeline was closed before %r was requested'
+                                                                   % job)))
+        self._requests.put(_STOP)
+        self._requester.join()
+        if wait:
+            self.tracker.wait()
+        self.tracker.stop(wait)
+        if wait:
+            self._downloads.close()
+        else:
+            self._downloads.terminate()
+        self._downloads.join()
+        self._acknowledgements.put(_STOP)
+        self._acknowledger.join()
+        if not wait:
+            # The requested reports abandoned on the way never get an event, stop `events` after the last one.
+            self._submitted = self._finished
+            self._events.put(_STOP)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(wait=exc_type is None)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Retry policy for throttled and failed MWS calls.
+
+`RetryPolicy` classifies `ErrorResponse.code` values and http status codes as retryable or fatal
+and waits with exponential backoff and full jitter between attempts. Counts and time spent
+backing off are kept in `RetryMetrics`.
+"""
+import time
+import random
+import logging
+import threading
+
+# Error codes returned when amazon rejected the request before processing it.
+# Retrying these is always safe, even for operations which aren't idempotent.
+# The scheduler holds back retries of QuotaExceeded until the hourly quota resets.
+THROTTLED_ERROR_CODES = frozenset([
+    'QuotaExceeded',
+    'RequestThrottled',
+])
+
+# Error codes returned when processing failed on amazon's side.
+# Only idempotent operations are retried on these since the request may have been partially processed.
+RETRYABLE_ERROR_CODES = frozenset([
+    'InternalError',
+    'ServiceUnavailable',
+])
+
+# Operations which only read data can be repeated without side effects.
+IDEMPOTENT_ACTION_PREFIXES = ('Get', 'List')
+
+# Write operations which are nonetheless safe to repeat.
+IDEMPOTENT_ACTIONS = frozenset([
+    'UpdateReportAcknowledgements',
+])
+
+
+class RetryMetrics(object):
+    """
+    Thread safe counters of retries and time spent backing off, per Action.
+    """
+
+    def __init__(self):
+        self.retries = {}
+        self.backoff_seconds = {}
+        self.failures = {}
+        self._lock = threading.Lock()
+
+    def record_retry(self, action, delay):
+        with self._lock:
+            self.retries[action] = self.retries.get(action, 0) + 1
+            self.backoff_seconds[action] = self.backoff_seconds.get(action, 0.0) + delay
+
+    def record_failure(self, action):
+        """
+        Record a call which failed with a retryable error after exhausting its retries.
+        """
+        with self._lock:
+            self.failures[action] = self.failures.get(action, 0) + 1
+
+    @property
+    def total_retries(self):
+        return sum(self.retries.values())
+
+    @property
+    def total_backoff_seconds(self):
+        return sum(self.backoff_seconds.values())
+
+    def reset(self):
+        with self._lock:
+            self.retries.clear()
+            self.backoff_seconds.clear()
+            self.failures.clear()
+
+
+class RetryPolicy(object):
+    """
+    Decide whether a failed call is retried and how long to wait before the next attempt.
+
+    usage:
+
+    >>> policy = RetryPolicy(max_retries=8, max_delay=120)
+    >>> api = Orders('access_key', 'secret_key', 'account_id', retry_policy=policy)
+    >>> api.list_orders(...)
+    >>> print policy.metrics.total_retries, policy.metrics.total_backoff_seconds
+
+    Pass `RetryPolicy(max_retries=0)` to disable retries.
+    """
+
+    def __init__(self, max_retries=5, base_delay=1.0, max_delay=60.0, throttled_codes=THROTTLED_ERROR_CODES,
+                 retryable_codes=RETRYABLE_ERROR_CODES, sleep=time.sleep):
+        """
+        :param max_retries: Maximum number of retries per call.
+        :param base_delay: Upper bound of the first backoff in seconds. Doubled for every following attempt.
+        :param max_delay: Cap of the backoff upper bound in seconds.
+        :param throttled_codes: Error codes which are retried for every operation.
+        :param retryable_codes: Error codes which are retried for idempotent operations only.
+        :param sleep: Function used to wait, useful for testing.
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.throttled_codes = throttled_codes
+        self.retryable_codes = retryable_codes
+        self.sleep = sleep
+        self.metrics = RetryMetrics()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def is_idempotent(self, action):
+        return action in IDEMPOTENT_ACTIONS or (action or '').startswith(IDEMPOTENT_ACTION_PREFIXES)
+
+    def is_retryable(self, action, code=None, status_code=None):
+        """
+        Classify a failed call.
+
+        :param action: The MWS Action which was called.
+        :param code: `ErrorResponse.code` if the response body held an error document.
+        :param status_code: The http status code of the response.
+        :return: True if the call may be repeated.
+        """
+        if code in self.throttled_codes:
+            return True
+        if not self.is_idempotent(action):
+            return False
+        if code:
+            return code in self.retryable_codes
+        return status_code is not None and status_code >= 500
+
+    def backoff(self, attempt):
+        """
+        Exponential backoff with full jitter.
+
+        :param attempt: The retry number, starting at 1.
+        :return: Seconds to wait.
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def wait(self, action, attempt):
+        """
+        Sleep before retry number `attempt` of `action` and record it.
+        :return: Seconds waited.
+        """
+        delay = self.backoff(attempt)
+        self.logger.debug('retrying %s (attempt %d/%d) in %.2fs' % (action, attempt, self.max_retries, delay))
+        self.metrics.record_retry(action, delay)
+        self.sleep(delay)
+        return delay
+
+
+# Policy shared by every api instance which isn't given its own.
+default_retry_policy = RetryPolicy()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Pooled, persistent HTTP sessions shared by every MWS api class.
+
+Every api instance (Orders, Products, Reports, Feeds, ...) fetches its session from a `SessionPool`
+keyed by the endpoint domain, so calls to the same endpoint reuse already established TCP/TLS
+connections instead of doing a new handshake per request.
+"""
+import threading
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool(object):
+    """
+    Holds one `requests.Session` per MWS endpoint (ie. https://mws.amazonservices.com).
+
+    Regions which share an endpoint (DE, ES, FR, IT, UK) share the same session and connections.
+
+    usage:
+
+    >>> pool = SessionPool(pool_maxsize=20)
+    >>> api = Orders('access_key', 'secret_key', 'account_id', session_pool=pool)
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, keep_alive=True, verify=True):
+        """
+        :param pool_connections: Number of connection pools to cache per session.
+        :param pool_maxsize: Maximum number of connections kept open per endpoint.
+            Set this to at least the number of threads making calls concurrently.
+        :param pool_block: Block when no free connection is available instead of opening a throwaway one.
+        :param keep_alive: Keep connections open between calls. When False every call sends `Connection: close`.
+        :param verify: Passed to `requests.Session.verify`. Either a bool or the path to a CA bundle.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.verify = verify
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, domain):
+        """
+        Return the session for `domain`, creating it on first use.
+
+        :param domain: Endpoint including the scheme. ex. https://mws.amazonservices.com
+        :return: requests.Session
+        """
+        session = self._sessions.get(domain)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(domain)
+                if session is None:
+                    session = self._sessions[domain] = self._create_session(domain)
+        return session
+
+    def _create_session(self, domain):
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+                              pool_block=self.pool_block)
+        session.mount(domain, adapter)
+        session.verify = self.verify
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def close(self):
+        """
+        Close every session and drop any open connections.
+        :return:
+        """
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+# Pool used by every api instance which isn't given its own.
+default_session_pool = SessionPool()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Feed bodies built in chunks instead of as one string.
+
+`SpooledFeed` hashes the chunks of a feed as they are written and keeps them in memory up to
+`max_size` bytes, in a temporary file past that. `Feeds.submit_feed` takes it in place of a string:
+the Content-MD5 is already known and the upload streams from the file, so a feed of millions of rows
+never has to be held in memory.
+
+usage:
+
+>>> feed = SpooledFeed.from_chunks(generate_rows())
+>>> api.submit_feed(feed, '_POST_FLAT_FILE_PRICEANDQUANTITYONLY_UPDATE_DATA_', content_type='text/tab-separated-values')
+"""
+import base64
+import hashlib
+import tempfile
+
+__all__ = [
+    'SpooledFeed',
+    'buffer_chunks',
+]
+
+# Feeds up to this size stay in memory.
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Size of the chunks written to and read from the spool.
+CHUNK_SIZE = 64 * 1024
+
+
+def buffer_chunks(pieces, chunk_size=CHUNK_SIZE):
+    """
+    Generator joining many small strings (ie. one per row) into chunks of about `chunk_size` bytes.
+    """
+    buffered = []
+    size = 0
+    for piece in pieces:
+        buffered.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield ''.join(buffered)
+            buffered = []
+            size = 0
+    if buffered:
+        yield ''.join(buffered)
+
+
+class SpooledFeed(object):
+    """
+    Write once, read many times feed body: file-like for the upload, with its size and Content-MD5.
+    """
+
+    def __init__(self, max_size=SPOOL_MAX_SIZE):
+        """
+        :param max_size: Bytes kept in memory before moving to a temporary file.
+        """
+        self.max_size = max_size
+        self.file = tempfile.SpooledTemporaryFile(max_size)
+        self.size = 0
+        self._md5 = hashlib.md5()
+
+    @classmethod
+    def from_chunks(cls, chunks, max_size=SPOOL_MAX_SIZE):
+        """
+        Spool an iterable of byte strings, unicode chunks are encoded to utf-8.
+        """
+        feed = cls(max_size)
+        for chunk in chunks:
+            feed.write(chunk)
+        feed.seek(0)
+        return feed
+
+    def write(self, data):
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
+        self._md5.update(data)
+        self.size += len(data)
+        self.file.write(data)
+
+    @property
+    def md5(self):
+        """
+        Base64 encoded MD5 of everything written, the value of the Content-MD5 header.
+        """
+        return base64.b64encode(self._md5.digest())
+
+    @property
+    def spooled(self):
+        """
+        Whether the feed moved to a temporary file.
+        """
+        # SpooledTemporaryFile rolls over once a write takes it past `max_size`, 0 keeps it in memory.
+        return bool(self.max_size) and self.size > self.max_size
+
+    def read(self, size=-1):
+        return self.file.read(size)
+
+    def seek(self, offset, whence=0):
+        self.file.seek(offset, whence)
+
+    def tell(self):
+        return self.file.tell()
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """
+        Iterate the feed in chunks from its start.
+        """
+        self.seek(0)
+        return iter(lambda: self.read(CHUNK_SIZE), '')
+
+    def getvalue(self):
+        """
+        Return the whole feed as a string.
+        """
+        self.seek(0)
+        return self.read()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+Client side throttling of MWS operations.
+
+Amazon throttles every operation with a maximum request quota (the burst) and a restore rate.
+`RequestScheduler` keeps a token bucket per (seller, Action) mirroring those quotas and delays
+calls which would otherwise be rejected with `RequestThrottled`, so callers run at the maximum
+sustainable rate.
+
+Some operations (ie. ListOrders) also have an hourly quota which amazon reports in the
+x-mws-quota-* response headers. The scheduler is fed those as `QuotaState` and spreads the
+remaining calls over the rest of the hour once the quota runs low.
+"""
+import time
+import calendar
+import logging
+import threading
+
+from dateutil import parser
+
+# Action: (maximum request quota, seconds to restore one request).
+# See the "Throttling" section of each operation in the MWS api reference.
+THROTTLE_QUOTAS = {
+    # Feeds
+    'SubmitFeed': (15, 120),
+    'GetFeedSubmissionList': (10, 45),
+    'GetFeedSubmissionListByNextToken': (30, 2),
+    'GetFeedSubmissionCount': (10, 45),
+    'CancelFeedSubmissions': (10, 45),
+    'GetFeedSubmissionResult': (15, 60),
+    # Reports
+    'RequestReport': (15, 60),
+    'GetReportRequestList': (10, 45),
+    'GetReportRequestListByNextToken': (30, 2),
+    'GetReportRequestCount': (10, 45),
+    'GetReportList': (10, 60),
+    'GetReportListByNextToken': (30, 2),
+    'GetReportCount': (10, 45),
+    'GetReport': (15, 60),
+    'GetReportScheduleList': (10, 45),
+    'GetReportScheduleCount': (10, 45),
+    'UpdateReportAcknowledgements': (10, 45),
+    # Orders
+    'ListOrders': (6, 60),
+    'GetOrder': (6, 60),
+    'ListOrderItems': (30, 2),
+    # Products
+    'ListMatchingProducts': (20, 5),
+    'GetMatchingProduct': (20, 0.5),
+    'GetMatchingProductForId': (20, 0.2),
+    'GetCompetitivePricingForSKU': (20, 0.1),
+    'GetCompetitivePricingForASIN': (20, 0.1),
+    'GetLowestOfferListingsForSKU': (20, 0.1),
+    'GetLowestOfferListingsForASIN': (20, 0.1),
+    'GetLowestPricedOffersForSKU': (10, 0.2),
+    'GetLowestPricedOffersForASIN': (10, 0.2),
+    'GetMyFeesEstimate': (20, 0.1),
+    'GetMyPriceForSKU': (20, 0.1),
+    'GetMyPriceForASIN': (20, 0.1),
+    'GetProductCategoriesForSKU': (20, 5),
+    'GetProductCategoriesForASIN': (20, 5),
+    # Sellers
+    'ListMarketplaceParticipations': (15, 60),
+    # Fulfillment Inbound Shipment
+    'ListInboundShipments': (30, 0.5),
+    'ListInboundShipmentItems': (30, 0.5),
+    'GetPrepInstructionsForASIN': (30, 0.5),
+    # Fulfillment Inventory
+    'ListInventorySupply': (30, 0.5),
+    # Recommendations
+    'GetLastUpdatedTimeForRecommendations': (5, 2),
+    'ListRecommendations': (5, 2),
+}
+
+# Operations which draw from the quota of another operation.
+SHARED_QUOTAS = {
+    'ListOrdersByNextToken': 'ListOrders',
+    'ListOrderItemsByNextToken': 'ListOrderItems',
+    'ListMarketplaceParticipationsByNextToken': 'ListMarketplaceParticipations',
+    'ListInboundShipmentsByNextToken': 'ListInboundShipments',
+    'ListInboundShipmentItemsByNextToken': 'ListInboundShipmentItems',
+    'ListInventorySupplyByNextToken': 'ListInventorySupply',
+    'ListRecommendationsByNextToken': 'ListRecommendations',
+}
+
+
+class QuotaState(object):
+    """
+    Hourly request quota as reported by the x-mws-quota-max, x-mws-quota-remaining and
+    x-mws-quota-resetsOn response headers.
+    """
+
+    def __init__(self, max, remaining, resets_on):
+        """
+        :param max: Number of requests allowed in the quota period.
+        :param remaining: Number of requests left in the current period.
+        :param resets_on: Timezone aware datetime of when the period ends.
+        """
+        self.max = max
+        self.remaining = remaining
+        self.resets_on = resets_on
+
+    @classmethod
+    def from_headers(cls, headers):
+        """
+        Parse the quota headers of a response.
+
+        :param headers: Case insensitive response headers.
+        :return: QuotaState or None if the operation isn't quota limited.
+        """
+        if 'x-mws-quota-remaining' not in headers:
+            return
+        try:
+            resets_on = headers.get('x-mws-quota-resetsOn')
+            return cls(int(float(headers.get('x-mws-quota-max', 0))),
+                       int(float(headers['x-mws-quota-remaining'])),
+                       parser.parse(resets_on) if resets_on else None)
+        except ValueError:
+            return
+
+    @property
+    def resets_at(self):
+        """
+        Unix timestamp of `resets_on`.
+        """
+        if self.resets_on is None:
+            return
+        return calendar.timegm(self.resets_on.utctimetuple())
+
+    def __repr__(self):
+        return '<QuotaState max=%s remaining=%s resets_on=%s>' % (self.max, self.remaining, self.resets_on)
+
+
+class TokenBucket(object):
+    """
+    Token bucket holding up to `capacity` requests and restoring one every `restore_seconds`.
+
+    Tokens are reserved rather than waited for, so concurrent callers queue up in the order they
+    called `reserve` and each one sleeps exactly as long as needed.
+    """
+
+    def __init__(self, capacity, restore_seconds, clock=time.time):
+        self.capacity = capacity
+        self.restore_seconds = restore_seconds
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(float(self.capacity), self.tokens + elapsed / self.restore_seconds)
+        self.updated = now
+
+    def reserve(self):
+        """
+        Take a token from the bucket.
+
+        :return: Number of seconds the caller has to wait before the reserved token can be used.
+        """
+        with self._lock:
+            self._refill(self.clock())
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens * self.restore_seconds
+
+    def drain(self):
+        """
+        Empty the bucket. Used when Amazon reports the quota as exhausted even though we thought otherwise.
+        :return:
+        """
+        with self._lock:
+            self._refill(self.clock())
+            self.tokens = min(self.tokens, 0.0)
+
+
+class RequestScheduler(object):
+    """
+    Delays calls so that each (seller, Action) pair stays within its MWS throttling quota.
+
+    Actions which aren't in `quotas` (or `shared_quotas`) are never delayed.
+    Pass `RequestScheduler(quotas={})` to an api class to disable throttling altogether.
+    """
+
+    def __init__(self, quotas=None, shared_quotas=None, clock=time.time, sleep=time.sleep, pace_below=0.5):
+        """
+        :param quotas: Action: (maximum request quota, seconds to restore one request). Defaults to THROTTLE_QUOTAS.
+        :param shared_quotas: Action: Action whose quota it draws from. Defaults to SHARED_QUOTAS.
+        :param pace_below: Fraction of an hourly quota under which the remaining calls are spread evenly
+            until the quota resets.
+        """
+        self.quotas = THROTTLE_QUOTAS if quotas is None else quotas
+        self.shared_quotas = SHARED_QUOTAS if shared_quotas is None else shared_quotas
+        self.clock = clock
+        self.sleep = sleep
+        self.pace_below = pace_below
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._buckets = {}
+        # (seller, action): [QuotaState, time of the last paced call]
+        self._hourly = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, seller, action):
+        """
+        Return the token bucket of `action` for `seller`, or None if the action isn't throttled.
+        """
+        action = self.shared_quotas.get(action, action)
+        if action not in self.quotas:
+            return
+        key = (seller, action)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    capacity, restore_seconds = self.quotas[action]
+                    bucket = self._buckets[key] = TokenBucket(capacity, restore_seconds, self.clock)
+        return bucket
+
+    def update_quota(self, seller, action, quota):
+        """
+        Record the hourly quota amazon reported for the last call of `action`.
+
+        :param quota: QuotaState parsed from the response headers.
+        """
+        key = (seller, self.shared_quotas.get(action, action))
+        # Copied since the scheduler counts calls down locally.
+        quota = QuotaState(quota.max, quota.remaining, quota.resets_on)
+        with self._lock:
+            state = self._hourly.get(key)
+            if state is None:
+                self._hourly[key] = [quota, None]
+            else:
+                state[0] = quota
+
+    def quota(self, seller, action):
+        """
+        Return the last known QuotaState of `action` for `seller`, if any.
+        """
+        state = self._hourly.get((seller, self.shared_quotas.get(action, action)))
+        if state is not None:
+            return state[0]
+
+    def _hourly_delay(self, seller, action):
+        """
+        Reserve a call against the hourly quota and return how long to wait for it.
+
+        Once the remaining quota drops under `pace_below` the calls are spaced evenly until the reset,
+        and when nothing remains the caller waits for the reset.
+        """
+        key = (seller, self.shared_quotas.get(action, action))
+        with self._lock:
+            state = self._hourly.get(key)
+            if state is None or state[0].resets_at is None:
+                return 0.0
+            quota, last_call = state
+            now = self.clock()
+            until_reset = quota.resets_at - now
+            if until_reset <= 0:
+                # The period is over, wait for the next response to tell us the new state.
+                del self._hourly[key]
+                return 0.0
+            if quota.remaining <= 0:
+                delay = until_reset
+            elif quota.remaining < quota.max * self.pace_below:
+                interval = until_reset / quota.remaining
+                delay = max(0.0, (last_call or 0) + interval - now)
+            else:
+                delay = 0.0
+            # Count the call locally so concurrent callers don't all see the same remaining quota.
+            quota.remaining -= 1
+            state[1] = now + delay
+            return delay
+
+    def acquire(self, seller, action):
+        """
+        Block until `seller` may call `action`.
+
+        :return: Number of seconds spent waiting.
+        """
+        delay = self._hourly_delay(seller, action)
+        bucket = self.bucket(seller, action)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        if delay > 0:
+            self.logger.debug('throttling %s for seller=%s, waiting %.2fs' % (action, seller, delay))
+            self.sleep(delay)
+        return delay
+
+    def throttled(self, seller, action):
+        """
+        Tell the scheduler amazon rejected a call with `RequestThrottled`, so the next ones wait for the quota to restore.
+        """
+        bucket = self.bucket(seller, action)
+        if bucket is not None:
+            bucket.drain()
+
+
+# Scheduler shared by every api instance which isn't given its own.
+default_scheduler = RequestScheduler()
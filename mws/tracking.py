@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+"""
+Track the processing of many report requests and feed submissions with batched, adaptive status polls.
+
+Instead of one status call per request every minute, a tracker asks for the status of all of its
+pending requests at once (up to `MAX_IDS_PER_REQUEST` ids per call) and polls on a `PollSchedule`:
+often at first, backing off while nothing changes. Each `TrackedRequest` resolves as soon as a poll
+sees it in a final status.
+
+usage:
+
+>>> tracker = ReportTracker(Reports('access_key', 'secret_key', 'account_id'))
+>>> handles = [tracker.track(api.request_report(x)) for x in report_types]
+>>> tracker.wait()
+>>> for handle in handles:
+>>>     print handle.id, handle.status, handle.report_id
+
+>>> tracker = FeedTracker(Feeds('access_key', 'secret_key', 'account_id')).start()
+>>> handle = tracker.submit(feed)
+>>> handle.add_done_callback(on_processed)
+"""
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+__all__ = [
+    'PollSchedule',
+    'TrackedRequest',
+    'BatchTracker',
+    'TrackedReport',
+    'ReportTracker',
+    'TrackedFeed',
+    'FeedJob',
+    'FeedTracker',
+]
+
+# ReportRequestIdList and FeedSubmissionIdList take at most 100 ids.
+MAX_IDS_PER_REQUEST = 100
+
+
+class PollSchedule(object):
+    """
+    Intervals between status polls: `initial` seconds after a change, multiplied by `factor` after every
+    poll which changed nothing, up to `maximum`.
+    """
+
+    def __init__(self, initial=5, maximum=120, factor=1.5):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.interval = initial
+
+    def reset(self):
+        self.interval = self.initial
+
+    def next_interval(self):
+        """
+        Return the seconds to wait before the next poll and back off for the one after.
+        """
+        interval = self.interval
+        self.interval = min(self.interval * self.factor, self.maximum)
+        return interval
+
+
+class TrackedRequest(object):
+    """
+    Handle of a request followed by a tracker, resolved once its processing status is final.
+    """
+
+    def __init__(self, id):
+        self.id = id
+        # Last processing status seen, None before the first poll.
+        self.status = None
+        # Last status element seen, ie. a `ReportRequestInfo`.
+        self.info = None
+        self._done = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Block until the request is resolved by its tracker's polls, see `BatchTracker.wait`.
+
+        :return: True if it's resolved, False if `timeout` seconds passed first.
+        """
+        return self._done.wait(timeout)
+
+    def add_done_callback(self, callback):
+        """
+        Call `callback(handle)` once the request is resolved, right away if it already is.
+        """
+        with self._lock:
+            if not self.done():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _update(self, status, info):
+        self.status = status
+        self.info = info
+
+    def _resolve(self, status, info):
+        with self._lock:
+            self._update(status, info)
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def __repr__(self):
+        return '<%s %s %s>' % (self.__class__.__name__, self.id, self.status)
+
+
+class BatchTracker(object):
+    """
+    Base class of the trackers: subclasses set `FINAL_STATUSES` and implement `request_statuses`.
+    """
+    FINAL_STATUSES = ()
+    handle_class = TrackedRequest
+
+    def __init__(self, api, schedule=None, batch_size=MAX_IDS_PER_REQUEST):
+        """
+        :param api: Api instance making the status calls.
+        :param schedule: PollSchedule, its defaults otherwise.
+        :param batch_size: Maximum number of ids per status call.
+        """
+        self.api = api
+        self.schedule = schedule or PollSchedule()
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(self.__class__.__name__)
+        # id: handle, in the order they were tracked.
+        self._handles = OrderedDict()
+        self._lock = threading.Lock()
+        # Background polling, see `start`.
+        self._thread = None
+        self._stopped = threading.Event()
+        self._tracked = threading.Event()
+
+    def track(self, id):
+        """
+        Start tracking a request.
+
+        :param id: Id of the request, or a response/parser of the call which created it, see `request_id`.
+        :return: Its handle, the same one if it's already tracked.
+        """
+        id = self.request_id(id)
+        with self._lock:
+            handle = self._handles.get(id)
+            if handle is None:
+                handle = self._handles[id] = self.handle_class(id)
+                self._tracked.set()
+        return handle
+
+    def request_id(self, value):
+        """
+        Return the id of a request from whatever `track` was given.
+        """
+        return value
+
+    def pending(self):
+        """
+        Return the handles of the unresolved requests.
+        """
+        with self._lock:
+            return [x for x in self._handles.values() if not x.done()]
+
+    def request_statuses(self, ids):
+        """
+        Request the status of `ids` in one call.
+
+        :return: Iterable of (id, processing status, status element).
+        """
+        raise NotImplementedError
+
+    def poll(self):
+        """
+        Request the status of every pending request, `batch_size` ids per call, and resolve the finished ones.
+
+        :return: Whether any status changed.
+        """
+        pending = dict((x.id, x) for x in self.pending())
+        ids = pending.keys()
+        changed = False
+        for i in xrange(0, len(ids), self.batch_size):
+            for id, status, info in self.request_statuses(ids[i:i + self.batch_size]):
+                handle = pending.get(id)
+                if handle is None:
+                    continue
+                if status != handle.status:
+                    changed = True
+                    self.logger.debug('%s %s', id, status)
+                if status in self.FINAL_STATUSES:
+                    handle._resolve(status, info)
+                else:
+                    handle._update(status, info)
+        return changed
+
+    def wait(self, handles=None, timeout=None):
+        """
+        Poll until the given requests are resolved, or wait for the background polls if the tracker is started.
+
+        The first poll happens after the first interval of the schedule, requests take a while to be processed.
+        :param handles: Handles to wait for, every tracked request by default.
+        :param timeout: Give up after this many seconds.
+        :return: True if they are all resolved, False if `timeout` passed first.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        if self._thread is not None:
+            for handle in handles or self.pending():
+                if not handle.wait(None if deadline is None else max(deadline - time.time(), 0)):
+                    return False
+            return True
+        self.schedule.reset()
+        while True:
+            waiting = [x for x in (handles or self.pending()) if not x.done()]
+            if not waiting:
+                return True
+            interval = self.schedule.next_interval()
+            if deadline is not None:
+                if time.time() >= deadline:
+                    return False
+                interval = min(interval, max(deadline - time.time(), 0))
+            time.sleep(interval)
+            if self.poll():
+                self.schedule.reset()
+
+    def start(self):
+        """
+        Poll in a background thread until `stop`, so that handles resolve (and run their callbacks) on their own.
+
+        The thread sleeps while nothing is pending and restarts from the shortest interval once new requests are
+        tracked.
+        """
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name=self.__class__.__name__)
+            self._thread.daemon = True
+            self._thread.start()
+        return self
+
+    def stop(self, wait=True):
+        """
+        Stop the background polls, resolved or not.
+        """
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopped.set()
+            self._tracked.set()
+            if wait:
+                thread.join()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            if not self.pending():
+                self._tracked.wait()
+                self._tracked.clear()
+                self.schedule.reset()
+                continue
+            if self._stopped.wait(self.schedule.next_interval()):
+                return
+            try:
+                changed = self.poll()
+            except Exception:
+                # Ie. an error response, the requests are polled again after the next interval.
+                self.logger.exception('Status poll failed')
+                continue
+            if changed:
+                self.schedule.reset()
+
+
+class TrackedReport(TrackedRequest):
+
+    @property
+    def report_id(self):
+        """
+        Id of the generated report, None until it's _DONE_.
+        """
+        if self.info is not None:
+            return self.info.generated_report_id
+
+
+class ReportTracker(BatchTracker):
+    """
+    Tracks report requests with batched `GetReportRequestList` calls.
+
+    Handles are `TrackedReport`s, resolved with the `ReportRequestInfo` of the request in `info`.
+    """
+    FINAL_STATUSES = ('_DONE_', '_CANCELLED_', '_DONE_NO_DATA_')
+    handle_class = TrackedReport
+
+    def request_id(self, value):
+        """
+        Accept a ReportRequestId, a `RequestReportResponse` or the response of `Reports.request_report`.
+        """
+        if isinstance(value, basestring):
+            return value
+        if not hasattr(value, 'report_request_id'):
+            from parsers.reports.requestreport import RequestReportResponse
+            value = RequestReportResponse.from_response(value)
+        return value.report_request_id
+
+    def request_statuses(self, ids):
+        from parsers.reports.requestreport import GetReportRequestList
+        # MaxCount defaults to 10 results.
+        response = self.api.get_report_request_list(requestids=ids, max_count=len(ids))
+        for info in GetReportRequestList.from_response(response).get_report_request_list:
+            yield info.report_request_id, info.report_processing_status, info
+
+
+class TrackedFeed(TrackedRequest):
+
+    @property
+    def feed_type(self):
+        if self.info is not None:
+            return self.info.feed_type
+
+
+class FeedJob(object):
+    """
+    Logical feed submitted as several shards, see `FeedTracker.submit_shards`.
+
+    Its `status` is _IN_PROGRESS_ until every shard is submitted and processed, then _DONE_ if all of them
+    are, _CANCELLED_ if any was cancelled or failed to be submitted (see `error`).
+    """
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+        # TrackedFeed of every shard submitted so far, in order.
+        self.handles = []
+        # Exception which stopped the submission of the shards.
+        self.error = None
+        self._submitted = threading.Event()
+        self._done = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def feed_submission_ids(self):
+        return [x.id for x in self.handles]
+
+    def statuses(self):
+        """
+        Return the number of shards in each processing status, ie. {'_DONE_': 3, '_IN_PROGRESS_': 1}.
+        """
+        counts = {}
+        for handle in list(self.handles):
+            counts[handle.status] = counts.get(handle.status, 0) + 1
+        return counts
+
+    @property
+    def status(self):
+        if not self.done():
+            return '_IN_PROGRESS_'
+        if self.error is None and all(x.status == '_DONE_' for x in self.handles):
+            return '_DONE_'
+        return '_CANCELLED_'
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        Block until every shard is submitted and processed, polling through the tracker unless it's started.
+
+        :return: True if the job is done, False if `timeout` seconds passed first.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        if not self._submitted.wait(timeout):
+            return False
+        if self.handles and not self.tracker.wait(self.handles, None if deadline is None else
+                                                  max(deadline - time.time(), 0)):
+            return False
+        return self._done.wait(None if deadline is None else max(deadline - time.time(), 0))
+
+    def add_done_callback(self, callback):
+        """
+        Call `callback(job)` once the job is done, right away if it already is.
+        """
+        with self._lock:
+            if not self.done():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _add(self, handle):
+        self.handles.append(handle)
+        handle.add_done_callback(self._shard_done)
+
+    def _submitted_all(self):
+        self._submitted.set()
+        self._shard_done(None)
+
+    def _shard_done(self, handle):
+        with self._lock:
+            if self.done() or not self._submitted.is_set() or not all(x.done() for x in self.handles):
+                return
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def __repr__(self):
+        return '<FeedJob %d shards %s>' % (len(self.handles), self.status)
+
+
+class FeedTracker(BatchTracker):
+    """
+    Tracks feed submissions with batched `GetFeedSubmissionList` calls.
+
+    Handles are `TrackedFeed`s, resolved with the `FeedSubmissionInfo` of the submission in `info`.
+    """
+    FINAL_STATUSES = ('_DONE_', '_CANCELLED_')
+    handle_class = TrackedFeed
+
+    def request_id(self, value):
+        """
+        Accept a FeedSubmissionId, a `SubmitFeedResponse` or the response of `Feeds.submit_feed`.
+        """
+        if isinstance(value, basestring):
+            return value
+        if not hasattr(value, 'feed_submission_id'):
+            from parsers.feeds.submitfeedresponse import SubmitFeedResponse
+            value = SubmitFeedResponse.from_response(value)
+        return value.feed_submission_id
+
+    def submit(self, feed):
+        """
+        Submit a `mws.generators.feeds.BaseFeed` with the tracker's api and track it, without waiting for it to be
+        processed.
+
+        :return: Its handle.
+        """
+        return self.track(self._submit(feed, feed.spool()))
+
+    def _submit(self, feed, body):
+        # The tracker's api rather than `BaseFeed.submit`, so that its scheduler, sessions and retry policy apply.
+        with body:
+            return self.api.submit_feed(body, feed.enumeration_value, feed.marketplace_ids, feed.content_type,
+                                        feed._purge_and_replace)
+
+    def submit_shards(self, feed, **limits):
+        """
+        Cut a `mws.generators.feeds.BaseFeed` into shards (see `BaseFeed.shards`) and submit them from a background
+        thread, one shard spooled at a time. The submissions go through the tracker's api, whose `RequestScheduler`
+        keeps them within the SubmitFeed throttle.
+
+        :param limits: `max_bytes` and `max_messages` of the shards.
+        :return: FeedJob tracking the shards as a whole, returned right away.
+        """
+        job = FeedJob(self)
+
+        def submit():
+            try:
+                for shard in feed.shards(**limits):
+                    job._add(self.track(self._submit(feed, shard)))
+            except Exception as e:
+                self.logger.exception('Submitting the shards of %s failed', feed.enumeration_value)
+                job.error = e
+            finally:
+                job._submitted_all()
+
+        thread = threading.Thread(target=submit, name='%s.submit_shards' % self.__class__.__name__)
+        thread.daemon = True
+        thread.start()
+        return job
+
+    def request_statuses(self, ids):
+        from parsers.feeds.submitfeedresponse import GetFeedSubmissionListResponse
+        response = self.api.get_feed_submission_list(feedids=ids, max_count=len(ids))
+        for info in GetFeedSubmissionListResponse.from_response(response).feed_submission_info_list():
+            yield info.feed_submission_id, info.feed_processing_status, info
@@ -9,6 +9,16 @@ Borrowed from https://github.com/timotheus/ebaysdk-python
 
 import xml.etree.ElementTree as ET
 import re
+import datetime
+
+from dateutil import parser as dateutil_parser, tz
+from lxml import etree
+
+NAMESPACE_RE = re.compile("\{(.*)\}(.*)")
+
+# The timestamp formats amazon emits: 2016-09-13T22:21:47Z, 2016-09-13T22:21:47.000Z, 2016-09-13T22:21:47+00:00
+# and the same without the timezone part.
+ISO8601_RE = re.compile(r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6})\d*)?(?:(Z)|([+-])(\d\d):?(\d\d))?$')
 
 
 class object_dict(dict):
@@ -32,7 +42,7 @@ class object_dict(dict):
 
     def __getattr__(self, item):
 
-        d = self.__getitem__(item)
+        d = dict.__getitem__(self, item)
 
         if isinstance(d, dict) and 'value' in d and len(d) == 1:
             return d['value']
@@ -44,7 +54,7 @@ class object_dict(dict):
         return False
 
     def __setattr__(self, item, value):
-        self.__setitem__(item, value)
+        dict.__setitem__(self, item, value)
 
     def getvalue(self, item, value=None):
         return self.get(item, {}).get('value', value)
@@ -52,8 +62,12 @@ class object_dict(dict):
 
 class xml2dict(object):
 
-    def __init__(self):
-        pass
+    def __init__(self, strip_namespaces=False):
+        """
+        :param strip_namespaces: Drop the namespace of every tag and attribute instead of
+            storing it under the `namespace` key.
+        """
+        self.strip_namespaces = strip_namespaces
 
     def _parse_node(self, node):
         node_tree = object_dict()
@@ -64,7 +78,10 @@ class xml2dict(object):
             k, v = self._namespace_split(k, object_dict({'value':v}))
             node_tree[k] = v
         #Save childrens
-        for child in node.getchildren():
+        for child in node:
+            if not isinstance(child.tag, basestring):
+                # lxml comments and processing instructions
+                continue
             tag, tree = self._namespace_split(child.tag,
                                               self._parse_node(child))
             if tag not in node_tree:  # the first time, so store it in dict
@@ -84,9 +101,12 @@ class xml2dict(object):
         ns = http://cs.sfsu.edu/csc867/myscheduler
         name = patients
         """
-        result = re.compile("\{(.*)\}(.*)").search(tag)
+        result = NAMESPACE_RE.search(tag)
         if result:
-            value.namespace, tag = result.groups()
+            if self.strip_namespaces:
+                tag = result.group(2)
+            else:
+                value.namespace, tag = result.groups()
 
         return (tag, value)
 
@@ -95,8 +115,166 @@ class xml2dict(object):
         f = open(file, 'r')
         return self.fromstring(f.read())
 
+    def fromtree(self, t):
+        """parse an already parsed (lxml or ElementTree) element"""
+        root_tag, root_tree = self._namespace_split(t.tag, self._parse_node(t))
+        return object_dict({root_tag: root_tree})
+
     def fromstring(self, s):
         """parse a string"""
         t = ET.fromstring(s)
         root_tag, root_tree = self._namespace_split(t.tag, self._parse_node(t))
         return object_dict({root_tag: root_tree})
+
+
+_new_object_dict = dict.__new__
+
+
+class lxml2dict(object):
+    """
+    Iterative, lxml based replacement of `xml2dict` producing the same `object_dict` structure.
+
+    Namespaces are split off once per distinct tag instead of running a regex for every element,
+    and the tree is walked with an explicit stack so deep documents don't recurse.
+    """
+
+    def __init__(self, strip_namespaces=True):
+        """
+        :param strip_namespaces: Drop the namespace of every tag and attribute instead of
+            storing it under the `namespace` key like `xml2dict` does.
+        """
+        self.strip_namespaces = strip_namespaces
+        # tag: (namespace, local name)
+        self._tags = {}
+
+    def _split(self, tag):
+        try:
+            return self._tags[tag]
+        except KeyError:
+            if tag[:1] == '{':
+                namespace, name = tag[1:].split('}', 1)
+            else:
+                namespace, name = None, tag
+            self._tags[tag] = namespace, name
+            return namespace, name
+
+    def _new_node(self, node):
+        # object_dict.__init__ is skipped, it only matters when copying from an initial dict.
+        node_tree = _new_object_dict(object_dict)
+        # Save attrs and text, hope there will not be a child with same name
+        text = node.text
+        if text:
+            dict.__setitem__(node_tree, 'value', text)
+        for k, v in node.items():
+            namespace, k = self._split(k)
+            attr = _new_object_dict(object_dict)
+            dict.__setitem__(attr, 'value', v)
+            if namespace is not None and not self.strip_namespaces:
+                dict.__setitem__(attr, 'namespace', namespace)
+            dict.__setitem__(node_tree, k, attr)
+        return node_tree
+
+    def _parse_node(self, root):
+        strip_namespaces = self.strip_namespaces
+        split = self._split
+        new_node = self._new_node
+        setitem = dict.__setitem__
+        root_tree = new_node(root)
+        stack = [(root, root_tree)]
+        while stack:
+            node, node_tree = stack.pop()
+            for child in node:
+                tag = child.tag
+                if not isinstance(tag, basestring):
+                    # comments and processing instructions
+                    continue
+                namespace, tag = split(tag)
+                tree = new_node(child)
+                if namespace is not None and not strip_namespaces:
+                    setitem(tree, 'namespace', namespace)
+                old = node_tree.get(tag)
+                if old is None:  # the first time, so store it in dict
+                    setitem(node_tree, tag, tree)
+                elif isinstance(old, list):
+                    old.append(tree)
+                else:
+                    # multi times, so change old dict to a list
+                    dict.__delitem__(node_tree, tag)
+                    setitem(node_tree, tag, [old, tree])
+                if len(child):
+                    stack.append((child, tree))
+        return root_tree
+
+    def fromtree(self, t):
+        """parse an already parsed lxml (or ElementTree) element"""
+        namespace, root_tag = self._split(t.tag)
+        root_tree = self._parse_node(t)
+        if namespace is not None and not self.strip_namespaces:
+            dict.__setitem__(root_tree, 'namespace', namespace)
+        return object_dict({root_tag: root_tree})
+
+    def fromstring(self, s):
+        """parse a string"""
+        return self.fromtree(etree.fromstring(s))
+
+    def parse(self, file):
+        """parse a xml file to a dict"""
+        return self.fromtree(etree.parse(file).getroot())
+
+
+# Number of parsed timestamps kept by `parse_timestamp`.
+TIMESTAMP_CACHE_SIZE = 1024
+
+_utc = tz.tzutc()
+# offset in seconds: tzinfo. Like dateutil, a zero offset is UTC.
+_offsets = {0: _utc}
+# Two generations of cached timestamps: lookups hitting the older one promote the entry, and the
+# older one is dropped once the current one is full. That keeps the recently used timestamps
+# around like a LRU without the bookkeeping of one.
+_timestamps = {}
+_old_timestamps = {}
+
+
+def _parse_timestamp(value):
+    match = ISO8601_RE.match(value)
+    if match is None:
+        return dateutil_parser.parse(value)
+    year, month, day, hour, minute, second, fraction, utc, sign, offset_hours, offset_minutes = match.groups()
+    if utc:
+        tzinfo = _utc
+    elif sign:
+        offset = int(offset_hours) * 3600 + int(offset_minutes) * 60
+        if sign == '-':
+            offset = -offset
+        tzinfo = _offsets.get(offset)
+        if tzinfo is None:
+            tzinfo = _offsets[offset] = tz.tzoffset(None, offset)
+    else:
+        tzinfo = None
+    microsecond = int(fraction.ljust(6, '0')) if fraction else 0
+    return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                             microsecond, tzinfo)
+
+
+def parse_timestamp(value):
+    """
+    Parse a timestamp returned by amazon into a datetime.
+
+    The ISO 8601 formats used by MWS are parsed directly and anything else is handed to
+    `dateutil.parser.parse`, so the result is the same as the one of dateutil.
+    Recently parsed timestamps are cached since reports and order lists repeat them a lot.
+    :param value: Timestamp string, ie. 2016-09-13T22:21:47Z
+    :return: datetime, timezone aware when the timestamp has a timezone.
+    """
+    global _timestamps, _old_timestamps
+    try:
+        return _timestamps[value]
+    except KeyError:
+        pass
+    dt = _old_timestamps.get(value)
+    if dt is None:
+        dt = _parse_timestamp(value)
+    if len(_timestamps) >= TIMESTAMP_CACHE_SIZE:
+        _old_timestamps, _timestamps = _timestamps, {}
+    _timestamps[value] = dt
+    return dt
@@ -31,6 +31,7 @@ setup(
     platforms=['OS Independent'],
     license='LICENSE.txt',
     install_requires=REQUIREMENTS,
+    extras_require={'numpy': ['numpy']},
     classifiers=CLASSIFIERS,
     include_package_data=True,
     zip_safe=False